@@ -9,28 +9,49 @@ import webbrowser
 import threading
 import time
 import json
+import re
+import shutil
+import subprocess
 import yaml
-import base64
+import copy
+import functools
+import gzip
+import hashlib
+import platform
+import traceback
+import urllib.request
+try:
+    import orjson
+except ImportError:  # stdlib json fallback when running from source without orjson
+    orjson = None
+from yaml_compat import YamlLoader, YamlDumper
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from playwright.sync_api import sync_playwright, Playwright, Browser, BrowserContext, Page
+from email.utils import formatdate, parsedate_to_datetime
+from http import HTTPStatus
+from typing import Any, Optional
+from urllib.parse import urlsplit
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from sync_engine import SyncEngine
+from snow_jira_sync import SnowJiraSync
 from insights_engine import InsightsEngine
-from feedback_db import FeedbackDB
 from github_feedback import GitHubFeedback, LogCapture
 from version_checker import VersionChecker
 from login_detector import check_login_status
 from csv_importer import JiraCSVImporter
+from multipart_form import parse_multipart
 
-# Extension system imports
-from extensions import get_extension_manager, ExtensionCapability
+# Extension system imports are deferred to the handlers that use them so the
+# server starts (and the UI opens) without loading the extensions/storage packages
 # TODO: Re-enable after migrating to Playwright
 # from extensions.jira import JiraExtension
 # from extensions.github import GitHubExtension
-from extensions.reporting import EnhancedInsightsEngine, ReportGenerator
-from storage import get_data_store, get_config_manager
 
+import atexit
 import logging
+import logging.handlers
+import queue
 
 # Global state
 def get_base_dir():
@@ -57,19 +78,54 @@ def get_data_dir():
 BASE_DIR = get_base_dir()
 DATA_DIR = get_data_dir()
 LOG_FILE = os.path.join(DATA_DIR, 'jira-sync.log')
+CONFIG_PATH = os.path.join(DATA_DIR, 'config.yaml')
+CONFIG_JSON_CACHE_PATH = CONFIG_PATH + '.json'  # Parsed config.yaml as JSON, for fast cold loads
+FEEDBACK_DB_PATH = os.path.join(DATA_DIR, 'feedback.db')
+FRONTEND_LOG_PATH = os.path.join(DATA_DIR, 'frontend.log')
+CSV_MAPPINGS_PATH = os.path.join(DATA_DIR, 'csv_mappings.json')
+PO_DATA_PATH = os.path.join(DATA_DIR, 'po_data.json')
+PO_DATA_DOWNLOAD_PATH = PO_DATA_PATH + '.download'  # Partial URL download, renamed to po_data.json once valid
+# po_data.json is only read back by the app, so it's written compact; set
+# PO_DATA_PRETTY=1 to indent it when inspecting the file by hand
+PO_DATA_PRETTY = bool(os.environ.get('PO_DATA_PRETTY'))
+PLAYWRIGHT_PROFILE_DIR = os.path.join(DATA_DIR, 'playwright_profile')
+PLAYWRIGHT_STATE_PATH = os.path.join(PLAYWRIGHT_PROFILE_DIR, 'state.json')
+DIAGNOSTICS_DIR = os.path.join(DATA_DIR, 'diagnostics')
 
 # Configure logging immediately
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
+# Request threads only enqueue records; a listener thread does the file/console I/O.
+# Records are fully formatted by the QueueHandler, so the listener's handlers
+# just write the message text.
+log_listener = None
+
+def stop_log_listener():
+    """Drain queued log records to disk; call before os._exit, which skips atexit"""
+    global log_listener
+    if log_listener is not None:
+        log_listener.stop()
+        log_listener = None
+
+if not logging.root.handlers:
+    log_queue = queue.Queue(-1)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[logging.handlers.QueueHandler(log_queue)]
+    )
+    log_listener = logging.handlers.QueueListener(
+        log_queue,
         logging.FileHandler(LOG_FILE),
         logging.StreamHandler(sys.stdout)
-    ]
-)
+    )
+    log_listener.start()
+    atexit.register(stop_log_listener)
 
 APP_VERSION = "2.1.13"  # CRITICAL: Fixed PAT persistence + traceback cascade (Issue #45)
 
+# OS/Python lines for feedback reports; fixed for the life of the process
+SYSTEM_INFO = (f"- OS: {platform.system()} {platform.release()}\n"
+               f"- Python: {platform.python_version()}\n")
+
 def safe_print(msg):
     """Print safely even when console is not available (PyInstaller --noconsole)"""
     logging.info(msg) # Log to file as well
@@ -80,27 +136,170 @@ def safe_print(msg):
     except:
         pass
 
-# Playwright browser state (replaces Selenium driver for modern web scraping)
-playwright_instance = None
-browser = None
-context = None
-page = None
-
-sync_engine = None
-sync_thread = None
-is_syncing = False
-insights_engine = None
-feedback_db = FeedbackDB(db_path=os.path.join(DATA_DIR, 'feedback.db'))  # SQLite-based feedback storage
+@dataclass
+class AppState:
+    """Browser and sync state shared by every request handler
+
+    Playwright objects replace the old Selenium driver. Multi-field changes
+    (launching or resetting the browser, claiming a sync run) happen under
+    `lock` so another request never observes a half-built browser session.
+    """
+    playwright_instance: Any = None
+    browser: Any = None
+    context: Any = None
+    page: Any = None
+    sync_engine: Any = None
+    sync_thread: Optional[threading.Thread] = None
+    is_syncing: bool = False
+    insights_engine: Any = None
+    lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
+
+app_state = AppState()
+feedback_db = None  # SQLite-based feedback storage, opened on first use (see get_feedback_db)
 github_feedback = None  # Optional GitHub sync
 log_capture = LogCapture(LOG_FILE)
 version_checker = None  # Version update checker
 browser_opened = False  # Flag to prevent double-opening
+http_session = None  # Shared requests.Session (created on first outbound call)
 
 # Bookmarklet Hub state
 bookmarklet_mode = 'prb-extract'  # Current action mode: prb-extract, jira-scrape, jira-fill
 bookmarklet_last_data = None  # Last data received from bookmarklet
 bookmarklet_pending = None  # Pending workflow context: {prb_number, mode, timestamp, jira_data}
 
+# Static bookmarklet payloads, built once instead of on every request
+BOOKMARKLET_ACTIONS = {
+    'prb-extract': {
+        'name': 'Extract PRB',
+        'description': 'Extract PRB data from ServiceNow',
+        'target': 'ServiceNow Problem Record page'
+    },
+    'jira-scrape': {
+        'name': 'Scrape Jira Issue',
+        'description': 'Extract issue data from Jira',
+        'target': 'Jira Issue page'
+    }
+}
+
+# Universal bookmarklet that fetches action from Waypoint (served pre-encoded)
+BOOKMARKLET_SCRIPT_BYTES = '''javascript:(async function(){
+    const WAYPOINT='http://127.0.0.1:5000';
+    try{
+        /* Get current action from Waypoint */
+        const actionResp=await fetch(WAYPOINT+'/api/bookmarklet/action');
+        if(!actionResp.ok)throw new Error('Waypoint not running');
+        const action=await actionResp.json();
+        
+        let data={mode:action.mode,url:location.href,timestamp:new Date().toISOString()};
+        
+        /* Execute mode-specific extraction */
+        if(action.mode==='prb-extract'){
+            /* ServiceNow PRB extraction */
+            const frame=document.querySelector('iframe[name="gsft_main"]');
+            const doc=frame?frame.contentDocument:document;
+            
+            const getVal=(id)=>{
+                const el=doc.querySelector('#'+id.replace(/\\./g,'\\\\.'));
+                return el?(el.value||el.textContent||'').trim():'';
+            };
+            const getText=(id)=>{
+                const el=doc.querySelector('#'+id.replace(/\\./g,'\\\\.'));
+                return el?(el.textContent||'').trim():'';
+            };
+            
+            /* Try multiple ID patterns for PRB number */
+            const prbNumber=
+                getVal('sys_readonly.problem.number')||
+                getText('problem.number')||
+                getVal('problem.number')||
+                getText('sys_readonly.problem.number')||
+                /* Try from URL if form fields fail */
+                (location.href.match(/PRB\\d+/)?.[0])||'';
+            
+            data.prb={
+                number:prbNumber,
+                short_description:getVal('problem.short_description'),
+                description:getVal('problem.description'),
+                state:getText('sys_display.problem.state'),
+                priority:getText('sys_display.problem.priority'),
+                assigned_to:getText('sys_display.problem.assigned_to'),
+                assignment_group:getText('sys_display.problem.assignment_group'),
+                category:getText('sys_display.problem.category'),
+                opened_at:getVal('sys_readonly.problem.opened_at')||getText('problem.opened_at'),
+                resolved_at:getVal('sys_readonly.problem.resolved_at'),
+                close_notes:getVal('problem.close_notes')
+            };
+            
+            /* Add diagnostic info if PRB number not found */
+            if(!prbNumber){
+                data.prb._debug={
+                    iframe_found:!!frame,
+                    url:location.href,
+                    all_inputs:Array.from(doc.querySelectorAll('input[id*="number"],input[id*="problem"]')).map(e=>e.id).slice(0,10)
+                };
+            }
+            
+            /* Extract related incidents table */
+            data.incidents=[];
+            const table=doc.querySelector('[id*="related_incidents"]')||doc.querySelector('.list2_body');
+            if(table){
+                const rows=table.querySelectorAll('tr');
+                rows.forEach(r=>{
+                    const link=r.querySelector('a[href*="incident.do"]');
+                    if(link){
+                        data.incidents.push({
+                            number:link.textContent.trim(),
+                            short_description:(r.cells[2]||{}).textContent||''
+                        });
+                    }
+                });
+            }
+        }
+        else if(action.mode==='jira-scrape'){
+            /* Jira issue extraction */
+            data.jira={
+                key:document.querySelector('[data-testid="issue.views.issue-base.foundation.breadcrumbs.current-issue.item"]')?.textContent||
+                    location.pathname.match(/[A-Z]+-\\d+/)?.[0]||'',
+                summary:document.querySelector('[data-testid="issue.views.issue-base.foundation.summary.heading"]')?.textContent||
+                    document.querySelector('#summary-val')?.textContent||'',
+                status:document.querySelector('[data-testid="issue.views.issue-base.foundation.status.status-field-wrapper"]')?.textContent||
+                    document.querySelector('#status-val')?.textContent||''
+            };
+        }
+        
+        /* Send data to Waypoint */
+        const resp=await fetch(WAYPOINT+'/api/bookmarklet/data',{
+            method:'POST',
+            headers:{'Content-Type':'application/json'},
+            body:JSON.stringify(data)
+        });
+        const result=await resp.json();
+        
+        if(result.success){
+            let msg='✅ Data sent to Waypoint!\\n\\n';
+            if(data.prb){
+                msg+='PRB: '+(data.prb.number||'(not found)')+'\\n';
+                if(!data.prb.number&&data.prb._debug){
+                    msg+='\\nDEBUG INFO:\\n';
+                    msg+='URL: '+data.prb._debug.url+'\\n';
+                    msg+='IFrame found: '+data.prb._debug.iframe_found+'\\n';
+                    if(data.prb._debug.all_inputs.length>0){
+                        msg+='Found inputs: '+data.prb._debug.all_inputs.join(', ')+'\\n';
+                    }
+                }
+            }else{
+                msg+='Issue: '+(data.jira?.key||'Unknown')+'\\n';
+            }
+            msg+='Mode: '+action.mode;
+            alert(msg);
+        }else{
+            alert('❌ Error: '+result.error);
+        }
+    }catch(e){
+        alert('❌ Waypoint Error\\n\\n'+e.message+'\\n\\nMake sure Waypoint is running on http://127.0.0.1:5000');
+    }
+})();'''.encode('utf-8')
+
 # Extension system globals
 extension_manager = None
 data_store = None
@@ -108,40 +307,721 @@ config_manager = None
 enhanced_insights = None
 report_generator = None
 
+def get_feedback_db():
+    """Return the feedback database, creating it (and its table) on first use"""
+    global feedback_db
+    if feedback_db is None:
+        from feedback_db import FeedbackDB
+        feedback_db = FeedbackDB(db_path=FEEDBACK_DB_PATH)
+    return feedback_db
+
+def preload_browser_modules():
+    """Import Playwright in the background so the first browser click doesn't pay for it"""
+    try:
+        import playwright.sync_api  # noqa: F401
+    except ImportError:
+        pass  # Surfaces as an error when a browser action is actually requested
+
+def get_http_session():
+    """Return the shared requests.Session so repeat calls reuse pooled connections"""
+    global http_session
+    if http_session is None:
+        import requests
+        http_session = requests.Session()
+    return http_session
+
+def json_bytes(obj):
+    """Serialize obj to UTF-8 JSON bytes for an HTTP response body"""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS keeps parity with json.dumps for int-keyed dicts
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode('utf-8')
+
+def json_loads(data):
+    """Parse JSON from bytes/str (orjson when available); raises ValueError if invalid"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# The {'success': False, 'error': ...} envelope up to the message, as json_bytes
+# renders it; _send_error appends the serialized message and closing brace
+ERROR_BODY_PREFIX = b'{"success":false,"error":' if orjson is not None else b'{"success": false, "error": '
+
+def json_file_bytes(obj, indent=True):
+    """Serialize obj to UTF-8 JSON bytes for the data files we keep on disk
+    (indented unless indent is False, for files only the app reads back)"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# Array responses shorter than this go out in one body; chunked framing only
+# pays off once the serialized rows would make a large buffer
+STREAM_MIN_ROWS = 64
+STREAM_CHUNK_SIZE = 64 * 1024
+
+@dataclass
+class JsonArrayResponse:
+    """A JSON object response whose `key` array _send_json writes row by row
+    (chunked), so the whole serialized body never sits in memory at once"""
+    head: dict
+    key: str
+    rows: list
+
+def json_array_response(head, key, rows):
+    """Return head + {key: rows}, streamed by _send_json when rows is a long list"""
+    if isinstance(rows, list) and len(rows) >= STREAM_MIN_ROWS:
+        return JsonArrayResponse(head, key, rows)
+    return {**head, key: rows}
+
+def write_file_atomic(path, data, mode=0o666):
+    """Write bytes to path via a temp file + os.replace, so readers (and a crash
+    mid-write) only ever see the old file or the complete new one"""
+    tmp_path = path + '.tmp'
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+# First window tail_text_file reads back from the end of a file (doubled until
+# it holds enough lines)
+TAIL_WINDOW_SIZE = 128 * 1024
+# The line count reads the whole file; large chunks keep that to a few syscalls
+TAIL_COUNT_CHUNK_SIZE = 1024 * 1024
+
+def tail_text_file(path, count):
+    """Return (total line count, last `count` lines) of a UTF-8 text file
+
+    Only a window at the end of the file is decoded and split; the total is
+    counted over raw chunks, so memory stays flat however large the log has
+    grown (readlines() would hold every line at once).
+    """
+    # Unbuffered: every read below is already one large block, so an 8 KiB
+    # buffer in between would only add a copy
+    with open(path, 'rb', buffering=0) as f:
+        size = f.seek(0, os.SEEK_END)
+        window = TAIL_WINDOW_SIZE
+        while True:
+            start = max(0, size - window)
+            f.seek(start)
+            lines = f.read(size - start).splitlines(keepends=True)
+            if start == 0 or len(lines) > count:
+                break
+            window *= 2
+        # A final line without its newline yet still counts as a line
+        unterminated = bool(lines) and not lines[-1].endswith((b'\n', b'\r'))
+        if start > 0:
+            lines = lines[1:]  # Starts mid-line
+        tail = [line.decode('utf-8', 'replace').replace('\r\n', '\n')
+                for line in (lines[-count:] if count > 0 else [])]
+        
+        f.seek(0)
+        total = sum(chunk.count(b'\n') for chunk in iter(functools.partial(f.read, TAIL_COUNT_CHUNK_SIZE), b''))
+    return total + unterminated, tail
+
+# Parsed config.yaml, keyed by (path, mtime_ns, size) so edits on disk are picked up
+config_cache = {'key': None, 'data': None}
+config_cache_lock = threading.Lock()
+
+def parse_config_file(st):
+    """Parse config.yaml (whose os.stat is st), via the JSON sidecar when possible
+
+    The sidecar records the mtime/size of the config.yaml it was written from
+    and is only trusted while those still match. JSON loads several times
+    faster than YAML, so only the first load after an edit pays for YAML.
+    """
+    source = [st.st_mtime_ns, st.st_size]
+    try:
+        with open(CONFIG_JSON_CACHE_PATH, 'rb') as f:
+            sidecar = json_loads(f.read())
+        if sidecar['source'] == source:
+            return sidecar['config']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # Missing, stale or unreadable: fall back to the YAML
+    
+    with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
+        config = yaml.load(f, Loader=YamlLoader)
+    try:
+        body = json_bytes({'source': source, 'config': config})
+        # Only cache configs JSON round-trips exactly (no dates or non-string keys)
+        if json_loads(body)['config'] == config:
+            write_file_atomic(CONFIG_JSON_CACHE_PATH, body, 0o600)
+    except (OSError, ValueError, TypeError):
+        pass  # The sidecar is only an optimization
+    return config
+
+def load_config():
+    """Return a private copy of the parsed config.yaml, parsing only when it changed
+
+    Raises FileNotFoundError/yaml.YAMLError like opening and parsing the file
+    directly, so callers keep their existing error handling.
+    """
+    st = os.stat(CONFIG_PATH)
+    key = (CONFIG_PATH, st.st_mtime_ns, st.st_size)
+    with config_cache_lock:
+        if config_cache['key'] != key:
+            config_cache['data'] = parse_config_file(st)
+            config_cache['key'] = key
+        # Handlers mutate what they load before saving it back
+        return copy.deepcopy(config_cache['data'])
+
+def load_config_or_empty():
+    """Like load_config(), but a missing or empty config.yaml reads as {}"""
+    try:
+        return load_config() or {}
+    except FileNotFoundError:
+        return {}
+
+def save_config(config):
+    """Atomically write config.yaml and drop the cached parse
+
+    The YAML is rendered in memory and written to a temp file in one call, then
+    swapped in with os.replace, so a crash mid-save can't leave a truncated config.
+    The cache key is cleared explicitly because mtime may not tick on fast writes.
+    Saving a config identical to the one on disk (the UI re-posting unchanged
+    settings) skips the dump and write entirely.
+    """
+    with config_cache_lock:
+        if config_cache['key'] is not None and config_cache['data'] == config:
+            try:
+                st = os.stat(CONFIG_PATH)
+                if config_cache['key'] == (CONFIG_PATH, st.st_mtime_ns, st.st_size):
+                    return
+            except FileNotFoundError:
+                pass
+    
+    data = yaml.dump(config, Dumper=YamlDumper, default_flow_style=False).encode('utf-8')
+    with config_cache_lock:
+        try:
+            write_file_atomic(CONFIG_PATH, data, 0o600)
+        finally:
+            config_cache['key'] = None
+            # The sidecar is keyed on mtime/size too, so drop it as well
+            try:
+                os.remove(CONFIG_JSON_CACHE_PATH)
+            except OSError:
+                pass
+
+# Parsed csv_mappings.json, keyed like config_cache
+csv_mappings_cache = {'key': None, 'data': None}
+csv_mappings_cache_lock = threading.Lock()
+
+def load_csv_mappings():
+    """Return a private copy of the saved CSV mappings ({} if none saved yet),
+    re-reading csv_mappings.json only when it changed on disk"""
+    try:
+        st = os.stat(CSV_MAPPINGS_PATH)
+    except FileNotFoundError:
+        return {}
+    key = (st.st_mtime_ns, st.st_size)
+    with csv_mappings_cache_lock:
+        if csv_mappings_cache['key'] != key:
+            with open(CSV_MAPPINGS_PATH, 'rb') as f:
+                csv_mappings_cache['data'] = json_loads(f.read())
+            csv_mappings_cache['key'] = key
+        return copy.deepcopy(csv_mappings_cache['data'])
+
+def save_csv_mappings(mappings):
+    """Atomically write csv_mappings.json and keep the cache in step with it"""
+    with csv_mappings_cache_lock:
+        write_file_atomic(CSV_MAPPINGS_PATH, json_file_bytes(mappings))
+        st = os.stat(CSV_MAPPINGS_PATH)
+        csv_mappings_cache['data'] = copy.deepcopy(mappings)
+        csv_mappings_cache['key'] = (st.st_mtime_ns, st.st_size)
+
+# Parsed po_data.json, keyed like config_cache; the features view polls it
+po_data_cache = {'key': None, 'data': None}
+po_data_cache_lock = threading.Lock()
+
+def load_po_data():
+    """Return the parsed po_data.json (None if there is none), re-reading it only
+    when it changed on disk. The result is shared: treat it as read-only"""
+    try:
+        st = os.stat(PO_DATA_PATH)
+    except FileNotFoundError:
+        return None
+    key = (st.st_mtime_ns, st.st_size)
+    with po_data_cache_lock:
+        if po_data_cache['key'] != key:
+            # Written as UTF-8 bytes; don't decode with the locale's codepage
+            with open(PO_DATA_PATH, 'rb') as f:
+                po_data_cache['data'] = json_loads(f.read())
+            po_data_cache['key'] = key
+        return po_data_cache['data']
+
+# SnowJiraSync for the current browser page and config. Building one sets up a
+# ServiceNow scraper and Jira automator, so handlers reuse it until either changes
+snow_sync_cache = {'key': None, 'obj': None}
+snow_sync_cache_lock = threading.Lock()
+
+def get_snow_sync(page, config):
+    """Return a SnowJiraSync for page and config, reusing the last one built
+    while the page is the same object and the config is unchanged"""
+    with snow_sync_cache_lock:
+        key = snow_sync_cache['key']
+        if key is None or key[0] is not page or key[1] != config:
+            snow_sync_cache['obj'] = SnowJiraSync(page, config)
+            # Own copy, so later changes to the caller's dict can't mask a change
+            snow_sync_cache['key'] = (page, copy.deepcopy(config))
+        return snow_sync_cache['obj']
+
+# Schemes a ServiceNow URL may start with (str.startswith accepts the tuple)
+_URL_OK = ('http://', 'https://')
+
+def _validate_snow_config(config) -> Optional[str]:
+    """Return the error message for a missing or incomplete ServiceNow
+    configuration, or None if it's usable for SnowJiraSync"""
+    snow_config = (config or {}).get('servicenow')
+    if snow_config is None:
+        return 'ServiceNow not configured. Please add ServiceNow URL in Integrations tab.'
+    url = (snow_config.get('url') or '').strip()
+    if not url:
+        return 'ServiceNow URL not configured. Please enter your ServiceNow URL in Integrations tab.'
+    if not url.startswith(_URL_OK):
+        return f'Invalid ServiceNow URL format: {url}. URL must start with http:// or https://'
+    if not (snow_config.get('jira_project') or '').strip():
+        return 'Jira Project not configured for ServiceNow integration. Please enter a Jira project key.'
+    return None
+
+# User-friendly replacements for raw exception text, found with one
+# case-insensitive scan. Each alternative is a lookahead over the whole
+# message, so the first category listed wins when several keywords appear.
+_SNOW_ERR_RX = re.compile(
+    r'(?=.*?(?P<browser>playwright|page))|(?=.*?(?P<network>connection|network))',
+    re.I | re.S)
+_SNOW_ERR_MAP = {
+    'browser': 'Browser error. Try closing and reopening the browser.',
+    'network': 'Network error. Check your internet connection and ServiceNow URL.',
+}
+_UPDATE_ERR_RX = re.compile(
+    r'(?=.*?(?P<network>connection|network))|(?=.*?(?P<timeout>timeout))',
+    re.I | re.S)
+_UPDATE_ERR_MAP = {
+    'network': 'Cannot connect to GitHub. Check your internet connection.',
+    'timeout': 'GitHub request timed out. Try again later.',
+}
+
+def friendly_error(error_msg, pattern, messages, max_length, ellipsis='...'):
+    """Map an exception message to a friendly one by category, or truncate it"""
+    m = pattern.match(error_msg)
+    if m:
+        return messages[m.lastgroup]
+    if len(error_msg) > max_length:
+        return error_msg[:max_length] + ellipsis
+    return error_msg
+
+def file_etag(st, prefix=''):
+    """Strong ETag for a file from its os.stat (changes whenever it is rewritten)"""
+    return f'"{prefix}{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+# Rendered HTML pages, keyed by path -> ((mtime_ns, size), ETag, body bytes,
+# gzipped body bytes or None until first requested)
+html_page_cache = {}
+html_page_cache_lock = threading.Lock()
+
+def render_html_page(path, gzipped=False):
+    """Return (ETag, body) for the page: its UTF-8 bytes with the app version
+    and cache-busting asset query strings injected, re-rendering only when the
+    file changed
+
+    With gzipped=True the gzip-compressed body (and its own ETag) is returned
+    instead; it is compressed once per rendering rather than on every request.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"HTML file not found at {path}") from None
+    key = (st.st_mtime_ns, st.st_size)
+    with html_page_cache_lock:
+        cached = html_page_cache.get(path)
+        if cached is not None and cached[0] == key:
+            etag = cached[1]
+            if not gzipped:
+                return etag, cached[2]
+            if cached[3] is None:
+                cached = html_page_cache[path] = (key, etag, cached[2], gzip.compress(cached[2], 6))
+            return etag[:-1] + '-gz"', cached[3]
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            html_content = f.read()
+        
+        # Inject version into template
+        html_content = html_content.replace('{{VERSION}}', APP_VERSION)
+        
+        # Inject version query parameters into asset URLs
+        version_param = f"?v={APP_VERSION}"
+        html_content = html_content.replace('/assets/css/modern-ui.css', f'/assets/css/modern-ui.css{version_param}')
+        html_content = html_content.replace('/assets/js/modern-ui-v2.js', f'/assets/js/modern-ui-v2.js{version_param}')
+        html_content = html_content.replace('/assets/js/servicenow-jira.js', f'/assets/js/servicenow-jira.js{version_param}')
+        html_content = html_content.replace('/assets/js/html2canvas.min.js', f'/assets/js/html2canvas.min.js{version_param}')
+        
+        body = html_content.encode('utf-8')
+        # The version is part of the rendered page, so it's part of the ETag
+        etag = file_etag(st, f'{APP_VERSION}-')
+        gz_body = gzip.compress(body, 6) if gzipped else None
+        html_page_cache[path] = (key, etag, body, gz_body)
+        if gzipped:
+            return etag[:-1] + '-gz"', gz_body
+        return etag, body
+
+# Friendly messages for common GitHub failures, in priority order, and one regex
+# that finds every kind present in a single scan of the error text
+GITHUB_ERROR_MESSAGES = {
+    'bad_credentials': 'Invalid GitHub token. Please check your token in Settings tab.',
+    'not_found': 'Repository not found. Please check repository name in Settings (format: owner/repo).',
+    'rate_limit': 'GitHub API rate limit exceeded. Please try again later.',
+    'permission': 'Permission denied. Ensure your token has "repo" or "public_repo" scope.',
+}
+GITHUB_ERROR_RE = re.compile(
+    r'(?P<bad_credentials>Bad credentials)|(?P<not_found>Not Found|404)'
+    r'|(?P<rate_limit>(?i:rate limit))|(?P<permission>(?i:permission|forbidden))'
+)
+
+def explain_github_error(detail):
+    """Return the friendly message for the highest-priority GitHub failure named
+    in detail, or detail itself if it matches none"""
+    found = {match.lastgroup for match in GITHUB_ERROR_RE.finditer(detail)}
+    for kind, message in GITHUB_ERROR_MESSAGES.items():
+        if kind in found:
+            return message
+    return detail
+
+# CORS headers for bookmarklet cross-origin requests
+CORS_HEADERS = (
+    ('Access-Control-Allow-Origin', '*'),
+    ('Access-Control-Allow-Methods', 'GET, POST, OPTIONS'),
+    ('Access-Control-Allow-Headers', 'Content-Type'),
+)
+
+# Each connection gets its own thread and handlers run right on it, so a slow
+# GitHub, Jira or SQLite call only delays its own request. Playwright's sync API
+# has to be driven from the thread that started it, though, so handlers that
+# touch the browser are queued onto this single thread instead.
+browser_thread_state = threading.local()
+
+def _mark_browser_thread():
+    browser_thread_state.active = True
+
+browser_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='browser',
+                                      initializer=_mark_browser_thread)
+
+def call_on_browser_thread(func, *args, **kwargs):
+    """Call func on the single Playwright thread and return its result
+
+    Calls made from that thread already (one browser handler using another)
+    run directly rather than queueing behind themselves.
+    """
+    if getattr(browser_thread_state, 'active', False):
+        return func(*args, **kwargs)
+    return browser_executor.submit(func, *args, **kwargs).result()
+
+def run_on_browser_thread(method):
+    """Decorator: run a SyncHandler method on the single Playwright thread"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        return call_on_browser_thread(method, self, *args, **kwargs)
+    return wrapper
+
+def run_exclusive_sync(sync_engine):
+    """Run sync_engine.sync_once() on the browser thread, unless a sync is
+    already in progress (then return False without running it)
+
+    The slot is checked and claimed without waiting, so "Sync now" clicked
+    during a sync, or a scheduled run overlapping one, is turned away at once.
+    """
+    with app_state.lock:
+        if app_state.is_syncing:
+            return False
+        app_state.is_syncing = True
+    try:
+        call_on_browser_thread(sync_engine.sync_once)
+        return True
+    finally:
+        app_state.is_syncing = False
+
+def run_scheduled_sync(sync_engine):
+    """Scheduler job: an exclusive sync that logs instead of raising"""
+    try:
+        if not run_exclusive_sync(sync_engine):
+            safe_print("[SCHEDULER] Skipping scheduled sync: a sync is already in progress")
+    except Exception as e:
+        logging.error(f"[SCHEDULER] Scheduled sync failed: {e}", exc_info=True)
+
+json_response_heads = {}  # (protocol, status, cors) -> encoded status line + fixed headers
+
+def json_response_head(protocol_version, status, cors=False):
+    """Return the status line and fixed headers of a JSON response as bytes
+
+    Built once per (protocol, status, cors) combination so _send_json only has
+    to append Content-Length and the body.
+    """
+    key = (protocol_version, status, cors)
+    head = json_response_heads.get(key)
+    if head is None:
+        lines = [f"{protocol_version} {status} {HTTPStatus(status).phrase}",
+                 'Content-type: application/json']
+        if cors:
+            lines.extend(f"{name}: {value}" for name, value in CORS_HEADERS)
+        head = ('\r\n'.join(lines) + '\r\n').encode('latin-1')
+        json_response_heads[key] = head
+    return head
+
+def get_page_url():
+    """Return the current Playwright page URL, or None if no page is open.
+
+    page.url is tracked client-side from navigation events, so unlike
+    Selenium's driver.current_url this never round-trips to the browser and
+    is safe to call from the status endpoints the UI polls, on any thread. Likewise
+    browser.is_connected() is a local flag flipped when Chromium exits, so a
+    crashed browser is caught here instead of on the next goto().
+    """
+    if app_state.page is None or app_state.page.is_closed():
+        return None
+    if app_state.browser is not None and not app_state.browser.is_connected():
+        return None
+    try:
+        return app_state.page.url
+    except Exception:
+        return None
+
+def jira_url_logged_in(url):
+    """Basic URL check (Phase 4: proper detection): on a Jira page that isn't login/auth"""
+    url_lower = url.lower()
+    if 'atlassian.net' not in url_lower and 'jira' not in url_lower:
+        return False
+    return '/login' not in url_lower and '/auth' not in url_lower
+
+def same_origin(url, other_url):
+    """True if both URLs have the same scheme and host[:port]"""
+    a, b = urlsplit(url), urlsplit(other_url)
+    return a.scheme.lower() == b.scheme.lower() and a.netloc.lower() == b.netloc.lower()
+
+# Request body limits checked in do_POST before anything is read
+MAX_JSON_BODY = 16 * 1024 * 1024  # JSON API calls
+MAX_UPLOAD_BODY = 256 * 1024 * 1024  # multipart uploads (CSV imports, feedback screenshots/recordings)
+
+# POST /api/extensions/<name>/(config|test)
+EXTENSION_ROUTE_RE = re.compile(r'/api/extensions/([^/]+)/(config|test)')
+
+# Content types for static assets served by _serve_static_file, keyed by extension
+STATIC_CONTENT_TYPES = {
+    '.js': 'application/javascript',
+    '.css': 'text/css',
+    '.html': 'text/html; charset=utf-8',
+    '.json': 'application/json',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.svg': 'image/svg+xml',
+}
+
+# Automation rule fields returned by /api/automation/rules: rule -> ({field: default}, description)
+AUTOMATION_RULE_FIELDS = {
+    'pr_opened': (
+        {'add_comment': False, 'set_status': '', 'add_label': ''},
+        'When a PR is opened, update the linked Jira ticket'
+    ),
+    'pr_updated': (
+        {'add_comment': False, 'set_status': '', 'add_label': ''},
+        'When a PR receives new commits'
+    ),
+    'pr_merged': (
+        {'branch_rules': []},
+        'When a PR is merged (branch-specific rules)'
+    ),
+    'pr_closed': (
+        {'add_comment': False, 'set_status': '', 'add_label': ''},
+        'When a PR is closed without merging'
+    ),
+}
+
+# Values the config template ships with in place of a real GitHub token
+PLACEHOLDER_TOKENS = frozenset({'YOUR_GITHUB_TOKEN_HERE', 'your_token_here', ''})
+
+def is_real_token(token):
+    """True if token is set and isn't one of the template placeholders"""
+    return bool(token) and token not in PLACEHOLDER_TOKENS
+
+def resolve_github_token(cfg):
+    """GitHub token for update checks/downloads: the feedback PAT, falling
+    back to github.api_token; placeholders resolve to None"""
+    for token in (cfg.get('feedback', {}).get('github_token'),
+                  cfg.get('github', {}).get('api_token')):
+        if is_real_token(token):
+            return token
+    return None
+
+def resolve_feedback_repo(cfg, default=('mikejsmith1985', 'jira-automation')):
+    """(owner, repo) parsed from feedback.repo ("owner/repo"), else default"""
+    feedback_repo = cfg.get('feedback', {}).get('repo', '')
+    if feedback_repo and '/' in feedback_repo:
+        owner, repo = feedback_repo.split('/', 1)
+        return owner, repo
+    return default
+
+# Fields handle_save_integrations copies verbatim from the request into each
+# config section (only those present in the request are touched)
+INTEGRATION_FIELDS = {
+    'github': ('api_token', 'base_url', 'organization', 'repositories'),
+    'jira': ('base_url', 'project_keys'),
+    'feedback': ('github_token', 'repo'),
+}
+SECRET_INTEGRATION_FIELDS = {'api_token', 'github_token'}  # logged as <set>/<empty>
+
 class SyncHandler(BaseHTTPRequestHandler):
     """HTTP request handler for the web UI"""
     
+    # Keep-alive: the UI polls several endpoints every few seconds, so let the
+    # browser reuse one connection. Every response must carry Content-Length.
+    protocol_version = 'HTTP/1.1'
+    timeout = 60  # Drop keep-alive connections the browser leaves idle
+    content_length = 0  # Validated request body size, set by do_POST
+    # Buffer wfile so a response's status line, headers and (small) body leave in
+    # one send; handle_one_request flushes it after each request
+    wbufsize = 64 * 1024
+    
     def log_message(self, format, *args):
         """Suppress default logging"""
         pass
     
     def _send_cors_headers(self):
         """Send CORS headers for bookmarklet cross-origin requests"""
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        for name, value in CORS_HEADERS:
+            self.send_header(name, value)
+
+    def _send_text(self, status, text, content_type='text/plain', cors=False):
+        """Send a complete non-JSON response with an explicit Content-Length"""
+        body = text if isinstance(text, bytes) else text.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-type', content_type)
+        if cors:
+            self._send_cors_headers()
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def _send_json(self, obj, status=200, cors=False, etag=None):
+        """Write obj as a complete JSON response in a single socket write"""
+        if isinstance(obj, JsonArrayResponse):
+            if self.request_version == 'HTTP/1.1':
+                self._send_json_array(obj, status, cors)
+                return
+            obj = {**obj.head, obj.key: obj.rows}  # HTTP/1.0 has no chunked encoding
+        self._send_json_body(json_bytes(obj), status, cors, etag)
+    
+    def _send_json_array(self, response, status=200, cors=False):
+        """Stream a JsonArrayResponse with chunked encoding, ~64 KB per chunk"""
+        self.log_request(status)
+        self.wfile.write(json_response_head(self.protocol_version, status, cors)
+                         + b'Transfer-Encoding: chunked\r\n\r\n')
+        
+        def write_chunk(data):
+            self.wfile.write(b'%x\r\n' % len(data) + data + b'\r\n')
+        
+        # The head object's closing brace is replaced by the array
+        head = json_bytes(response.head)[:-1]
+        buf = bytearray(head + (b',' if len(head) > 1 else b'') + json_bytes(response.key) + b':[')
+        for index, row in enumerate(response.rows):
+            if index:
+                buf += b','
+            buf += json_bytes(row)
+            if len(buf) >= STREAM_CHUNK_SIZE:
+                write_chunk(buf)
+                buf.clear()
+        buf += b']}'
+        write_chunk(buf)
+        self.wfile.write(b'0\r\n\r\n')
+    
+    def _send_error(self, status, message, cors=False):
+        """Send the standard {'success': False, 'error': ...} JSON failure response"""
+        # Only the message needs serializing; the envelope is fixed bytes
+        self._send_json_body(ERROR_BODY_PREFIX + json_bytes(str(message)) + b'}', status, cors)
+    
+    def _send_json_body(self, body, status=200, cors=False, etag=None):
+        """Write already-serialized JSON bytes as a complete response"""
+        self.log_request(status)
+        head = json_response_head(self.protocol_version, status, cors)
+        if etag:
+            head += f'ETag: {etag}\r\n'.encode('latin-1')
+        if self.close_connection:
+            # Tells a client still sending an unread body to stop uploading
+            head += b'Connection: close\r\n'
+        self.wfile.write(head + b'Content-Length: %d\r\n\r\n' % len(body) + body)
+    
+    def _etag_matches(self, etag):
+        """True if the client's If-None-Match already names this ETag"""
+        if_none_match = self.headers.get('If-None-Match')
+        if not if_none_match:
+            return False
+        return if_none_match.strip() == '*' or etag in (t.strip() for t in if_none_match.split(','))
+    
+    def _not_modified(self, etag, mtime):
+        """True if the client's cached copy (by If-None-Match, else by
+        If-Modified-Since) is still current for a file with this ETag/mtime"""
+        if self.headers.get('If-None-Match'):
+            return self._etag_matches(etag)
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if not if_modified_since:
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates have whole-second resolution
+        return int(mtime) <= since
+    
+    def _send_not_modified(self, etag):
+        """Answer a conditional GET whose cached copy is still current (no body)"""
+        self.send_response(304)
+        self.send_header('ETag', etag)
+        self.end_headers()
+    
+    def _send_json_with_etag(self, obj):
+        """Send obj with an ETag hashed from its body, or 304 if the client has it"""
+        body = json_bytes(obj)
+        etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        if self._etag_matches(etag):
+            self._send_not_modified(etag)
+            return
+        self._send_json_body(body, etag=etag)
     
     def do_OPTIONS(self):
         """Handle preflight CORS requests from bookmarklet"""
         self.send_response(200)
         self._send_cors_headers()
+        self.send_header('Content-Length', '0')
         self.end_headers()
     
     def do_GET(self):
         """Handle GET requests"""
-        safe_print(f"[GET] {self.path}")
+        # Per-request trace; %-args so nothing is formatted unless DEBUG is enabled
+        logging.debug("[GET] %s", self.path)
         
         if self.path == '/' or self.path == '/index.html':
             self._serve_html_with_cache_busting('modern-ui.html', 'text/html; charset=utf-8')
         elif self.path.startswith('/assets/'):
             # Serve static assets
             # Strip query parameters (e.g. ?v=1.0)
-            clean_path = self.path.split('?')[0]
+            clean_path = self.path.partition('?')[0]
             filepath = clean_path[1:]  # Remove leading slash
             content_type = self._get_content_type(filepath)
             safe_print(f"[STATIC] Serving {filepath} as {content_type}")
             self._serve_static_file(filepath, content_type)
-        elif self.path == '/api/status':
+        else:
+            self._handle_api_get()
+    
+    def _handle_api_get(self):
+        """Dispatch GET API endpoints"""
+        if self.path == '/api/status':
             self._handle_status()
         elif self.path == '/api/config':
             self._handle_get_config()
@@ -162,10 +1042,7 @@ class SyncHandler(BaseHTTPRequestHandler):
         elif self.path == '/api/version/check':
             # Handle update check - returns dict that needs to be sent as JSON
             result = self._handle_check_updates()
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(result).encode())
+            self._send_json(result)
         elif self.path == '/api/version/releases':
             self._handle_list_releases()
         elif self.path == '/api/snow-jira/config':
@@ -179,302 +1056,201 @@ class SyncHandler(BaseHTTPRequestHandler):
         elif self.path == '/api/bookmarklet/status':
             self._handle_bookmarklet_status()
         else:
-            self.send_response(404)
-            self.end_headers()
+            self._send_text(404, 'Not found')
     
     def _serve_static_file(self, filepath, content_type):
         """Serve static files with caching"""
         try:
             # Convert to absolute path
             abs_filepath = os.path.join(BASE_DIR, filepath)
-            safe_print(f"[SERVE] Attempting to serve: {abs_filepath}")
-            
-            # Handle HTML files without cache
-            if filepath.endswith('.html'):
-                with open(abs_filepath, 'rb') as f:
-                    self.send_response(200)
-                    self.send_header('Content-type', content_type)
-                    self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-                    self.send_header('Pragma', 'no-cache')
-                    self.send_header('Expires', '0')
-                    self.end_headers()
-                    self.wfile.write(f.read())
-            else:
-                with open(abs_filepath, 'rb') as f:
-                    self.send_response(200)
-                    self.send_header('Content-type', content_type)
-                    # Aggressive no-cache to prevent stale assets
-                    self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-                    self.send_header('Pragma', 'no-cache')
-                    self.send_header('Expires', '0')
-                    self.end_headers()
-                    self.wfile.write(f.read())
+            logging.debug("[SERVE] Attempting to serve: %s", abs_filepath)
+            
+            with open(abs_filepath, 'rb') as f:
+                st = os.fstat(f.fileno())
+                etag = file_etag(st)
+                if self._not_modified(etag, st.st_mtime):
+                    self._send_not_modified(etag)
+                    return
+                self.send_response(200)
+                self.send_header('Content-type', content_type)
+                self.send_header('Content-Length', str(st.st_size))
+                self.send_header('ETag', etag)
+                self.send_header('Last-Modified', formatdate(st.st_mtime, usegmt=True))
+                # Browsers must revalidate every time, so assets are never stale,
+                # but an unchanged file costs only a 304
+                self.send_header('Cache-Control', 'no-cache')
+                self.send_header('Pragma', 'no-cache')
+                self.send_header('Expires', '0')
+                self.end_headers()
+                self._send_file_body(f)
         except FileNotFoundError:
             safe_print(f"[ERROR] File not found: {abs_filepath}")
             safe_print(f"[DEBUG] BASE_DIR = {BASE_DIR}")
             safe_print(f"[DEBUG] DATA_DIR = {DATA_DIR}")
-            self.send_response(404)
-            self.send_header('Content-type', 'text/plain')
-            self.end_headers()
-            self.wfile.write(f"File not found: {filepath}".encode())
+            self._send_text(404, f"File not found: {filepath}")
         except Exception as e:
             safe_print(f"[ERROR] Failed to serve {filepath}: {str(e)}")
             logging.error(f"Failed to serve {filepath}", exc_info=True)
-            self.send_response(500)
-            self.send_header('Content-type', 'text/plain')
-            self.end_headers()
-            self.wfile.write(f"Server error: {str(e)}".encode())
-    
+            # Headers may already be out, so don't reuse this connection
+            self.close_connection = True
+            self._send_text(500, f"Server error: {str(e)}")
+
+    def _send_file_body(self, f):
+        """Copy an open binary file to the client without reading it into memory"""
+        self.wfile.flush()
+        try:
+            # Zero-copy on platforms with os.sendfile, chunked send() elsewhere
+            self.connection.sendfile(f)
+        except AttributeError:
+            shutil.copyfileobj(f, self.wfile, 64 * 1024)
+
     def _serve_html_with_cache_busting(self, filepath, content_type):
         """Serve HTML with cache-busting query parameters injected"""
         try:
             # CRITICAL: When running as frozen executable, BASE_DIR is sys._MEIPASS (temp dir)
             # This is where PyInstaller extracts bundled files
             abs_filepath = os.path.join(BASE_DIR, filepath)
-            safe_print(f"[SERVE] Serving HTML with cache busting: {abs_filepath}")
-            safe_print(f"[DEBUG] BASE_DIR={BASE_DIR}, frozen={getattr(sys, 'frozen', False)}")
-            safe_print(f"[DEBUG] File exists: {os.path.exists(abs_filepath)}")
-            
-            if not os.path.exists(abs_filepath):
-                raise FileNotFoundError(f"HTML file not found at {abs_filepath}")
-            
-            with open(abs_filepath, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-            
-            # Inject version into template
-            html_content = html_content.replace('{{VERSION}}', APP_VERSION)
-            
-            # Inject version query parameters into asset URLs
-            version_param = f"?v={APP_VERSION}"
-            html_content = html_content.replace('/assets/css/modern-ui.css', f'/assets/css/modern-ui.css{version_param}')
-            html_content = html_content.replace('/assets/js/modern-ui-v2.js', f'/assets/js/modern-ui-v2.js{version_param}')
-            html_content = html_content.replace('/assets/js/servicenow-jira.js', f'/assets/js/servicenow-jira.js{version_param}')
-            html_content = html_content.replace('/assets/js/html2canvas.min.js', f'/assets/js/html2canvas.min.js{version_param}')
-            
+            logging.debug("[SERVE] Serving HTML with cache busting: %s (BASE_DIR=%s, frozen=%s)",
+                          abs_filepath, BASE_DIR, getattr(sys, 'frozen', False))
+            
+            # The UI page is ~50 KB of markup; most browsers take it gzipped
+            gzipped = 'gzip' in self.headers.get('Accept-Encoding', '')
+            etag, body = render_html_page(abs_filepath, gzipped)
+            if self._etag_matches(etag):
+                self._send_not_modified(etag)
+                return
             self.send_response(200)
             self.send_header('Content-type', content_type)
-            self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
+            if gzipped:
+                self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Vary', 'Accept-Encoding')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('ETag', etag)
+            # Always revalidated (never stale), but unchanged pages cost a 304
+            self.send_header('Cache-Control', 'no-cache')
             self.send_header('Pragma', 'no-cache')
             self.send_header('Expires', '0')
             self.end_headers()
-            self.wfile.write(html_content.encode('utf-8'))
+            self.wfile.write(body)
             
         except FileNotFoundError:
             safe_print(f"[ERROR] HTML file not found: {abs_filepath}")
-            self.send_response(404)
-            self.send_header('Content-type', 'text/plain')
-            self.end_headers()
-            self.wfile.write(f"File not found: {filepath}".encode())
+            self._send_text(404, f"File not found: {filepath}")
         except Exception as e:
             safe_print(f"[ERROR] Failed to serve HTML with cache busting: {str(e)}")
             logging.error("Failed to serve HTML with cache busting", exc_info=True)
-            self.send_response(500)
-            self.send_header('Content-type', 'text/plain')
-            self.end_headers()
-            self.wfile.write(f"Server error: {str(e)}".encode())
+            # Headers may already be out, so don't reuse this connection
+            self.close_connection = True
+            self._send_text(500, f"Server error: {str(e)}")
     
     def _get_content_type(self, filepath):
         """Get content type from file extension"""
-        if filepath.endswith('.js'):
-            return 'application/javascript'
-        elif filepath.endswith('.css'):
-            return 'text/css'
-        elif filepath.endswith('.html'):
-            return 'text/html; charset=utf-8'
-        elif filepath.endswith('.json'):
-            return 'application/json'
-        elif filepath.endswith('.png'):
-            return 'image/png'
-        elif filepath.endswith('.jpg') or filepath.endswith('.jpeg'):
-            return 'image/jpeg'
-        elif filepath.endswith('.svg'):
-            return 'image/svg+xml'
-        else:
-            return 'application/octet-stream'
+        ext = os.path.splitext(filepath)[1].lower()
+        return STATIC_CONTENT_TYPES.get(ext, 'application/octet-stream')
     
     def do_POST(self):
         """Handle POST requests (API endpoints)"""
         try:
-            # Special handlers that manage their own response
-            if self.path == '/log_frontend':
-                self._handle_frontend_logs()
-                return
-            elif self.path == '/api/feedback/console-log':
-                self._handle_console_log()
-                return
-            elif self.path == '/api/feedback/network-error':
-                self._handle_network_error()
-                return
-            elif self.path == '/api/import/csv':
-                self._handle_csv_upload()
-                return
-            elif self.path == '/api/import/save-mapping':
-                self._handle_save_mapping()
-                return
-            elif self.path == '/api/import/mappings':
-                self._handle_get_mappings()
+            raw_handler = RAW_POST_ROUTES.get(self.path)
+            route = POST_ROUTES.get(self.path)
+            ext_route = None
+            if raw_handler is None and route is None:
+                ext_route = EXTENSION_ROUTE_RE.fullmatch(self.path)
+                if ext_route is None:
+                    # Unknown endpoint: answer without reading the body
+                    self.close_connection = True
+                    self._send_error(404, 'Unknown endpoint', cors=True)
+                    return
+            
+            # Parsed once here; raw handlers read it back from self.content_length
+            max_body = MAX_UPLOAD_BODY if raw_handler is not None else MAX_JSON_BODY
+            self.content_length = self._parse_content_length(max_body)
+            if self.content_length is None:
                 return
-            elif self.path == '/api/import/process':
-                self._handle_process_csv()
-                return
-            elif self.path == '/api/feedback/submit':
-                # Handle multipart form data for file uploads
-                self._handle_feedback_submit()
+            
+            # Special handlers that manage their own response. They may leave
+            # trailing bytes (e.g. a multipart epilogue) unread, so don't keep
+            # the connection open
+            if raw_handler is not None:
+                self.close_connection = True
+                raw_handler(self)
                 return
             
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
+            post_data = self.rfile.read(self.content_length)
             
             try:
-                data = json.loads(post_data.decode())
+                data = json_loads(post_data)
             except:
                 data = {}
             
-            if self.path == '/api/init':
-                response = self.handle_init(data)
-            elif self.path == '/api/sync-now':
-                response = self.handle_sync_now()
-            elif self.path == '/api/start-scheduler':
-                response = self.handle_start_scheduler()
-            elif self.path == '/api/stop-scheduler':
-                response = self.handle_stop_scheduler()
-            elif self.path == '/api/config':
-                response = self.handle_save_config(data)
-            elif self.path == '/api/save-config':
-                response = self.handle_save_config(data)
-            elif self.path == '/api/insights/resolve':
-                response = self.handle_resolve_insight(data)
-            elif self.path == '/api/insights/run':
-                response = self.handle_run_insights(data)
-            elif self.path == '/api/feedback/save-token':
-                response = self.handle_save_feedback_token(data)
-            # Extension system endpoints
-            elif self.path == '/api/extensions':
-                response = self._handle_list_extensions()
-            elif self.path.startswith('/api/extensions/') and '/config' in self.path:
-                ext_name = self.path.split('/')[3]
-                response = self._handle_extension_config(ext_name, data)
-            elif self.path.startswith('/api/extensions/') and '/test' in self.path:
-                ext_name = self.path.split('/')[3]
-                response = self._handle_extension_test(ext_name)
-            # Data import/export endpoints
-            elif self.path == '/api/data/import':
-                response = self._handle_data_import(data)
-            elif self.path == '/api/data/export':
-                response = self._handle_data_export(data)
-            elif self.path == '/api/data/features':
-                response = self._handle_get_features()
-            elif self.path == '/api/data/dependencies':
-                response = self._handle_get_dependencies()
-            # Update checker endpoints
-            elif self.path == '/api/updates/check':
-                response = self._handle_check_updates()
-            elif self.path == '/api/updates/apply':
-                response = self._handle_apply_update(data)
-            elif self.path == '/api/app/restart':
-                response = self._handle_app_restart()
-            # Jira-specific endpoints
-            elif self.path == '/api/jira/query':
-                response = self._handle_jira_query(data)
-            elif self.path == '/api/jira/update':
-                response = self._handle_jira_update(data)
-            elif self.path == '/api/jira/bulk-update':
-                response = self._handle_jira_bulk_update(data)
-            elif self.path == '/api/jira/test-connection':
-                response = self._handle_jira_test_connection()
-            # Reporting endpoints
-            elif self.path == '/api/reports/daily-scrum':
-                response = self._handle_daily_scrum_report(data)
-            elif self.path == '/api/reports/generate':
-                response = self._handle_generate_report(data)
-            elif self.path == '/api/reports/insights':
-                response = self._handle_get_insights()
-            elif self.path == '/api/integrations/save':
-                response = self.handle_save_integrations(data)
-            elif self.path == '/api/integrations/test-github':
-                response = self.handle_test_github_connection(data)
-            elif self.path == '/api/automation/save':
-                response = self.handle_save_automation_rules(data)
-            elif self.path == '/api/selenium/open-jira':
-                response = self.handle_open_jira_browser(data)
-            elif self.path == '/api/selenium/check-login':
-                response = self.handle_check_jira_login()
-            elif self.path == '/api/po/load-data':
-                response = self.handle_load_po_data(data)
-            elif self.path == '/api/sm/scrape-metrics':
-                response = self.handle_scrape_sm_metrics(data)
-            elif self.path == '/api/snow-jira/save-config':
-                response = self.handle_save_snow_config(data)
-            elif self.path == '/api/snow-jira/test-connection':
-                response = self.handle_test_snow_connection()
-            elif self.path == '/api/export-logs':
-                response = self.handle_export_logs()
-            elif self.path == '/api/snow-jira/validate-prb':
-                response = self.handle_validate_prb(data)
-            elif self.path == '/api/snow-jira/sync':
-                response = self.handle_snow_jira_sync(data)
-            elif self.path == '/api/bookmarklet/data':
-                response = self.handle_bookmarklet_data(data)
-            elif self.path == '/api/bookmarklet/mode':
-                response = self.handle_bookmarklet_mode(data)
-            elif self.path == '/api/bookmarklet/start-workflow':
-                response = self.handle_start_bookmarklet_workflow(data)
-            else:
-                response = {'success': False, 'error': 'Unknown endpoint'}
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self._send_cors_headers()  # Add CORS for bookmarklet
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode())
+            response = self._call_post_route(route, ext_route, data)
+            self._send_json(response, cors=True)
         except Exception as e:
             safe_print(f"ERROR in do_POST: {str(e)}")
             logging.error("Error in do_POST", exc_info=True)
+            # The body may be unread or the response half-written
+            self.close_connection = True
             try:
-                self.send_response(500)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps({'success': False, 'error': str(e)}).encode())
+                self._send_error(500, str(e))
             except:
                 pass
     
+    def _call_post_route(self, route, ext_route, data):
+        """Run a JSON POST handler and return its response dict"""
+        if route is not None:
+            handler, takes_data = route
+            return handler(self, data) if takes_data else handler(self)
+        ext_name, action = ext_route.groups()
+        if action == 'config':
+            return self._handle_extension_config(ext_name, data)
+        return self._handle_extension_test(ext_name)
+    
+    def _parse_content_length(self, max_body):
+        """Return the request's Content-Length, or None after rejecting it with 400/413"""
+        try:
+            content_length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            content_length = -1
+        if content_length < 0:
+            self.close_connection = True
+            self._send_error(400, 'Invalid Content-Length')
+            return None
+        if content_length > max_body:
+            # Refuse before reading so an oversized body is never buffered
+            self.close_connection = True
+            self._send_error(413, f'Request body too large (limit {max_body // (1024 * 1024)} MB)')
+            return None
+        return content_length
+    
     def _handle_status(self):
         """Return current sync status"""
-        global is_syncing
         status = {
-            'is_syncing': is_syncing,
-            'has_driver': driver is not None,
-            'has_engine': sync_engine is not None
+            'is_syncing': app_state.is_syncing,
+            'has_driver': app_state.page is not None,
+            'has_engine': app_state.sync_engine is not None
         }
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(status).encode())
+        self._send_json(status)
     
     def _handle_get_config(self):
         """Return current configuration"""
         try:
-            config_path = os.path.join(DATA_DIR, 'config.yaml')
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(config).encode())
+            # The ETag tracks the file itself, so an unchanged config is answered
+            # with 304 before it is read, parsed or serialized
+            config_stat = os.stat(CONFIG_PATH)
+            etag = f'W/"{config_stat.st_mtime_ns:x}-{config_stat.st_size:x}"'
+            if self._etag_matches(etag):
+                self._send_not_modified(etag)
+                return
+            config = load_config()
+            self._send_json(config, etag=etag)
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'error': str(e)}).encode())
+            self._send_error(500, str(e))
     
     def _handle_integrations_status(self):
         """Return real integration status based on config AND Playwright browser state"""
-        global page
         try:
-            config_path = os.path.join(DATA_DIR, 'config.yaml')
             try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config = yaml.safe_load(f)
+                config = load_config()
             except FileNotFoundError:
                 config = {}
             
@@ -483,31 +1259,19 @@ class SyncHandler(BaseHTTPRequestHandler):
             feedback_config = config.get('feedback', {})
             
             github_token = github_config.get('api_token', '')
-            github_connected = bool(github_token and github_token != '' and github_token != 'YOUR_GITHUB_TOKEN_HERE')
+            github_connected = is_real_token(github_token)
             
             jira_url = jira_config.get('base_url', '')
             jira_configured = bool(jira_url and jira_url != '' and 'your-company' not in jira_url)
             
             feedback_token = feedback_config.get('github_token', '')
-            feedback_configured = bool(feedback_token and feedback_token != '' and feedback_token != 'YOUR_GITHUB_TOKEN_HERE')
+            feedback_configured = is_real_token(feedback_token)
             
             # Check REAL Playwright browser state for Jira
-            jira_browser_open = False
-            jira_logged_in = False
-            jira_current_url = None
-            
-            if page is not None and not page.is_closed():
-                try:
-                    jira_current_url = page.url
-                    jira_browser_open = True
-                    
-                    # Check if logged in (basic check - Phase 4: use proper login_detector)
-                    if 'atlassian.net' in jira_current_url or 'jira' in jira_current_url.lower():
-                        # Simple check: if not on login page, assume logged in
-                        jira_logged_in = '/login' not in jira_current_url.lower() and '/auth' not in jira_current_url.lower()
-                except:
-                    jira_browser_open = False
-            
+            jira_current_url = get_page_url()
+            jira_browser_open = jira_current_url is not None
+            jira_logged_in = jira_browser_open and jira_url_logged_in(jira_current_url)
+
             status = {
                 'github': {
                     'configured': github_connected,
@@ -532,140 +1296,99 @@ class SyncHandler(BaseHTTPRequestHandler):
                 }
             }
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(status).encode())
+            self._send_json_with_etag(status)
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'error': str(e)}).encode())
+            self._send_error(500, str(e))
     
     def _handle_get_automation_rules(self):
         """Return automation rules from config"""
         try:
-            config_path = os.path.join(DATA_DIR, 'config.yaml')
             try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config = yaml.safe_load(f)
+                config = load_config()
             except FileNotFoundError:
                 config = {}
             
             automation = config.get('automation', {})
             
-            rules = {
-                'pr_opened': {
-                    'enabled': automation.get('pr_opened', {}).get('enabled', False),
-                    'add_comment': automation.get('pr_opened', {}).get('add_comment', False),
-                    'set_status': automation.get('pr_opened', {}).get('set_status', ''),
-                    'add_label': automation.get('pr_opened', {}).get('add_label', ''),
-                    'description': 'When a PR is opened, update the linked Jira ticket'
-                },
-                'pr_updated': {
-                    'enabled': automation.get('pr_updated', {}).get('enabled', False),
-                    'add_comment': automation.get('pr_updated', {}).get('add_comment', False),
-                    'set_status': automation.get('pr_updated', {}).get('set_status', ''),
-                    'add_label': automation.get('pr_updated', {}).get('add_label', ''),
-                    'description': 'When a PR receives new commits'
-                },
-                'pr_merged': {
-                    'enabled': automation.get('pr_merged', {}).get('enabled', False),
-                    'branch_rules': automation.get('pr_merged', {}).get('branch_rules', []),
-                    'description': 'When a PR is merged (branch-specific rules)'
-                },
-                'pr_closed': {
-                    'enabled': automation.get('pr_closed', {}).get('enabled', False),
-                    'add_comment': automation.get('pr_closed', {}).get('add_comment', False),
-                    'set_status': automation.get('pr_closed', {}).get('set_status', ''),
-                    'add_label': automation.get('pr_closed', {}).get('add_label', ''),
-                    'description': 'When a PR is closed without merging'
-                }
-            }
+            rules = {}
+            for rule_key, (fields, description) in AUTOMATION_RULE_FIELDS.items():
+                rule_config = automation.get(rule_key) or {}
+                rule = {'enabled': rule_config.get('enabled', False)}
+                for field_name, default in fields.items():
+                    rule[field_name] = rule_config.get(field_name, default)
+                rule['description'] = description
+                rules[rule_key] = rule
             
             active_count = sum(1 for r in rules.values() if r.get('enabled', False))
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({
+            self._send_json({
                 'rules': rules,
                 'active_count': active_count,
                 'total_count': len(rules)
-            }).encode())
+            })
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'error': str(e)}).encode())
+            self._send_error(500, str(e))
 
     def _is_page_valid(self):
         """Check if the Playwright page session is still valid"""
-        global page
-        if page is None or page.is_closed():
-            return False
-        try:
-            # Try to access page.url - will fail if session is invalid
-            _ = page.url
-            return True
-        except Exception:
-            return False
+        # get_page_url() returns None for a missing, closed or broken page
+        return get_page_url() is not None
     
+    @run_on_browser_thread
     def _reset_browser(self):
         """Reset the Playwright browser and sync engine after invalid session"""
-        global playwright_instance, browser, context, page, sync_engine
         safe_print("🔄 Resetting invalid browser session...")
-        try:
-            if page is not None and not page.is_closed():
-                page.close()
-        except:
-            pass
-        try:
-            if context is not None:
-                context.close()
-        except:
-            pass
-        try:
-            if browser is not None:
-                browser.close()
-        except:
-            pass
-        try:
-            if playwright_instance is not None:
-                playwright_instance.stop()
-        except:
-            pass
-        playwright_instance = None
-        browser = None
-        context = None
-        page = None
-        sync_engine = None
-        safe_print("✅ Browser reset complete")
-    
-    def _init_playwright_browser(self):
-        """Initialize Playwright browser with session persistence"""
-        global playwright_instance, browser, context, page
-        
-        safe_print("[PLAYWRIGHT] Initializing browser...")
-        
-        # CRITICAL: Ensure Playwright browsers are installed
-        self._ensure_playwright_browsers()
-        
+        with app_state.lock:
+            try:
+                if app_state.page is not None and not app_state.page.is_closed():
+                    app_state.page.close()
+            except:
+                pass
+            try:
+                if app_state.context is not None:
+                    app_state.context.close()
+            except:
+                pass
+            try:
+                if app_state.browser is not None:
+                    app_state.browser.close()
+            except:
+                pass
+            try:
+                if app_state.playwright_instance is not None:
+                    app_state.playwright_instance.stop()
+            except:
+                pass
+            app_state.playwright_instance = None
+            app_state.browser = None
+            app_state.context = None
+            app_state.page = None
+            app_state.sync_engine = None
+        safe_print("✅ Browser reset complete")
+    
+    @run_on_browser_thread
+    def _init_playwright_browser(self):
+        """Initialize Playwright browser with session persistence"""
+        safe_print("[PLAYWRIGHT] Initializing browser...")
+        
+        # CRITICAL: Ensure Playwright browsers are installed
+        self._ensure_playwright_browsers()
+        
         # Storage state path for session persistence
-        storage_dir = os.path.join(DATA_DIR, 'playwright_profile')
-        os.makedirs(storage_dir, exist_ok=True)
-        storage_state_path = os.path.join(storage_dir, 'state.json')
+        os.makedirs(PLAYWRIGHT_PROFILE_DIR, exist_ok=True)
+        storage_state_path = PLAYWRIGHT_STATE_PATH
         
         # Start Playwright
         safe_print("[PLAYWRIGHT] Starting Playwright instance...")
-        playwright_instance = sync_playwright().start()
+        from playwright.sync_api import sync_playwright
+        app_state.playwright_instance = sync_playwright().start()
         safe_print("[PLAYWRIGHT] ✓ Playwright instance started")
         
         # Launch browser with Playwright's Chromium (NOT system Chrome)
         # Headless mode: user doesn't see browser, can't accidentally close it
         safe_print("[PLAYWRIGHT] Launching Chromium (headless mode)...")
         try:
-            browser = playwright_instance.chromium.launch(
+            app_state.browser = app_state.playwright_instance.chromium.launch(
                 headless=True,  # Run in background - user never sees it
                 args=[
                     '--disable-blink-features=AutomationControlled',  # Hide automation
@@ -676,7 +1399,6 @@ class SyncHandler(BaseHTTPRequestHandler):
             safe_print(f"[PLAYWRIGHT] ✓ Chromium launched successfully")
         except Exception as e:
             safe_print(f"[PLAYWRIGHT] ✗ Failed to launch Chromium: {e}")
-            import traceback
             safe_print(f"[PLAYWRIGHT] Stack trace:\n{traceback.format_exc()}")
             raise
         
@@ -694,12 +1416,12 @@ class SyncHandler(BaseHTTPRequestHandler):
             safe_print(f"[PLAYWRIGHT] 📂 No saved session found, starting fresh")
         
         safe_print("[PLAYWRIGHT] Creating browser context...")
-        context = browser.new_context(**context_options)
+        app_state.context = app_state.browser.new_context(**context_options)
         safe_print("[PLAYWRIGHT] ✓ Browser context created")
         
         # Create page with console logging
         safe_print("[PLAYWRIGHT] Creating page...")
-        page = context.new_page()
+        app_state.page = app_state.context.new_page()
         
         # CRITICAL: Capture browser console logs and errors
         def log_console(msg):
@@ -712,8 +1434,8 @@ class SyncHandler(BaseHTTPRequestHandler):
             """Log browser page errors to Python logs"""
             safe_print(f"[BROWSER-ERROR] {error}")
         
-        page.on("console", log_console)
-        page.on("pageerror", log_page_error)
+        app_state.page.on("console", log_console)
+        app_state.page.on("pageerror", log_page_error)
         
         safe_print("[PLAYWRIGHT] ✓ Page created with console logging enabled")
         safe_print(f"[PLAYWRIGHT] ✓ Browser initialization complete")
@@ -731,7 +1453,6 @@ class SyncHandler(BaseHTTPRequestHandler):
             safe_print(f"[PLAYWRIGHT] Driver executable: {driver_executable}")
             
             # Try to check if browsers are installed
-            import subprocess
             safe_print("[PLAYWRIGHT] Running 'playwright install --dry-run chromium'...")
             result = subprocess.run(
                 [sys.executable, '-m', 'playwright', 'install', '--dry-run', 'chromium'],
@@ -776,79 +1497,78 @@ class SyncHandler(BaseHTTPRequestHandler):
             safe_print("[PLAYWRIGHT] This may indicate network issues. Attempting to continue...")
         except Exception as e:
             safe_print(f"[PLAYWRIGHT] ⚠️ Error checking browser installation: {e}")
-            import traceback
             safe_print(f"[PLAYWRIGHT] Stack trace:\n{traceback.format_exc()}")
             safe_print("[PLAYWRIGHT] Attempting to continue anyway...")
             # Don't fail - let chromium.launch() handle it
         
         return storage_state_path
     
+    @run_on_browser_thread
     def _save_playwright_session(self, storage_state_path):
         """Save current Playwright session state"""
-        global context
         try:
-            if context is not None:
-                context.storage_state(path=storage_state_path)
+            if app_state.context is not None:
+                app_state.context.storage_state(path=storage_state_path)
                 safe_print(f"💾 Session saved to {storage_state_path}")
         except Exception as e:
             safe_print(f"⚠️ Failed to save session: {e}")
     
+    @run_on_browser_thread
     def _ensure_browser_initialized(self):
         """Ensure browser is initialized, launch if needed. Returns (success, error_message)"""
-        global page
-        
-        if page is not None:
-            # Browser already initialized
-            return (True, None)
-        
-        try:
-            safe_print("🚀 Auto-launching browser...")
-            storage_state_path = self._init_playwright_browser()
+        # Concurrent callers wait here instead of launching a second browser
+        with app_state.lock:
+            if app_state.page is not None:
+                # Browser already initialized
+                return (True, None)
             
-            # Navigate to blank page
-            page.goto('about:blank')
-            
-            safe_print("✅ Browser initialized successfully")
-            return (True, None)
-        except Exception as e:
-            safe_print(f"❌ Failed to initialize browser: {e}")
-            return (False, f"Failed to initialize browser: {str(e)}")
+            try:
+                safe_print("🚀 Auto-launching browser...")
+                storage_state_path = self._init_playwright_browser()
+                
+                # Navigate to blank page
+                app_state.page.goto('about:blank')
+                
+                safe_print("✅ Browser initialized successfully")
+                return (True, None)
+            except Exception as e:
+                safe_print(f"❌ Failed to initialize browser: {e}")
+                return (False, f"Failed to initialize browser: {str(e)}")
     
     def handle_sync_now(self):
         """Run sync immediately"""
-        global sync_engine, is_syncing
-        
+        sync_engine = app_state.sync_engine
         if sync_engine is None:
             return {'success': False, 'error': 'Please initialize browser first'}
         
-        if is_syncing:
-            return {'success': False, 'error': 'Sync already in progress'}
-        
         try:
-            is_syncing = True
-            sync_engine.sync_once()
-            is_syncing = False
+            if not run_exclusive_sync(sync_engine):
+                return {'success': False, 'error': 'Sync already in progress'}
             return {'success': True, 'message': 'Sync completed'}
         except Exception as e:
-            is_syncing = False
             return {'success': False, 'error': str(e)}
     
     def handle_start_scheduler(self):
         """Start scheduled sync"""
-        global sync_engine, sync_thread, is_syncing
-        
-        if sync_engine is None:
-            return {'success': False, 'error': 'Please initialize browser first'}
-        
-        if sync_thread and sync_thread.is_alive():
-            return {'success': False, 'error': 'Scheduler already running'}
-        
-        try:
-            sync_thread = threading.Thread(target=sync_engine.start_scheduled, daemon=True)
-            sync_thread.start()
-            return {'success': True, 'message': 'Scheduler started'}
-        except Exception as e:
-            return {'success': False, 'error': str(e)}
+        with app_state.lock:
+            if app_state.sync_engine is None:
+                return {'success': False, 'error': 'Please initialize browser first'}
+            
+            if app_state.sync_thread and app_state.sync_thread.is_alive():
+                return {'success': False, 'error': 'Scheduler already running'}
+            
+            try:
+                # The scheduler thread only keeps time; each run goes through the
+                # same guard and browser thread as "Sync now"
+                sync_engine = app_state.sync_engine
+                app_state.sync_thread = threading.Thread(
+                    target=sync_engine.start_scheduled,
+                    kwargs={'run_sync': functools.partial(run_scheduled_sync, sync_engine)},
+                    daemon=True)
+                app_state.sync_thread.start()
+                return {'success': True, 'message': 'Scheduler started'}
+            except Exception as e:
+                return {'success': False, 'error': str(e)}
     
     def handle_stop_scheduler(self):
         """Stop scheduled sync"""
@@ -858,8 +1578,7 @@ class SyncHandler(BaseHTTPRequestHandler):
     def handle_save_config(self, data):
         """Save configuration changes"""
         try:
-            with open(os.path.join(DATA_DIR, 'config.yaml'), 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, default_flow_style=False)
+            save_config(data)
             return {'success': True, 'message': 'Configuration saved'}
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -868,63 +1587,38 @@ class SyncHandler(BaseHTTPRequestHandler):
         """Save integration settings to config - PRESERVES all existing config"""
         try:
             # Use DATA_DIR for writable config
-            config_path = os.path.join(DATA_DIR, 'config.yaml')
-            safe_print(f"[CONFIG] Saving integrations to: {config_path}")
+            safe_print(f"[CONFIG] Saving integrations to: {CONFIG_PATH}")
             safe_print(f"[CONFIG] Received data sections: {list(data.keys())}")
             
             # CRITICAL: Always load existing config first to preserve feedback tokens
-            if not os.path.exists(config_path):
+            try:
+                config = load_config() or {}
+                safe_print(f"[CONFIG] Loaded existing config with sections: {list(config.keys())}")
+            except FileNotFoundError:
                 safe_print(f"[CONFIG] Config file not found, creating new one")
                 config = {}
-            else:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config = yaml.safe_load(f) or {}
-                    safe_print(f"[CONFIG] Loaded existing config with sections: {list(config.keys())}")
             
             # IMPORTANT: Only update fields that are provided in data
             # DO NOT overwrite/delete sections not included in data
             
-            if 'github' in data:
-                safe_print(f"[CONFIG] Updating GitHub section...")
-                if 'github' not in config:
-                    config['github'] = {}
+            for section, fields in INTEGRATION_FIELDS.items():
+                if section not in data:
+                    continue
+                safe_print(f"[CONFIG] Updating {section} section...")
+                source = data[section]
+                target = config.setdefault(section, {})
                 # Only update provided fields
-                if 'api_token' in data['github']:
-                    config['github']['api_token'] = data['github']['api_token']
-                    safe_print(f"[CONFIG]   - api_token: {'<set>' if data['github']['api_token'] else '<empty>'}")
-                if 'base_url' in data['github']:
-                    config['github']['base_url'] = data['github']['base_url']
-                    safe_print(f"[CONFIG]   - base_url: {data['github']['base_url']}")
-                if 'organization' in data['github']:
-                    config['github']['organization'] = data['github']['organization']
-                    safe_print(f"[CONFIG]   - organization: {data['github']['organization']}")
-                if 'repositories' in data['github']:
-                    config['github']['repositories'] = data['github']['repositories']
-                    safe_print(f"[CONFIG]   - repositories: {len(data['github']['repositories'])} repos")
-            
-            if 'jira' in data:
-                safe_print(f"[CONFIG] Updating Jira section...")
-                if 'jira' not in config:
-                    config['jira'] = {}
-                # Only update provided fields
-                if 'base_url' in data['jira']:
-                    config['jira']['base_url'] = data['jira']['base_url']
-                    safe_print(f"[CONFIG]   - base_url: {data['jira']['base_url']}")
-                if 'project_keys' in data['jira']:
-                    config['jira']['project_keys'] = data['jira']['project_keys']
-                    safe_print(f"[CONFIG]   - project_keys: {data['jira']['project_keys']}")
-            
-            if 'feedback' in data:
-                safe_print(f"[CONFIG] Updating feedback section...")
-                if 'feedback' not in config:
-                    config['feedback'] = {}
-                # Only update provided fields
-                if 'github_token' in data['feedback']:
-                    config['feedback']['github_token'] = data['feedback']['github_token']
-                    safe_print(f"[CONFIG]   - github_token: {'<set>' if data['feedback']['github_token'] else '<empty>'}")
-                if 'repo' in data['feedback']:
-                    config['feedback']['repo'] = data['feedback']['repo']
-                    safe_print(f"[CONFIG]   - repo: {data['feedback']['repo']}")
+                for field_name in fields:
+                    if field_name not in source:
+                        continue
+                    value = target[field_name] = source[field_name]
+                    if field_name in SECRET_INTEGRATION_FIELDS:
+                        shown = '<set>' if value else '<empty>'
+                    elif isinstance(value, (list, dict)):
+                        shown = f"{len(value)} entries"
+                    else:
+                        shown = value
+                    safe_print(f"[CONFIG]   - {field_name}: {shown}")
             
             # ADD: Handle ServiceNow config
             if 'servicenow' in data:
@@ -950,8 +1644,7 @@ class SyncHandler(BaseHTTPRequestHandler):
             
             safe_print(f"[CONFIG] Final config sections: {list(config.keys())}")
             safe_print(f"[CONFIG] Writing config to disk...")
-            with open(config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config, f, default_flow_style=False)
+            save_config(config)
             safe_print(f"[CONFIG] ✓ Config written successfully")
             
             # Re-initialize GitHub feedback client if token was updated
@@ -978,12 +1671,10 @@ class SyncHandler(BaseHTTPRequestHandler):
             return {'success': True, 'message': 'Integration settings saved'}
         except PermissionError as e:
             safe_print(f"[CONFIG] ❌ Permission denied writing config: {e}")
-            import traceback
             safe_print(f"[CONFIG] Stack trace:\n{traceback.format_exc()}")
             return {'success': False, 'error': f'Permission denied: Cannot write to config file. Try running as administrator.'}
         except Exception as e:
             safe_print(f"[CONFIG] ❌ Failed to save integrations: {e}")
-            import traceback
             safe_print(f"[CONFIG] Stack trace:\n{traceback.format_exc()}")
             return {'success': False, 'error': f'Save failed: {str(e)}'}
     
@@ -994,12 +1685,11 @@ class SyncHandler(BaseHTTPRequestHandler):
             if not token:
                 return {'success': False, 'error': 'No token provided'}
             
-            import requests
             headers = {
                 'Authorization': f'token {token}',
                 'Accept': 'application/vnd.github.v3+json'
             }
-            response = requests.get('https://api.github.com/user', headers=headers, timeout=10)
+            response = get_http_session().get('https://api.github.com/user', headers=headers, timeout=10)
             
             if response.status_code == 200:
                 user_data = response.json()
@@ -1018,9 +1708,7 @@ class SyncHandler(BaseHTTPRequestHandler):
     def handle_save_automation_rules(self, data):
         """Save automation rule settings"""
         try:
-            config_path = os.path.join(DATA_DIR, 'config.yaml')
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f) or {}
+            config = load_config() or {}
             
             if 'automation' not in config:
                 config['automation'] = {}
@@ -1039,8 +1727,7 @@ class SyncHandler(BaseHTTPRequestHandler):
                     if 'branch_rules' in data[rule_name]:
                         config['automation'][rule_name]['branch_rules'] = data[rule_name]['branch_rules']
             
-            with open(config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config, f, default_flow_style=False)
+            save_config(config)
             
             return {'success': True, 'message': 'Automation rules saved'}
         except Exception as e:
@@ -1053,34 +1740,12 @@ class SyncHandler(BaseHTTPRequestHandler):
             
             # Get GitHub token and repo from config file directly
             # (not from config_manager which may be cached)
-            github_token = None
-            repo_owner = 'mikejsmith1985'  # Default fallback
-            repo_name = 'jira-automation'
-            
-            config_path = os.path.join(DATA_DIR, 'config.yaml')
-            if os.path.exists(config_path):
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    cfg = yaml.safe_load(f) or {}
-                
-                # Use feedback token (same PAT for feedback and updates)
-                github_token = cfg.get('feedback', {}).get('github_token')
-                
-                # Validate token is not placeholder
-                if github_token and github_token in ['YOUR_GITHUB_TOKEN_HERE', 'your_token_here', '']:
-                    github_token = None
-                    safe_print("[UPDATE] Feedback token is placeholder, not using")
-                
-                # Parse repo from feedback.repo (format: "owner/repo")
-                feedback_repo = cfg.get('feedback', {}).get('repo', '')
-                if feedback_repo and '/' in feedback_repo:
-                    repo_owner, repo_name = feedback_repo.split('/', 1)
-                
-                # Fallback: try github.api_token if feedback token not set
-                if not github_token:
-                    github_token = cfg.get('github', {}).get('api_token')
-                    if github_token and github_token in ['YOUR_GITHUB_TOKEN_HERE', 'your_token_here', '']:
-                        github_token = None
-            
+            cfg = load_config_or_empty()
+
+            # Feedback PAT doubles as the update token (github.api_token fallback)
+            github_token = resolve_github_token(cfg)
+            repo_owner, repo_name = resolve_feedback_repo(cfg)
+
             # CRITICAL: This is a private repo, must have token
             if not github_token:
                 return {
@@ -1118,18 +1783,10 @@ class SyncHandler(BaseHTTPRequestHandler):
             }
         except Exception as e:
             # Any other error
-            error_msg = str(e)
             # Make error user-friendly
-            if 'connection' in error_msg.lower() or 'network' in error_msg.lower():
-                error_msg = 'Cannot connect to GitHub. Check your internet connection.'
-            elif 'timeout' in error_msg.lower():
-                error_msg = 'GitHub request timed out. Try again later.'
-            elif len(error_msg) > 150:
-                error_msg = error_msg[:150] + '...'
-            
             return {
                 'success': False,
-                'error': error_msg
+                'error': friendly_error(str(e), _UPDATE_ERR_RX, _UPDATE_ERR_MAP, 150)
             }
     
     def _handle_apply_update(self, data):
@@ -1148,30 +1805,18 @@ class SyncHandler(BaseHTTPRequestHandler):
             # Method 1: Try config_manager
             if config_manager:
                 try:
-                    config = config_manager.get_config()
-                    github_token = config.get('feedback', {}).get('github_token')
-                    if not github_token:
-                        github_token = config.get('github', {}).get('api_token')
+                    github_token = resolve_github_token(config_manager.get_config())
                 except Exception as e:
                     safe_print(f"[WARN] Could not read from config_manager: {e}")
-            
+
             # Method 2: Read directly from config file if config_manager failed
             if not github_token:
                 try:
-                    config_path = os.path.join(DATA_DIR, 'config.yaml')
-                    if os.path.exists(config_path):
-                        with open(config_path, 'r', encoding='utf-8') as f:
-                            config = yaml.safe_load(f) or {}
-                        github_token = config.get('feedback', {}).get('github_token')
-                        if not github_token:
-                            github_token = config.get('github', {}).get('api_token')
-                        safe_print(f"[INFO] Read token from file: {'found' if github_token else 'not found'}")
+                    github_token = resolve_github_token(load_config_or_empty())
+                    safe_print(f"[INFO] Read token from file: {'found' if github_token else 'not found'}")
                 except Exception as e:
                     safe_print(f"[WARN] Could not read config file: {e}")
-            
-            if github_token and github_token in ['YOUR_GITHUB_TOKEN_HERE', 'your_token_here', '']:
-                github_token = None  # Ignore placeholder tokens
-            
+
             safe_print(f"[UPDATE] Using token for download: {'Yes' if github_token else 'No'}")
 
             checker = VersionChecker(
@@ -1186,12 +1831,7 @@ class SyncHandler(BaseHTTPRequestHandler):
             if result.get('success'):
                 # Trigger application restart after sending response (Forge-Terminal pattern)
                 # Wait a bit to ensure response is sent, then start new process and exit
-                import threading
                 def restart_after_update():
-                    import time
-                    import subprocess
-                    import signal
-                    
                     time.sleep(3)  # Give time for response to reach client
                     
                     safe_print("[UPDATE] Starting new version...")
@@ -1228,10 +1868,9 @@ class SyncHandler(BaseHTTPRequestHandler):
                         time.sleep(1)
                         
                         # Use taskkill to forcefully terminate this specific PID
-                        import subprocess as sp
                         pid = os.getpid()
-                        sp.Popen([f'taskkill', '/F', '/PID', str(pid)],
-                                creationflags=subprocess.CREATE_NO_WINDOW)
+                        subprocess.Popen([f'taskkill', '/F', '/PID', str(pid)],
+                                         creationflags=subprocess.CREATE_NO_WINDOW)
                         
                     except Exception as e:
                         safe_print(f"[UPDATE] Failed to restart: {e}")
@@ -1246,8 +1885,6 @@ class SyncHandler(BaseHTTPRequestHandler):
     def _handle_app_restart(self):
         """Restart the application"""
         try:
-            import subprocess
-            
             # Get current exe path
             if getattr(sys, 'frozen', False):
                 exe_path = sys.executable
@@ -1276,9 +1913,9 @@ class SyncHandler(BaseHTTPRequestHandler):
             
             # Schedule shutdown of current instance
             def shutdown():
-                import time
                 time.sleep(1)
                 safe_print("[RESTART] Shutting down current instance...")
+                stop_log_listener()
                 os._exit(0)
             threading.Thread(target=shutdown, daemon=True).start()
             
@@ -1288,7 +1925,6 @@ class SyncHandler(BaseHTTPRequestHandler):
     
     def _handle_selenium_status(self):
         """Return REAL Playwright browser status"""
-        global page
         try:
             status = {
                 'browser_open': False,
@@ -1297,85 +1933,81 @@ class SyncHandler(BaseHTTPRequestHandler):
                 'session_active': False
             }
             
-            if page is not None and not page.is_closed():
-                try:
-                    # Check if browser is still open
-                    current_url = page.url
-                    status['browser_open'] = True
-                    status['current_url'] = current_url
-                    status['session_active'] = True
-                    
-                    # Check if logged in to Jira (basic check - Phase 4: proper detection)
-                    if 'atlassian.net' in current_url or 'jira' in current_url.lower():
-                        status['jira_logged_in'] = '/login' not in current_url.lower() and '/auth' not in current_url.lower()
-                except:
-                    # Browser was closed
-                    status['browser_open'] = False
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(status).encode())
+            current_url = get_page_url()
+            if current_url is not None:
+                status['browser_open'] = True
+                status['current_url'] = current_url
+                status['session_active'] = True
+                status['jira_logged_in'] = jira_url_logged_in(current_url)
+
+            self._send_json(status)
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'error': str(e)}).encode())
+            self._send_error(500, str(e))
     
+    @run_on_browser_thread
     def handle_open_jira_browser(self, data):
         """Open Playwright browser and navigate to Jira for manual login"""
-        global playwright_instance, browser, context, page, sync_engine
-        
         try:
             jira_url = data.get('jiraUrl', '')
             if not jira_url:
                 # Try to get from config if it exists
-                config_path = os.path.join(DATA_DIR, 'config.yaml')
-                if os.path.exists(config_path):
-                    try:
-                        with open(config_path, 'r') as f:
-                            config = yaml.safe_load(f)
-                        jira_url = config.get('jira', {}).get('base_url', '')
-                    except Exception:
-                        pass  # Silently fallback if config read fails
+                try:
+                    config = load_config()
+                    jira_url = config.get('jira', {}).get('base_url', '')
+                except Exception:
+                    pass  # Silently fallback if config read fails
             
             if not jira_url or 'your-company' in jira_url:
                 return {'success': False, 'error': 'Please configure Jira URL first'}
             
-            # Check if existing page session is valid
-            if page is not None:
-                if not self._is_page_valid():
-                    safe_print("⚠️ Detected invalid session, resetting browser...")
-                    self._reset_browser()
+            # Reuse, reset or launch the browser as one step so concurrent requests
+            # cannot interleave a reset with a launch
+            with app_state.lock:
+                # Check if existing page session is valid
+                if app_state.page is not None:
+                    if not self._is_page_valid():
+                        safe_print("⚠️ Detected invalid session, resetting browser...")
+                        self._reset_browser()
+                    else:
+                        # Session is valid, just navigate - unless the page is already
+                        # somewhere on this Jira site (e.g. "Open Jira" clicked twice;
+                        # after login Jira redirects to /jira/your-work and the like),
+                        # where a reload plus networkidle wait would only cost time
+                        current_url = app_state.page.url
+                        if same_origin(current_url, jira_url):
+                            return {
+                                'success': True,
+                                'message': f'Browser reused. Already on Jira at {current_url}',
+                                'url': current_url
+                            }
+                        app_state.page.goto(jira_url, wait_until='networkidle')
+                        return {
+                            'success': True,
+                            'message': f'Browser reused. Navigated to {jira_url}',
+                            'url': jira_url
+                        }
+                
+                # Initialize Playwright browser if not already done
+                if app_state.page is None:
+                    safe_print("🚀 Initializing Playwright browser...")
+                    storage_state_path = self._init_playwright_browser()
+                    safe_print("✅ Playwright browser initialized")
                 else:
-                    # Session is valid, just navigate
-                    page.goto(jira_url, wait_until='networkidle')
-                    return {
-                        'success': True,
-                        'message': f'Browser reused. Navigating to {jira_url}',
-                        'url': jira_url
-                    }
-            
-            # Initialize Playwright browser if not already done
-            if page is None:
-                safe_print("🚀 Initializing Playwright browser...")
-                storage_state_path = self._init_playwright_browser()
-                safe_print("✅ Playwright browser initialized")
-            else:
-                # Browser exists but need storage path
-                storage_dir = os.path.join(DATA_DIR, 'playwright_profile')
-                storage_state_path = os.path.join(storage_dir, 'state.json')
-            
-            # Initialize sync engine with correct config path (DATA_DIR not relative path)
-            if sync_engine is None:
-                config_path = os.path.join(DATA_DIR, 'config.yaml')
-                # Now pass page instead of driver (Playwright migration Phase 4 complete!)
-                sync_engine = SyncEngine(page, config_path=config_path)
-                safe_print("✅ SyncEngine initialized with Playwright")
+                    # Browser exists but need storage path
+                    storage_state_path = PLAYWRIGHT_STATE_PATH
+                
+                # Initialize sync engine with correct config path (DATA_DIR not relative path)
+                if app_state.sync_engine is None:
+                    # Now pass page instead of driver (Playwright migration Phase 4 complete!)
+                    # Reuse the cached parse; a missing/empty config falls back
+                    # to SyncEngine's own defaults
+                    app_state.sync_engine = SyncEngine(app_state.page, config_path=CONFIG_PATH,
+                                                       config=load_config_or_empty() or None)
+                    safe_print("✅ SyncEngine initialized with Playwright")
             
             # Navigate to Jira
             safe_print(f"🌐 Navigating to {jira_url}...")
-            page.goto(jira_url, wait_until='networkidle')
+            app_state.page.goto(jira_url, wait_until='networkidle')
             
             # Save session after navigation
             self._save_playwright_session(storage_state_path)
@@ -1389,20 +2021,20 @@ class SyncHandler(BaseHTTPRequestHandler):
             logging.error("Error opening Jira browser", exc_info=True)
             return {'success': False, 'error': str(e)}
     
+    @run_on_browser_thread
     def handle_check_jira_login(self):
         """Check if user is logged in to Jira"""
-        global page
-        
         if not self._is_page_valid():
             self._reset_browser()
             return {'success': False, 'logged_in': False, 'error': 'Browser session expired. Please reopen browser.'}
         
         try:
-            current_url = page.url
+            current_url = app_state.page.url
             
             # Basic login check (Phase 4: migrate login_detector.py to Playwright)
             # For now, just check URL patterns
-            if '/login' in current_url.lower() or '/auth' in current_url.lower():
+            url_lower = current_url.lower()
+            if '/login' in url_lower or '/auth' in url_lower:
                 logged_in = False
                 user_info = None
                 debug_info = "On login/auth page"
@@ -1436,42 +2068,71 @@ class SyncHandler(BaseHTTPRequestHandler):
                 if not url:
                     return {'success': False, 'error': 'No URL provided'}
                 
-                # Fetch the URL
-                import requests
-                response = requests.get(url, timeout=30)
-                if response.status_code != 200:
-                    return {'success': False, 'error': f'Failed to fetch URL: {response.status_code}'}
-                
-                # Try to parse as JSON
+                # Stream the download to disk as-is: the file is what we persist, so
+                # there's no need to buffer the response and re-serialize the tree
                 try:
-                    structure = response.json()
-                except:
-                    return {'success': False, 'error': 'URL did not return valid JSON'}
+                    with get_http_session().get(url, stream=True, timeout=30) as response:
+                        if response.status_code != 200:
+                            return {'success': False, 'error': f'Failed to fetch URL: {response.status_code}'}
+                        with open(PO_DATA_DOWNLOAD_PATH, 'wb') as f:
+                            for chunk in response.iter_content(64 * 1024):
+                                f.write(chunk)
+                    
+                    # Try to parse as JSON
+                    try:
+                        with open(PO_DATA_DOWNLOAD_PATH, 'rb') as f:
+                            structure = json_loads(f.read())
+                    except ValueError:
+                        return {'success': False, 'error': 'URL did not return valid JSON'}
+                    
+                    # Checked before the download replaces the current PO data
+                    if not structure:
+                        return {'success': False, 'error': 'No data provided'}
+                    if not isinstance(structure, dict):
+                        return {'success': False, 'error': 'URL did not return a PO data object'}
+                    
+                    # Store the data for the PO view
+                    os.replace(PO_DATA_DOWNLOAD_PATH, PO_DATA_PATH)
+                finally:
+                    # Gone after a successful replace; otherwise drop the partial
+                    # or rejected download, whatever interrupted it
+                    try:
+                        os.remove(PO_DATA_DOWNLOAD_PATH)
+                    except FileNotFoundError:
+                        pass
             else:
                 # Direct data upload
                 structure = data.get('data', {})
-            
-            if not structure:
-                return {'success': False, 'error': 'No data provided'}
-            
-            # Store the data for the PO view
-            # Save to a local file for persistence
-            with open('po_data.json', 'w', encoding='utf-8') as f:
-                json.dump(structure, f, indent=2)
+                
+                if not structure:
+                    return {'success': False, 'error': 'No data provided'}
+                if not isinstance(structure, dict):
+                    return {'success': False, 'error': 'PO data must be an object'}
+                
+                # Store the data for the PO view
+                # Save to a local file for persistence
+                write_file_atomic(PO_DATA_PATH, json_file_bytes(structure, indent=PO_DATA_PRETTY))
             
             # Calculate summary stats
-            features = structure.get('features', [])
-            total_issues = sum(len(f.get('children', [])) for f in features) + len(features)
+            features = structure.get('features') or []
+            feature_count = len(features)
+            total_issues = feature_count
+            for feature in features:
+                total_issues += len(feature.get('children') or ())
             
-            return {
+            result = {
                 'success': True,
-                'message': f'Loaded {len(features)} features, {total_issues} total issues',
+                'message': f'Loaded {feature_count} features, {total_issues} total issues',
                 'summary': {
-                    'features': len(features),
+                    'features': feature_count,
                     'total_issues': total_issues
-                },
-                'data': structure
+                }
             }
+            # The tree was just persisted to PO_DATA_PATH; only encode it into the
+            # response again for callers that ask for it
+            if self.headers.get('X-Include-Data', '').lower() in ('1', 'true', 'yes'):
+                result['data'] = structure
+            return result
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
@@ -1484,70 +2145,54 @@ class SyncHandler(BaseHTTPRequestHandler):
 
     def _handle_get_insights(self):
         """Return recent insights"""
-        global insights_engine
         try:
-            if insights_engine is None:
-                insights_engine = InsightsEngine()
+            if app_state.insights_engine is None:
+                app_state.insights_engine = InsightsEngine()
             
             days = int(self.headers.get('X-Days', 7))
-            insights = insights_engine.get_insights(days=days)
+            insights = app_state.insights_engine.get_insights(days=days)
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'insights': insights}).encode())
+            self._send_json({'insights': insights})
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'error': str(e)}).encode())
+            self._send_error(500, str(e))
     
     def _handle_get_trend(self):
         """Return metric trend data"""
-        global insights_engine
         try:
-            if insights_engine is None:
-                insights_engine = InsightsEngine()
+            if app_state.insights_engine is None:
+                app_state.insights_engine = InsightsEngine()
             
             metric_type = self.headers.get('X-Metric-Type', 'velocity')
             days = int(self.headers.get('X-Days', 30))
-            trend = insights_engine.get_metric_trend(metric_type, days)
+            trend = app_state.insights_engine.get_metric_trend(metric_type, days)
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'trend': trend}).encode())
+            self._send_json({'trend': trend})
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'error': str(e)}).encode())
+            self._send_error(500, str(e))
     
     def handle_resolve_insight(self, data):
         """Mark insight as resolved"""
-        global insights_engine
         try:
-            if insights_engine is None:
-                insights_engine = InsightsEngine()
+            if app_state.insights_engine is None:
+                app_state.insights_engine = InsightsEngine()
             
             insight_id = data.get('id')
             if not insight_id:
                 return {'success': False, 'error': 'Missing insight ID'}
             
-            insights_engine.resolve_insight(insight_id)
+            app_state.insights_engine.resolve_insight(insight_id)
             return {'success': True, 'message': 'Insight resolved'}
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
     def handle_run_insights(self, data):
         """Run insights analysis on provided data"""
-        global insights_engine
         try:
-            if insights_engine is None:
-                insights_engine = InsightsEngine()
+            if app_state.insights_engine is None:
+                app_state.insights_engine = InsightsEngine()
             
             jira_data = data.get('jira_data', {})
-            insights = insights_engine.analyze_all(jira_data)
+            insights = app_state.insights_engine.analyze_all(jira_data)
             
             return {'success': True, 'insights': insights}
         except Exception as e:
@@ -1560,38 +2205,23 @@ class SyncHandler(BaseHTTPRequestHandler):
         try:
             if github_feedback and github_feedback.token:
                 result = github_feedback.validate_token()
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps(result).encode())
+                self._send_json(result)
             else:
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps({
+                self._send_json({
                     'valid': False,
                     'error': 'No token configured'
-                }).encode())
+                })
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'error': str(e)}).encode())
+            self._send_error(500, str(e))
     
     def _handle_get_version(self):
         """Get current version"""
         try:
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({
+            self._send_json({
                 'version': APP_VERSION
-            }).encode())
+            })
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'error': str(e)}).encode())
+            self._send_error(500, str(e))
     
     def _handle_list_releases(self):
         """List recent releases"""
@@ -1617,15 +2247,9 @@ class SyncHandler(BaseHTTPRequestHandler):
             limit = int(self.headers.get('X-Limit', '10'))
             result = version_checker.list_recent_releases(limit=limit)
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(result).encode())
+            self._send_json(result)
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'error': str(e)}).encode())
+            self._send_error(500, str(e))
     
     def _handle_frontend_logs(self):
         """
@@ -1633,14 +2257,13 @@ class SyncHandler(BaseHTTPRequestHandler):
         This is the NEW automatic logging system - replaces manual console.log()
         """
         try:
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
+            post_data = self.rfile.read(self.content_length)
+            data = json_loads(post_data)
             
             logs = data.get('logs', [])
             if logs:
                 # Write to dedicated frontend log file
-                frontend_log_path = os.path.join(DATA_DIR, 'frontend.log')
+                frontend_log_path = FRONTEND_LOG_PATH
                 
                 with open(frontend_log_path, 'a', encoding='utf-8') as f:
                     for entry in logs:
@@ -1651,139 +2274,90 @@ class SyncHandler(BaseHTTPRequestHandler):
                 
                 safe_print(f"[FRONTEND-LOG] Wrote {len(logs)} log entries to {frontend_log_path}")
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'success': True, 'logged': len(logs)}).encode('utf-8'))
+            self._send_json({'success': True, 'logged': len(logs)})
             
         except Exception as e:
             safe_print(f"[FRONTEND-LOG] ERROR: {e}")
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'error': str(e)}).encode('utf-8'))
+            self._send_error(500, str(e))
     
     def _handle_console_log(self):
-        """Receive and store console log from browser"""
+        """Receive and store console log from browser (one entry, or a batch
+        as a list / {'logs': [...]} so chatty pages needn't POST per entry)"""
         global log_capture
         try:
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            log_entry = json.loads(post_data.decode('utf-8'))
+            post_data = self.rfile.read(self.content_length)
+            payload = json_loads(post_data)
             
-            log_capture.add_console_log(log_entry)
+            if isinstance(payload, dict) and isinstance(payload.get('logs'), list):
+                payload = payload['logs']
+            if isinstance(payload, list):
+                log_capture.add_console_logs(payload)
+            else:
+                log_capture.add_console_log(payload)
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'success': True}).encode('utf-8'))
+            self._send_json({'success': True})
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'error': str(e)}).encode('utf-8'))
+            self._send_error(500, str(e))
     
     def _handle_csv_upload(self):
         """Handle CSV file upload for import"""
         try:
-            import cgi
-            
             # Parse multipart form data
-            content_type = self.headers['Content-Type']
-            content_length = int(self.headers['Content-Length'])
-            
-            environ = {
-                'REQUEST_METHOD': 'POST',
-                'CONTENT_TYPE': content_type,
-                'CONTENT_LENGTH': str(content_length)
-            }
-            
-            form = cgi.FieldStorage(
-                fp=self.rfile,
-                headers=self.headers,
-                environ=environ,
-                keep_blank_values=True
-            )
+            try:
+                form = parse_multipart(self.rfile, self.headers['Content-Type'], self.content_length)
+            except ValueError as e:
+                # Malformed upload: the client's fault, not a server error
+                self._send_error(400, str(e))
+                return
             
             if 'file' not in form:
                 raise ValueError("No file uploaded")
                 
             fileitem = form['file']
-            if not fileitem.file:
-                raise ValueError("Empty file")
+            if fileitem.filename is None:
+                raise ValueError("No file uploaded")
                 
             importer = JiraCSVImporter()
-            result = importer.parse_csv(fileitem.file.read())
+            # The parser has already spooled the upload to a temp file;
+            # parse from it directly rather than reading it into memory
+            result = importer.parse_csv(fileitem.file)
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(result).encode('utf-8'))
+            self._send_json(result)
             
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'success': False, 'error': str(e)}).encode('utf-8'))
+            self._send_error(500, str(e))
             
     def _handle_save_mapping(self):
         """Save CSV field mapping"""
         try:
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
+            post_data = self.rfile.read(self.content_length)
+            data = json_loads(post_data)
             
             mapping = data.get('mapping')
             mapping_name = data.get('name', 'default')
             
             # Save to config/storage
-            config_path = os.path.join(DATA_DIR, 'csv_mappings.json')
-            mappings = {}
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    mappings = json.load(f)
-            
+            mappings = load_csv_mappings()
             mappings[mapping_name] = mapping
+            save_csv_mappings(mappings)
             
-            with open(config_path, 'w') as f:
-                json.dump(mappings, f, indent=2)
-                
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'success': True}).encode('utf-8'))
+            self._send_json({'success': True})
             
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'success': False, 'error': str(e)}).encode('utf-8'))
+            self._send_error(500, str(e))
 
     def _handle_get_mappings(self):
         """Get saved CSV mappings"""
         try:
-            config_path = os.path.join(DATA_DIR, 'csv_mappings.json')
-            mappings = {}
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    mappings = json.load(f)
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'success': True, 'mappings': mappings}).encode('utf-8'))
+            self._send_json({'success': True, 'mappings': load_csv_mappings()})
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'success': False, 'error': str(e)}).encode('utf-8'))
+            self._send_error(500, str(e))
 
     def _handle_process_csv(self):
         """Process CSV with provided mapping"""
         try:
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
+            post_data = self.rfile.read(self.content_length)
+            data = json_loads(post_data)
             
             mapping = data.get('mapping')
             rows = data.get('rows') # If passing rows back from client
@@ -1804,66 +2378,46 @@ class SyncHandler(BaseHTTPRequestHandler):
             importer = JiraCSVImporter()
             result = importer.map_data(rows, mapping)
             
-            # Save processed data for persistence
-            po_data_path = os.path.join(DATA_DIR, 'po_data.json')
-            with open(po_data_path, 'w') as f:
-                json.dump(result, f, indent=2)
+            # Save processed data for persistence (the PO view reads it back)
+            write_file_atomic(PO_DATA_PATH, json_file_bytes(result, indent=PO_DATA_PRETTY))
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(result).encode('utf-8'))
+            self._send_json(result)
             
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'success': False, 'error': str(e)}).encode('utf-8'))
+            self._send_error(500, str(e))
 
     def _handle_network_error(self):
         """Receive and store network error from browser"""
         global log_capture
         try:
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            error_entry = json.loads(post_data.decode('utf-8'))
+            post_data = self.rfile.read(self.content_length)
+            error_entry = json_loads(post_data)
             
             log_capture.add_network_error(error_entry)
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'success': True}).encode('utf-8'))
+            self._send_json({'success': True})
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'error': str(e)}).encode('utf-8'))
+            self._send_error(500, str(e))
     
     def _handle_feedback_submit(self):
         """Handle multipart form data feedback submission with file uploads"""
         global github_feedback_client, log_capture
+        if not github_feedback_client:
+            # No GitHub token configured. Reject before touching the upload;
+            # raw handlers close the connection, so the unread body is dropped
+            print("[ERROR] GitHub feedback client not initialized - token not configured")
+            self._send_error(400, 'GitHub token not configured. Go to Settings tab and configure your GitHub Personal Access Token and repository.')
+            return
+        
+        form = {}
         try:
-            import cgi
-            import io
-            
             # Parse multipart form data
-            content_type = self.headers['Content-Type']
-            content_length = int(self.headers['Content-Length'])
-            
-            # Create environment for cgi.FieldStorage
-            environ = {
-                'REQUEST_METHOD': 'POST',
-                'CONTENT_TYPE': content_type,
-                'CONTENT_LENGTH': str(content_length)
-            }
-            
-            form = cgi.FieldStorage(
-                fp=self.rfile,
-                headers=self.headers,
-                environ=environ,
-                keep_blank_values=True
-            )
+            try:
+                form = parse_multipart(self.rfile, self.headers['Content-Type'], self.content_length)
+            except ValueError as e:
+                # Malformed upload: the client's fault, not a server error
+                self._send_error(400, str(e))
+                return
             
             # Extract form fields
             title = form.getvalue('title', 'User Feedback')
@@ -1879,126 +2433,89 @@ class SyncHandler(BaseHTTPRequestHandler):
                 body += "\n```\n\n"
                 
                 # Include frontend logs if they exist
-                frontend_log_path = os.path.join(DATA_DIR, 'frontend.log')
-                if os.path.exists(frontend_log_path):
-                    try:
-                        with open(frontend_log_path, 'r', encoding='utf-8') as f:
-                            # Get last 500 lines to avoid huge logs
-                            lines = f.readlines()
-                            if len(lines) > 500:
-                                frontend_logs = ''.join(lines[-500:])
-                                body += f"## Frontend Logs (last 500 lines)\n```\n"
-                            else:
-                                frontend_logs = ''.join(lines)
-                                body += f"## Frontend Logs\n```\n"
-                            body += frontend_logs
-                            body += "\n```\n\n"
-                    except Exception as fe_err:
-                        body += f"## Frontend Logs\n*(Failed to read: {fe_err})*\n\n"
+                try:
+                    # Get last 500 lines to avoid huge logs
+                    total_lines, lines = tail_text_file(FRONTEND_LOG_PATH, 500)
+                    if total_lines > 500:
+                        body += f"## Frontend Logs (last 500 lines)\n```\n"
+                    else:
+                        body += f"## Frontend Logs\n```\n"
+                    body += ''.join(lines)
+                    body += "\n```\n\n"
+                except FileNotFoundError:
+                    pass
+                except Exception as fe_err:
+                    body += f"## Frontend Logs\n*(Failed to read: {fe_err})*\n\n"
             
             # Add system info
-            import platform
             body += "## System Information\n"
-            body += f"- OS: {platform.system()} {platform.release()}\n"
-            body += f"- Python: {platform.python_version()}\n"
+            body += SYSTEM_INFO
             body += f"- App Version: {APP_VERSION}\n"
             body += f"- Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
             
-            # Handle file attachments
+            # Handle file attachments. The issue only notes each file's size, so
+            # take it from the spooled part instead of reading and base64-encoding it
             attachments = []
             
             if 'screenshot' in form:
                 screenshot = form['screenshot']
                 if screenshot.file:
-                    screenshot_data = screenshot.file.read()
                     attachments.append({
                         'name': 'screenshot.png',
-                        'content': base64.b64encode(screenshot_data).decode('utf-8'),
+                        'size': screenshot.file.seek(0, os.SEEK_END),
                         'mime_type': 'image/png'
                     })
             
             if 'video' in form:
                 video = form['video']
                 if video.file:
-                    video_data = video.file.read()
                     attachments.append({
                         'name': 'recording.webm',
-                        'content': base64.b64encode(video_data).decode('utf-8'),
+                        'size': video.file.seek(0, os.SEEK_END),
                         'mime_type': 'video/webm'
                     })
             
             # Submit to GitHub
-            if github_feedback_client:
-                print(f"[INFO] Submitting feedback to GitHub: {title}")
-                print(f"[INFO] Repository: {github_feedback_client.repo_name}")
-                print(f"[INFO] Attachments: {len(attachments)} files")
-                
-                result = github_feedback_client.create_issue(
-                    title=title,
-                    body=body,
-                    labels=['bug', 'user-feedback'],
-                    attachments=attachments if attachments else None
-                )
-                
-                print(f"[INFO] GitHub API result: {result}")
-                
-                if result['success']:
-                    print(f"[SUCCESS] Created issue #{result['issue_number']}: {result['issue_url']}")
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
-                    self.end_headers()
-                    self.wfile.write(json.dumps({
-                        'success': True,
-                        'issue_number': result['issue_number'],
-                        'issue_url': result['issue_url']
-                    }).encode('utf-8'))
-                else:
-                    error_msg = result.get('error', 'Failed to create issue')
-                    print(f"[ERROR] GitHub issue creation failed: {error_msg}")
-                    self.send_response(500)
-                    self.send_header('Content-type', 'application/json')
-                    self.end_headers()
-                    self.wfile.write(json.dumps({
-                        'success': False,
-                        'error': f"GitHub API Error: {error_msg}"
-                    }).encode('utf-8'))
+            print(f"[INFO] Submitting feedback to GitHub: {title}")
+            print(f"[INFO] Repository: {github_feedback_client.repo_name}")
+            print(f"[INFO] Attachments: {len(attachments)} files")
+            
+            result = github_feedback_client.create_issue(
+                title=title,
+                body=body,
+                labels=['bug', 'user-feedback'],
+                attachments=attachments if attachments else None
+            )
+            
+            print(f"[INFO] GitHub API result: {result}")
+            
+            if result['success']:
+                print(f"[SUCCESS] Created issue #{result['issue_number']}: {result['issue_url']}")
+                self._send_json({
+                    'success': True,
+                    'issue_number': result['issue_number'],
+                    'issue_url': result['issue_url']
+                })
             else:
-                # No GitHub token configured
-                print("[ERROR] GitHub feedback client not initialized - token not configured")
-                self.send_response(400)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps({
-                    'success': False,
-                    'error': 'GitHub token not configured. Go to Settings tab and configure your GitHub Personal Access Token and repository.'
-                }).encode('utf-8'))
+                error_msg = result.get('error', 'Failed to create issue')
+                print(f"[ERROR] GitHub issue creation failed: {error_msg}")
+                self._send_error(500, f"GitHub API Error: {error_msg}")
                 
         except Exception as e:
             print(f"[ERROR] Feedback submission exception: {e}")
             logging.error("CRITICAL: Feedback submission failed", exc_info=True)
             
-            error_detail = str(e)
             # Check for common errors
-            if 'Bad credentials' in error_detail:
-                error_detail = 'Invalid GitHub token. Please check your token in Settings tab.'
-            elif 'Not Found' in error_detail or '404' in error_detail:
-                error_detail = 'Repository not found. Please check repository name in Settings (format: owner/repo).'
-            elif 'rate limit' in error_detail.lower():
-                error_detail = 'GitHub API rate limit exceeded. Please try again later.'
-            elif 'permission' in error_detail.lower() or 'forbidden' in error_detail.lower():
-                error_detail = 'Permission denied. Ensure your token has "repo" or "public_repo" scope.'
-            
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({
-                'success': False,
-                'error': f'Exception: {error_detail}'
-            }).encode('utf-8'))
+            error_detail = explain_github_error(str(e))
+            
+            self._send_error(500, f'Exception: {error_detail}')
+        finally:
+            for part in form.values():
+                part.file.close()
     
     def handle_submit_feedback(self, data):
         """Submit feedback - save to SQLite only (GitHub handled by frontend)"""
-        global feedback_db, log_capture
+        global log_capture
         try:
             title = data.get('title', 'User Feedback')
             description = data.get('description', '')
@@ -2014,29 +2531,28 @@ class SyncHandler(BaseHTTPRequestHandler):
                 body += log_capture.export_all_logs()
             
             # Add system info
-            import platform
             body += "\n\n## System Information\n"
-            body += f"- OS: {platform.system()} {platform.release()}\n"
-            body += f"- Python: {platform.python_version()}\n"
+            body += SYSTEM_INFO
             body += f"- Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
             
             # Save to SQLite (always succeeds)
-            logs_json = json.dumps(log_capture.console_logs + log_capture.network_errors) if include_logs else None
-            attachments_json = json.dumps(attachments) if attachments else None
+            logs_json = log_capture.export_entries_json() if include_logs else None
+            attachments_json = json_bytes(attachments).decode('utf-8') if attachments else None
             
-            feedback_id = feedback_db.add_feedback(
+            # Status depends on whether GitHub sync happened; stored with the
+            # row in one insert rather than a follow-up update
+            feedback_id = get_feedback_db().add_feedback(
                 title=title,
                 description=body,
                 logs=logs_json,
-                attachments=attachments_json
+                attachments=attachments_json,
+                status='synced' if github_issue_url else 'local',
+                github_issue_url=github_issue_url
             )
             
-            # Update status based on whether GitHub sync happened
             if github_issue_url:
-                feedback_db.update_status(feedback_id, 'synced', github_issue_url)
                 message = f'✅ Feedback submitted to GitHub (Issue #{github_issue_number})'
             else:
-                feedback_db.update_status(feedback_id, 'local')
                 message = f'✅ Feedback saved locally (ID: {feedback_id})'
             
             return {
@@ -2061,14 +2577,9 @@ class SyncHandler(BaseHTTPRequestHandler):
                 return {'success': False, 'error': 'Token and repo required'}
             
             # Load config or create new one if missing
-            config_path = os.path.join(DATA_DIR, 'config.yaml')
-            if os.path.exists(config_path):
-                try:
-                    with open(config_path, 'r', encoding='utf-8') as f:
-                        config = yaml.safe_load(f) or {}
-                except Exception:
-                    config = {}
-            else:
+            try:
+                config = load_config() or {}
+            except Exception:
                 config = {}
             
             # Update feedback section
@@ -2079,8 +2590,7 @@ class SyncHandler(BaseHTTPRequestHandler):
             config['feedback']['repo'] = repo
             
             # Save config
-            with open(config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config, f, default_flow_style=False)
+            save_config(config)
             
             # Initialize GitHub feedback client
             github_feedback = GitHubFeedback(token=token, repo_name=repo)
@@ -2167,22 +2677,24 @@ class SyncHandler(BaseHTTPRequestHandler):
             result = ext.extract_data(query)
             
             if result.get('success'):
-                import_id = data_store.save_import(
-                    extension=extension_name,
-                    data=result.get('data', []),
-                    query=query.get('jql', str(query))
-                )
-                
                 features = ext.transform_to_features(result)
                 dependencies = ext.transform_to_dependencies(result)
                 
-                data_store.save_features(features, import_id)
-                data_store.save_dependencies(dependencies, import_id)
-                
-                data_store.log_action('import', extension_name, {
-                    'query': query,
-                    'count': result.get('count', 0)
-                })
+                # One write transaction (a single commit) for the whole import
+                with data_store.transaction():
+                    import_id = data_store.save_import(
+                        extension=extension_name,
+                        data=result.get('data', []),
+                        query=query.get('jql', str(query))
+                    )
+                    
+                    data_store.save_features(features, import_id)
+                    data_store.save_dependencies(dependencies, import_id)
+                    
+                    data_store.log_action('import', extension_name, {
+                        'query': query,
+                        'count': result.get('count', 0)
+                    })
                 
                 return {
                     'success': True,
@@ -2202,6 +2714,7 @@ class SyncHandler(BaseHTTPRequestHandler):
         global extension_manager, data_store, report_generator
         try:
             if not report_generator:
+                from extensions.reporting import ReportGenerator
                 report_generator = ReportGenerator()
             
             format = data.get('format', 'csv')
@@ -2230,20 +2743,19 @@ class SyncHandler(BaseHTTPRequestHandler):
         global data_store
         try:
             # Check for po_data.json first (CSV Import pivot)
-            po_data_path = os.path.join(get_data_dir(), 'po_data.json')
-            if os.path.exists(po_data_path):
-                with open(po_data_path, 'r') as f:
-                    data = json.load(f)
-                    # Support both old and new format
-                    if 'issues' in data:
-                        return {'success': True, 'features': data['issues']}
-                    return {'success': True, 'features': data}
+            data = load_po_data()
+            if data is not None:
+                # Support both old and new format
+                if 'issues' in data:
+                    return json_array_response({'success': True}, 'features', data['issues'])
+                return json_array_response({'success': True}, 'features', data)
 
             if not data_store:
+                from storage import get_data_store
                 data_store = get_data_store()
             
             features = data_store.get_latest_features()
-            return {'success': True, 'features': features or []}
+            return json_array_response({'success': True}, 'features', features or [])
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
@@ -2252,6 +2764,7 @@ class SyncHandler(BaseHTTPRequestHandler):
         global data_store
         try:
             if not data_store:
+                from storage import get_data_store
                 data_store = get_data_store()
             
             dependencies = data_store.get_latest_dependencies()
@@ -2370,13 +2883,22 @@ class SyncHandler(BaseHTTPRequestHandler):
     
     # ========== Reporting Handlers ==========
     
+    def _get_enhanced_insights(self):
+        """Return the shared insights engine, rebuilt only when the config changed"""
+        global enhanced_insights
+        rules_version = config_manager.version if config_manager else 0
+        if enhanced_insights is None or enhanced_insights.rules_version != rules_version:
+            custom_rules = config_manager.get_insight_rules() if config_manager else []
+            from extensions.reporting import EnhancedInsightsEngine
+            enhanced_insights = EnhancedInsightsEngine(custom_rules)
+            enhanced_insights.rules_version = rules_version
+        return enhanced_insights
+    
     def _handle_daily_scrum_report(self, data):
         """Generate daily scrum report"""
-        global extension_manager, enhanced_insights, data_store
+        global extension_manager, data_store
         try:
-            if not enhanced_insights:
-                custom_rules = config_manager.get_insight_rules() if config_manager else []
-                enhanced_insights = EnhancedInsightsEngine(custom_rules)
+            enhanced_insights = self._get_enhanced_insights()
             
             jira_ext = extension_manager.get_extension('jira') if extension_manager else None
             
@@ -2403,6 +2925,7 @@ class SyncHandler(BaseHTTPRequestHandler):
         global report_generator, data_store
         try:
             if not report_generator:
+                from extensions.reporting import ReportGenerator
                 report_generator = ReportGenerator()
             
             report_type = data.get('type', 'metrics')
@@ -2423,11 +2946,8 @@ class SyncHandler(BaseHTTPRequestHandler):
     
     def _handle_get_insights(self):
         """Get active insights"""
-        global enhanced_insights, data_store
         try:
-            if not enhanced_insights:
-                custom_rules = config_manager.get_insight_rules() if config_manager else []
-                enhanced_insights = EnhancedInsightsEngine(custom_rules)
+            enhanced_insights = self._get_enhanced_insights()
             
             insights = enhanced_insights.get_active_insights(days=7)
             return {'success': True, 'insights': insights}
@@ -2467,27 +2987,17 @@ class SyncHandler(BaseHTTPRequestHandler):
     def _handle_get_snow_config(self):
         """Get ServiceNow configuration (GET handler)"""
         try:
-            config_path = os.path.join(DATA_DIR, 'config.yaml')
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+            config = load_config()
             
             snow_config = config.get('servicenow', {})
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'success': True, 'config': snow_config}).encode())
+            self._send_json({'success': True, 'config': snow_config})
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'success': False, 'error': str(e)}).encode())
+            self._send_error(500, str(e))
     
     def handle_get_snow_config(self):
         """Get ServiceNow configuration"""
         try:
-            config_path = os.path.join(DATA_DIR, 'config.yaml')
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+            config = load_config()
             
             snow_config = config.get('servicenow', {})
             return {'success': True, 'config': snow_config}
@@ -2505,16 +3015,14 @@ class SyncHandler(BaseHTTPRequestHandler):
             if not url:
                 return {'success': False, 'error': 'ServiceNow URL is required. Please enter your ServiceNow instance URL (e.g., https://yourcompany.service-now.com)'}
             
-            if not url.startswith('http://') and not url.startswith('https://'):
+            if not url.startswith(_URL_OK):
                 return {'success': False, 'error': 'URL must start with http:// or https://'}
             
             if not jira_project:
                 return {'success': False, 'error': 'Jira Project Key is required. Please enter the project key where issues will be created (e.g., PROJ, DEV)'}
             
             # Load existing config
-            config_path = os.path.join(DATA_DIR, 'config.yaml')
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+            config = load_config()
             
             if 'servicenow' not in config:
                 config['servicenow'] = {}
@@ -2527,14 +3035,12 @@ class SyncHandler(BaseHTTPRequestHandler):
             })
             
             # Save config
-            with open(config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config, f, default_flow_style=False)
+            save_config(config)
             
-            # Update sync engine if it exists
-            global sync_engine
-            if sync_engine:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    sync_engine.config = yaml.safe_load(f)
+            # Update sync engine if it exists; it gets the dict just saved rather
+            # than a re-read and re-parse of the file (save_config dropped the cache)
+            if app_state.sync_engine:
+                app_state.sync_engine.config = config
             
             safe_print(f"[SNOW] Configuration saved - URL: {url}, Project: {jira_project}")
             
@@ -2546,6 +3052,7 @@ class SyncHandler(BaseHTTPRequestHandler):
             safe_print(f"ERROR in handle_save_snow_config: {str(e)}")
             return {'success': False, 'error': str(e)}
     
+    @run_on_browser_thread
     def handle_test_snow_connection(self):
         """Test ServiceNow connection with comprehensive error handling"""
         # Auto-launch browser if not initialized
@@ -2553,51 +3060,24 @@ class SyncHandler(BaseHTTPRequestHandler):
         if not success:
             return {'success': False, 'error': error}
         
-        global page
-        
         try:
             # Check 2: Load config
-            config_path = os.path.join(DATA_DIR, 'config.yaml')
-            if not os.path.exists(config_path):
+            try:
+                config = load_config()
+            except FileNotFoundError:
                 return {
                     'success': False,
                     'error': 'Configuration file not found. Please configure integrations first.'
                 }
             
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-            
-            # Check 3: ServiceNow config exists
-            if not config or 'servicenow' not in config:
-                return {
-                    'success': False,
-                    'error': 'ServiceNow not configured. Please add ServiceNow URL in Integrations tab.'
-                }
-            
-            snow_config = config.get('servicenow', {})
-            
-            # Check 4: URL is configured
-            url = snow_config.get('url', '').strip()
-            if not url:
-                return {
-                    'success': False,
-                    'error': 'ServiceNow URL not configured. Please enter your ServiceNow URL in Integrations tab.'
-                }
-            
-            # Check 5: URL format is valid
-            if not url.startswith('http://') and not url.startswith('https://'):
-                return {
-                    'success': False,
-                    'error': f'Invalid ServiceNow URL format: {url}. URL must start with http:// or https://'
-                }
+            # Check 3: ServiceNow URL and Jira project (needed for SnowJiraSync) are set
+            error = _validate_snow_config(config)
+            if error:
+                return {'success': False, 'error': error}
             
-            # Check 6: Jira project configured (needed for SnowJiraSync)
-            jira_project = snow_config.get('jira_project', '').strip()
-            if not jira_project:
-                return {
-                    'success': False,
-                    'error': 'Jira Project not configured for ServiceNow integration. Please enter a Jira project key.'
-                }
+            snow_config = config['servicenow']
+            url = snow_config['url'].strip()
+            jira_project = snow_config['jira_project'].strip()
             
             # Add minimal jira config if missing (needed for SnowJiraSync initialization)
             if 'jira' not in config:
@@ -2606,8 +3086,7 @@ class SyncHandler(BaseHTTPRequestHandler):
             # Test connection
             safe_print(f"[SNOW] Testing connection to {url}...")
             
-            from snow_jira_sync import SnowJiraSync
-            snow_sync = SnowJiraSync(page, config)
+            snow_sync = get_snow_sync(app_state.page, config)
             
             result = snow_sync.test_connection()
             
@@ -2628,32 +3107,23 @@ class SyncHandler(BaseHTTPRequestHandler):
         except Exception as e:
             # Unexpected error
             safe_print(f"[SNOW] Error testing connection: {e}")
-            error_msg = str(e)
             # Make error user-friendly
-            if 'playwright' in error_msg.lower() or 'page' in error_msg.lower():
-                error_msg = 'Browser error. Try closing and reopening the browser.'
-            elif 'connection' in error_msg.lower() or 'network' in error_msg.lower():
-                error_msg = 'Network error. Check your internet connection and ServiceNow URL.'
-            elif len(error_msg) > 200:
-                error_msg = error_msg[:200] + '... (See logs for full error)'
-            
             return {
                 'success': False,
-                'error': error_msg
+                'error': friendly_error(str(e), _SNOW_ERR_RX, _SNOW_ERR_MAP, 200,
+                                        '... (See logs for full error)')
             }
     
     
     def handle_export_logs(self):
         """Export logs and diagnostics for debugging"""
         try:
-            import datetime
-            
             # Collect diagnostics
             diagnostics = []
             diagnostics.append("="*70)
             diagnostics.append("WAYPOINT DIAGNOSTICS EXPORT")
             diagnostics.append("="*70)
-            diagnostics.append(f"Generated: {datetime.datetime.now().isoformat()}")
+            diagnostics.append(f"Generated: {datetime.now().isoformat()}")
             diagnostics.append(f"App Version: {APP_VERSION}")
             diagnostics.append("")
             
@@ -2671,10 +3141,9 @@ class SyncHandler(BaseHTTPRequestHandler):
             # Paths
             diagnostics.append("--- PATHS ---")
             diagnostics.append(f"Data Directory: {DATA_DIR}")
-            config_path = os.path.join(DATA_DIR, 'config.yaml')
-            diagnostics.append(f"Config Path: {config_path}")
-            diagnostics.append(f"Config Exists: {os.path.exists(config_path)}")
-            log_file = os.path.join(DATA_DIR, 'jira-sync.log')
+            diagnostics.append(f"Config Path: {CONFIG_PATH}")
+            diagnostics.append(f"Config Exists: {os.path.exists(CONFIG_PATH)}")
+            log_file = LOG_FILE
             diagnostics.append(f"Log File: {log_file}")
             diagnostics.append(f"Log File Exists: {os.path.exists(log_file)}")
             diagnostics.append("")
@@ -2682,43 +3151,41 @@ class SyncHandler(BaseHTTPRequestHandler):
             # Configuration status (without sensitive data)
             diagnostics.append("--- CONFIGURATION STATUS ---")
             try:
-                if os.path.exists(config_path):
-                    with open(config_path, 'r', encoding='utf-8') as f:
-                        config = yaml.safe_load(f) or {}
-                    
-                    # Check each integration (without showing actual values)
-                    if 'servicenow' in config:
-                        snow = config['servicenow']
-                        url = snow.get('url', '')
-                        diagnostics.append(f"ServiceNow URL: {'<configured>' if url else '<NOT CONFIGURED>'}")
-                        diagnostics.append(f"  - URL length: {len(url)} chars")
-                        diagnostics.append(f"  - Jira Project: {snow.get('jira_project', '<NOT CONFIGURED>')}")
-                        diagnostics.append(f"  - Field Mapping: {'<configured>' if snow.get('field_mapping') else '<none>'}")
-                    else:
-                        diagnostics.append("ServiceNow: <NOT CONFIGURED>")
-                    
-                    if 'jira' in config:
-                        jira = config['jira']
-                        diagnostics.append(f"Jira Base URL: {'<configured>' if jira.get('base_url') else '<NOT CONFIGURED>'}")
-                        diagnostics.append(f"  - Project Keys: {jira.get('project_keys', [])}")
-                    else:
-                        diagnostics.append("Jira: <NOT CONFIGURED>")
-                    
-                    if 'github' in config:
-                        github = config['github']
-                        diagnostics.append(f"GitHub API Token: {'<configured>' if github.get('api_token') else '<NOT CONFIGURED>'}")
-                        diagnostics.append(f"  - Organization: {github.get('organization', '<none>')}")
-                    else:
-                        diagnostics.append("GitHub: <NOT CONFIGURED>")
-                    
-                    if 'feedback' in config:
-                        feedback = config['feedback']
-                        diagnostics.append(f"Feedback GitHub Token: {'<configured>' if feedback.get('github_token') else '<NOT CONFIGURED>'}")
-                        diagnostics.append(f"  - Repo: {feedback.get('repo', '<none>')}")
-                    else:
-                        diagnostics.append("Feedback: <NOT CONFIGURED>")
+                config = load_config() or {}
+                
+                # Check each integration (without showing actual values)
+                if 'servicenow' in config:
+                    snow = config['servicenow']
+                    url = snow.get('url', '')
+                    diagnostics.append(f"ServiceNow URL: {'<configured>' if url else '<NOT CONFIGURED>'}")
+                    diagnostics.append(f"  - URL length: {len(url)} chars")
+                    diagnostics.append(f"  - Jira Project: {snow.get('jira_project', '<NOT CONFIGURED>')}")
+                    diagnostics.append(f"  - Field Mapping: {'<configured>' if snow.get('field_mapping') else '<none>'}")
+                else:
+                    diagnostics.append("ServiceNow: <NOT CONFIGURED>")
+                
+                if 'jira' in config:
+                    jira = config['jira']
+                    diagnostics.append(f"Jira Base URL: {'<configured>' if jira.get('base_url') else '<NOT CONFIGURED>'}")
+                    diagnostics.append(f"  - Project Keys: {jira.get('project_keys', [])}")
+                else:
+                    diagnostics.append("Jira: <NOT CONFIGURED>")
+                
+                if 'github' in config:
+                    github = config['github']
+                    diagnostics.append(f"GitHub API Token: {'<configured>' if github.get('api_token') else '<NOT CONFIGURED>'}")
+                    diagnostics.append(f"  - Organization: {github.get('organization', '<none>')}")
+                else:
+                    diagnostics.append("GitHub: <NOT CONFIGURED>")
+                
+                if 'feedback' in config:
+                    feedback = config['feedback']
+                    diagnostics.append(f"Feedback GitHub Token: {'<configured>' if feedback.get('github_token') else '<NOT CONFIGURED>'}")
+                    diagnostics.append(f"  - Repo: {feedback.get('repo', '<none>')}")
                 else:
-                    diagnostics.append("Config file not found!")
+                    diagnostics.append("Feedback: <NOT CONFIGURED>")
+            except FileNotFoundError:
+                diagnostics.append("Config file not found!")
             except Exception as e:
                 diagnostics.append(f"Error reading config: {e}")
             
@@ -2726,33 +3193,27 @@ class SyncHandler(BaseHTTPRequestHandler):
             
             # Browser status
             diagnostics.append("--- BROWSER STATUS ---")
-            global page
-            if page is None:
+            if app_state.page is None:
                 diagnostics.append("Playwright Browser: NOT INITIALIZED")
             else:
                 diagnostics.append("Playwright Browser: INITIALIZED")
-                try:
-                    diagnostics.append(f"  - Current URL: {page.url}")
-                except:
-                    diagnostics.append("  - Current URL: <unable to retrieve>")
+                # Never blocks on the browser, and reports a crashed one as such
+                current_url = get_page_url()
+                diagnostics.append(f"  - Current URL: {current_url or '<browser closed or unresponsive>'}")
             diagnostics.append("")
             
             # Recent logs (last 500 lines)
             diagnostics.append("--- RECENT LOGS (last 500 lines) ---")
-            if os.path.exists(log_file):
-                try:
-                    with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
-                        lines = f.readlines()
-                    
-                    # Get last 500 lines
-                    recent_lines = lines[-500:] if len(lines) > 500 else lines
-                    diagnostics.append(f"Total log lines: {len(lines)}, showing last: {len(recent_lines)}")
-                    diagnostics.append("")
-                    diagnostics.extend([line.rstrip() for line in recent_lines])
-                except Exception as e:
-                    diagnostics.append(f"Error reading log file: {e}")
-            else:
+            try:
+                # Get last 500 lines
+                total_lines, recent_lines = tail_text_file(log_file, 500)
+                diagnostics.append(f"Total log lines: {total_lines}, showing last: {len(recent_lines)}")
+                diagnostics.append("")
+                diagnostics.extend([line.rstrip() for line in recent_lines])
+            except FileNotFoundError:
                 diagnostics.append("Log file not found")
+            except Exception as e:
+                diagnostics.append(f"Error reading log file: {e}")
             
             diagnostics.append("")
             diagnostics.append("="*70)
@@ -2774,10 +3235,11 @@ class SyncHandler(BaseHTTPRequestHandler):
                 'error': str(e)
             }
     
+    @run_on_browser_thread
     def handle_validate_prb(self, data):
         """Validate a PRB and extract data"""
         # Ensure diagnostics directory exists early (before any errors)
-        diagnostics_dir = os.path.join(DATA_DIR, 'diagnostics')
+        diagnostics_dir = DIAGNOSTICS_DIR
         os.makedirs(diagnostics_dir, exist_ok=True)
         
         try:
@@ -2791,34 +3253,30 @@ class SyncHandler(BaseHTTPRequestHandler):
                     'diagnostics_path': diagnostics_dir
                 }
             
-            global page
-            
             prb_number = data.get('prb_number', '').strip()
             if not prb_number:
                 return {'success': False, 'error': 'PRB number is required'}
             
             safe_print(f"[PRB-VALIDATE] Starting validation for PRB: {prb_number}")
             
-            config_path = os.path.join(DATA_DIR, 'config.yaml')
-            if not os.path.exists(config_path):
+            try:
+                config = load_config()
+            except FileNotFoundError:
                 return {
                     'success': False,
                     'error': 'Configuration not found. Please configure ServiceNow settings first.',
                     'diagnostics_path': diagnostics_dir
                 }
             
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-            
-            if not config or 'servicenow' not in config:
+            error = _validate_snow_config(config)
+            if error:
                 return {
                     'success': False,
-                    'error': 'ServiceNow not configured. Please configure ServiceNow settings first.',
+                    'error': error,
                     'diagnostics_path': diagnostics_dir
                 }
             
-            from snow_jira_sync import SnowJiraSync
-            snow_sync = SnowJiraSync(page, config)
+            snow_sync = get_snow_sync(app_state.page, config)
             
             safe_print(f"[PRB-VALIDATE] Calling snow_sync.validate_prb()")
             result = snow_sync.validate_prb(prb_number)
@@ -2836,6 +3294,7 @@ class SyncHandler(BaseHTTPRequestHandler):
                 'exception_type': type(e).__name__
             }
     
+    @run_on_browser_thread
     def handle_snow_jira_sync(self, data):
         """Execute ServiceNow to Jira sync workflow"""
         # Auto-launch browser if not initialized
@@ -2843,8 +3302,6 @@ class SyncHandler(BaseHTTPRequestHandler):
         if not success:
             return {'success': False, 'error': error}
         
-        global page
-        
         try:
             prb_number = data.get('prb_number', '').strip()
             selected_inc = data.get('selected_inc', '').strip()
@@ -2854,12 +3311,12 @@ class SyncHandler(BaseHTTPRequestHandler):
             if not selected_inc:
                 return {'success': False, 'error': 'Incident number is required'}
             
-            config_path = os.path.join(DATA_DIR, 'config.yaml')
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+            config = load_config()
+            error = _validate_snow_config(config)
+            if error:
+                return {'success': False, 'error': error}
             
-            from snow_jira_sync import SnowJiraSync
-            snow_sync = SnowJiraSync(page, config)
+            snow_sync = get_snow_sync(app_state.page, config)
             
             result = snow_sync.sync_prb_to_jira(prb_number, selected_inc)
             return result
@@ -2875,153 +3332,14 @@ class SyncHandler(BaseHTTPRequestHandler):
         response = {
             'mode': bookmarklet_mode,
             'version': APP_VERSION,
-            'actions': {
-                'prb-extract': {
-                    'name': 'Extract PRB',
-                    'description': 'Extract PRB data from ServiceNow',
-                    'target': 'ServiceNow Problem Record page'
-                },
-                'jira-scrape': {
-                    'name': 'Scrape Jira Issue',
-                    'description': 'Extract issue data from Jira',
-                    'target': 'Jira Issue page'
-                }
-            }
+            'actions': BOOKMARKLET_ACTIONS
         }
         
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self._send_cors_headers()
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode())
+        self._send_json(response, cors=True)
     
     def _handle_bookmarklet_script(self):
         """Return the universal bookmarklet JavaScript"""
-        
-        # Universal bookmarklet that fetches action from Waypoint
-        script = '''javascript:(async function(){
-    const WAYPOINT='http://127.0.0.1:5000';
-    try{
-        /* Get current action from Waypoint */
-        const actionResp=await fetch(WAYPOINT+'/api/bookmarklet/action');
-        if(!actionResp.ok)throw new Error('Waypoint not running');
-        const action=await actionResp.json();
-        
-        let data={mode:action.mode,url:location.href,timestamp:new Date().toISOString()};
-        
-        /* Execute mode-specific extraction */
-        if(action.mode==='prb-extract'){
-            /* ServiceNow PRB extraction */
-            const frame=document.querySelector('iframe[name="gsft_main"]');
-            const doc=frame?frame.contentDocument:document;
-            
-            const getVal=(id)=>{
-                const el=doc.querySelector('#'+id.replace(/\\./g,'\\\\.'));
-                return el?(el.value||el.textContent||'').trim():'';
-            };
-            const getText=(id)=>{
-                const el=doc.querySelector('#'+id.replace(/\\./g,'\\\\.'));
-                return el?(el.textContent||'').trim():'';
-            };
-            
-            /* Try multiple ID patterns for PRB number */
-            const prbNumber=
-                getVal('sys_readonly.problem.number')||
-                getText('problem.number')||
-                getVal('problem.number')||
-                getText('sys_readonly.problem.number')||
-                /* Try from URL if form fields fail */
-                (location.href.match(/PRB\\d+/)?.[0])||'';
-            
-            data.prb={
-                number:prbNumber,
-                short_description:getVal('problem.short_description'),
-                description:getVal('problem.description'),
-                state:getText('sys_display.problem.state'),
-                priority:getText('sys_display.problem.priority'),
-                assigned_to:getText('sys_display.problem.assigned_to'),
-                assignment_group:getText('sys_display.problem.assignment_group'),
-                category:getText('sys_display.problem.category'),
-                opened_at:getVal('sys_readonly.problem.opened_at')||getText('problem.opened_at'),
-                resolved_at:getVal('sys_readonly.problem.resolved_at'),
-                close_notes:getVal('problem.close_notes')
-            };
-            
-            /* Add diagnostic info if PRB number not found */
-            if(!prbNumber){
-                data.prb._debug={
-                    iframe_found:!!frame,
-                    url:location.href,
-                    all_inputs:Array.from(doc.querySelectorAll('input[id*="number"],input[id*="problem"]')).map(e=>e.id).slice(0,10)
-                };
-            }
-            
-            /* Extract related incidents table */
-            data.incidents=[];
-            const table=doc.querySelector('[id*="related_incidents"]')||doc.querySelector('.list2_body');
-            if(table){
-                const rows=table.querySelectorAll('tr');
-                rows.forEach(r=>{
-                    const link=r.querySelector('a[href*="incident.do"]');
-                    if(link){
-                        data.incidents.push({
-                            number:link.textContent.trim(),
-                            short_description:(r.cells[2]||{}).textContent||''
-                        });
-                    }
-                });
-            }
-        }
-        else if(action.mode==='jira-scrape'){
-            /* Jira issue extraction */
-            data.jira={
-                key:document.querySelector('[data-testid="issue.views.issue-base.foundation.breadcrumbs.current-issue.item"]')?.textContent||
-                    location.pathname.match(/[A-Z]+-\\d+/)?.[0]||'',
-                summary:document.querySelector('[data-testid="issue.views.issue-base.foundation.summary.heading"]')?.textContent||
-                    document.querySelector('#summary-val')?.textContent||'',
-                status:document.querySelector('[data-testid="issue.views.issue-base.foundation.status.status-field-wrapper"]')?.textContent||
-                    document.querySelector('#status-val')?.textContent||''
-            };
-        }
-        
-        /* Send data to Waypoint */
-        const resp=await fetch(WAYPOINT+'/api/bookmarklet/data',{
-            method:'POST',
-            headers:{'Content-Type':'application/json'},
-            body:JSON.stringify(data)
-        });
-        const result=await resp.json();
-        
-        if(result.success){
-            let msg='✅ Data sent to Waypoint!\\n\\n';
-            if(data.prb){
-                msg+='PRB: '+(data.prb.number||'(not found)')+'\\n';
-                if(!data.prb.number&&data.prb._debug){
-                    msg+='\\nDEBUG INFO:\\n';
-                    msg+='URL: '+data.prb._debug.url+'\\n';
-                    msg+='IFrame found: '+data.prb._debug.iframe_found+'\\n';
-                    if(data.prb._debug.all_inputs.length>0){
-                        msg+='Found inputs: '+data.prb._debug.all_inputs.join(', ')+'\\n';
-                    }
-                }
-            }else{
-                msg+='Issue: '+(data.jira?.key||'Unknown')+'\\n';
-            }
-            msg+='Mode: '+action.mode;
-            alert(msg);
-        }else{
-            alert('❌ Error: '+result.error);
-        }
-    }catch(e){
-        alert('❌ Waypoint Error\\n\\n'+e.message+'\\n\\nMake sure Waypoint is running on http://127.0.0.1:5000');
-    }
-})();'''
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'text/javascript')
-        self._send_cors_headers()
-        self.end_headers()
-        self.wfile.write(script.encode())
+        self._send_text(200, BOOKMARKLET_SCRIPT_BYTES, 'text/javascript', cors=True)
     
     def handle_bookmarklet_data(self, data):
         """Receive data from bookmarklet"""
@@ -3101,12 +3419,10 @@ class SyncHandler(BaseHTTPRequestHandler):
         safe_print(f"[Bookmarklet] Workflow started: {workflow_type}, PRB: {prb_number}")
         
         # Get SNOW config for URL
-        config_path = os.path.join(DATA_DIR, 'config.yaml')
         snow_url = ''
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f) or {}
-                snow_url = config.get('servicenow', {}).get('base_url', '')
+            config = load_config() or {}
+            snow_url = config.get('servicenow', {}).get('base_url', '')
         except:
             pass
         
@@ -3131,11 +3447,7 @@ class SyncHandler(BaseHTTPRequestHandler):
             'has_data': bookmarklet_last_data is not None
         }
         
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self._send_cors_headers()
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode())
+        self._send_json(response, cors=True)
     
     def _handle_bookmarklet_status(self):
         """Check if bookmarklet data has arrived (for polling)"""
@@ -3149,3421 +3461,71 @@ class SyncHandler(BaseHTTPRequestHandler):
             'data': bookmarklet_last_data if has_data else None
         }
         
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self._send_cors_headers()
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode())
-
-
-# HTML Template (embedded)
-HTML_TEMPLATE = """
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Waypoint - Jira Administration</title>
-    <script src="/assets/js/html2canvas.min.js"></script>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 12px;
-            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-            overflow: hidden;
-        }
-        .header {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            text-align: center;
-        }
-        .header h1 {
-            font-size: 32px;
-            margin-bottom: 10px;
-        }
-        .header p {
-            opacity: 0.9;
-            font-size: 16px;
-        }
-        .tabs {
-            display: flex;
-            background: #F4F5F7;
-            border-bottom: 2px solid #DFE1E6;
-        }
-        .tab {
-            flex: 1;
-            padding: 15px;
-            text-align: center;
-            cursor: pointer;
-            background: transparent;
-            border: none;
-            font-size: 15px;
-            font-weight: 600;
-            color: #5E6C84;
-            transition: all 0.3s;
-        }
-        .tab:hover {
-            background: #EBECF0;
-        }
-        .tab.active {
-            background: white;
-            color: #0052CC;
-            border-bottom: 3px solid #0052CC;
-        }
-        .tab-content {
-            display: none;
-            padding: 30px;
-            max-width: 1400px;
-            margin: 0 auto;
-        }
-        .tab-content.active {
-            display: block;
-        }
-        #settings {
-            padding-left: 50px;
-        }
-        .card {
-            background: #F4F5F7;
-            border-radius: 8px;
-            padding: 20px;
-            margin-bottom: 20px;
-        }
-        .card h2 {
-            color: #172B4D;
-            font-size: 20px;
-            margin-bottom: 15px;
-        }
-        .card h3 {
-            color: #172B4D;
-            font-size: 16px;
-            margin-bottom: 10px;
-        }
-        .stat-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            margin-bottom: 20px;
-        }
-        .stat-card {
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            text-align: center;
-            border-left: 4px solid #0052CC;
-        }
-        .stat-value {
-            font-size: 32px;
-            font-weight: bold;
-            color: #172B4D;
-            margin-bottom: 5px;
-        }
-        .stat-label {
-            color: #5E6C84;
-            font-size: 14px;
-        }
-        .workflow-item {
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            margin-bottom: 15px;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        .workflow-info {
-            flex: 1;
-        }
-        .workflow-name {
-            font-size: 18px;
-            font-weight: 600;
-            color: #172B4D;
-            margin-bottom: 5px;
-        }
-        .workflow-desc {
-            color: #5E6C84;
-            font-size: 14px;
-            margin-bottom: 10px;
-        }
-        .workflow-schedule {
-            color: #0052CC;
-            font-size: 13px;
-            font-weight: 500;
-        }
-        .workflow-actions {
-            display: flex;
-            gap: 10px;
-        }
-        .input-group {
-            margin-bottom: 15px;
-        }
-        label {
-            display: block;
-            color: #5E6C84;
-            font-size: 13px;
-            font-weight: 600;
-            margin-bottom: 5px;
-        }
-        input, textarea, select {
-            width: 100%;
-            padding: 10px;
-            border: 2px solid #DFE1E6;
-            border-radius: 4px;
-            font-size: 14px;
-            transition: border-color 0.2s;
-        }
-        input:focus, textarea:focus, select:focus {
-            outline: none;
-            border-color: #0052CC;
-        }
-        textarea {
-            min-height: 80px;
-            font-family: 'Courier New', monospace;
-            resize: vertical;
-        }
-        button {
-            padding: 10px 20px;
-            background: #0052CC;
-            color: white;
-            border: none;
-            border-radius: 4px;
-            font-size: 14px;
-            font-weight: 600;
-            cursor: pointer;
-            transition: background 0.2s;
-        }
-        button:hover {
-            background: #0747A6;
-        }
-        button:disabled {
-            background: #B3D4FF;
-            cursor: not-allowed;
-        }
-        .btn-secondary {
-            background: #42526E;
-        }
-        .btn-secondary:hover {
-            background: #344563;
-        }
-        .btn-success {
-            background: #00875A;
-        }
-        .btn-success:hover {
-            background: #006644;
-        }
-        .btn-danger {
-            background: #DE350B;
-        }
-        .btn-danger:hover {
-            background: #BF2600;
-        }
-        .btn-small {
-            padding: 6px 12px;
-            font-size: 13px;
-        }
-        .toggle {
-            position: relative;
-            display: inline-block;
-            width: 50px;
-            height: 24px;
-        }
-        .toggle input {
-            opacity: 0;
-            width: 0;
-            height: 0;
-        }
-        .slider {
-            position: absolute;
-            cursor: pointer;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background-color: #ccc;
-            transition: .4s;
-            border-radius: 24px;
-        }
-        .slider:before {
-            position: absolute;
-            content: "";
-            height: 16px;
-            width: 16px;
-            left: 4px;
-            bottom: 4px;
-            background-color: white;
-            transition: .4s;
-            border-radius: 50%;
-        }
-        input:checked + .slider {
-            background-color: #0052CC;
-        }
-        input:checked + .slider:before {
-            transform: translateX(26px);
-        }
-        #status {
-            padding: 12px;
-            border-radius: 4px;
-            margin-bottom: 15px;
-            font-size: 13px;
-            display: none;
-        }
-        .status-info {
-            background: #DEEBFF;
-            color: #0747A6;
-            border-left: 4px solid #0052CC;
-        }
-        .status-success {
-            background: #E3FCEF;
-            color: #006644;
-            border-left: 4px solid #00875A;
-        }
-        .status-error {
-            background: #FFEBE6;
-            color: #BF2600;
-            border-left: 4px solid #DE350B;
-        }
-        .log-viewer {
-            background: #1e1e1e;
-            color: #d4d4d4;
-            padding: 15px;
-            border-radius: 4px;
-            font-family: 'Courier New', monospace;
-            font-size: 13px;
-            max-height: 400px;
-            overflow-y: auto;
-        }
-        .log-entry {
-            margin-bottom: 5px;
-        }
-        .log-info { color: #4FC3F7; }
-        .log-warn { color: #FFB74D; }
-        .log-error { color: #E57373; }
-        .log-success { color: #81C784; }
-        .favorite-item {
-            background: white;
-            padding: 15px;
-            border-radius: 8px;
-            margin-bottom: 10px;
-            border-left: 4px solid #00875A;
-        }
-        .favorite-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 10px;
-        }
-        .favorite-name {
-            font-size: 16px;
-            font-weight: 600;
-            color: #172B4D;
-        }
-        .favorite-desc {
-            color: #5E6C84;
-            font-size: 13px;
-            margin-bottom: 8px;
-        }
-        .favorite-jql {
-            background: #F4F5F7;
-            padding: 8px;
-            border-radius: 4px;
-            font-family: 'Courier New', monospace;
-            font-size: 12px;
-            color: #172B4D;
-        }
-        .feature-card {
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            margin-bottom: 15px;
-            border-left: 4px solid #0052CC;
-        }
-        .feature-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: start;
-            margin-bottom: 15px;
-        }
-        .feature-title {
-            font-size: 18px;
-            font-weight: 600;
-            color: #172B4D;
-            margin-bottom: 5px;
-        }
-        .feature-key {
-            color: #5E6C84;
-            font-size: 13px;
-            font-family: 'Courier New', monospace;
-        }
-        .feature-progress {
-            text-align: right;
-        }
-        .progress-bar {
-            width: 120px;
-            height: 8px;
-            background: #DFE1E6;
-            border-radius: 4px;
-            overflow: hidden;
-            margin-bottom: 5px;
-        }
-        .progress-fill {
-            height: 100%;
-            background: #00875A;
-            transition: width 0.3s;
-        }
-        .progress-text {
-            font-size: 12px;
-            color: #5E6C84;
-        }
-        .child-issues {
-            margin-top: 10px;
-            padding-top: 10px;
-            border-top: 1px solid #DFE1E6;
-        }
-        .child-issue {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 8px 0;
-            border-bottom: 1px solid #F4F5F7;
-        }
-        .child-issue:last-child {
-            border-bottom: none;
-        }
-        .child-issue-info {
-            flex: 1;
-        }
-        .child-issue-key {
-            font-family: 'Courier New', monospace;
-            font-size: 12px;
-            color: #5E6C84;
-            margin-right: 8px;
-        }
-        .child-issue-summary {
-            font-size: 14px;
-            color: #172B4D;
-        }
-        .child-issue-status {
-            padding: 4px 8px;
-            border-radius: 3px;
-            font-size: 11px;
-            font-weight: 600;
-            text-transform: uppercase;
-        }
-        .status-todo {
-            background: #DFE1E6;
-            color: #42526E;
-        }
-        .status-inprogress {
-            background: #DEEBFF;
-            color: #0052CC;
-        }
-        .status-review {
-            background: #FFF0B3;
-            color: #7A5C00;
-        }
-        .status-done {
-            background: #E3FCEF;
-            color: #006644;
-        }
-        .status-blocked {
-            background: #FFEBE6;
-            color: #BF2600;
-        }
-        .expand-toggle {
-            background: none;
-            border: none;
-            color: #0052CC;
-            cursor: pointer;
-            font-size: 18px;
-            padding: 0 8px;
-        }
-        .canvas-card {
-            position: absolute;
-            width: 220px;
-            background: white;
-            border-radius: 8px;
-            padding: 12px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.15);
-            cursor: move;
-            transition: box-shadow 0.2s;
-            z-index: 10;
-        }
-        .canvas-card:hover {
-            box-shadow: 0 4px 16px rgba(0,0,0,0.25);
-            z-index: 20;
-        }
-        .canvas-card.selected {
-            box-shadow: 0 0 0 3px #0052CC;
-            z-index: 30;
-        }
-        .canvas-card.blocked {
-            border-left: 4px solid #DE350B;
-        }
-        .canvas-card-key {
-            font-family: 'Courier New', monospace;
-            font-size: 11px;
-            color: #0052CC;
-            font-weight: 600;
-            margin-bottom: 4px;
-        }
-        .canvas-card-summary {
-            font-size: 13px;
-            color: #172B4D;
-            line-height: 1.3;
-            margin-bottom: 6px;
-            overflow: hidden;
-            text-overflow: ellipsis;
-            display: -webkit-box;
-            -webkit-line-clamp: 2;
-            -webkit-box-orient: vertical;
-        }
-        .canvas-card-status {
-            font-size: 10px;
-            padding: 3px 6px;
-            border-radius: 3px;
-            display: inline-block;
-        }
-        .canvas-card-links {
-            font-size: 10px;
-            color: #5E6C84;
-            margin-top: 6px;
-            padding-top: 6px;
-            border-top: 1px solid #DFE1E6;
-        }
-        #dependency-canvas-container {
-            cursor: grab;
-        }
-        #dependency-canvas-container.dragging {
-            cursor: grabbing;
-        }
-        .persona-card {
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            text-align: center;
-            cursor: pointer;
-            transition: all 0.3s;
-            border: 2px solid #DFE1E6;
-        }
-        .persona-card:hover {
-            border-color: #0052CC;
-            box-shadow: 0 4px 12px rgba(0,82,204,0.2);
-            transform: translateY(-2px);
-        }
-        .persona-card.selected {
-            border-color: #00875A;
-            background: #E3FCEF;
-        }
-        .persona-title {
-            font-size: 18px;
-            font-weight: 600;
-            color: #172B4D;
-            margin-bottom: 8px;
-        }
-        .persona-desc {
-            font-size: 13px;
-            color: #5E6C84;
-            line-height: 1.4;
-        }
-        
-        /* Feedback System Styles */
-        .feedback-floating-btn {
-            position: fixed;
-            bottom: 30px;
-            right: 30px;
-            width: 60px;
-            height: 60px;
-            border-radius: 50%;
-            background: linear-gradient(135deg, #DE350B 0%, #FF5630 100%);
-            color: white;
-            font-size: 28px;
-            border: none;
-            cursor: pointer;
-            box-shadow: 0 4px 12px rgba(222, 53, 11, 0.4);
-            z-index: 999;
-            transition: all 0.3s;
-        }
-        .feedback-floating-btn:hover {
-            transform: scale(1.1);
-            box-shadow: 0 6px 20px rgba(222, 53, 11, 0.6);
-        }
-        .modal {
-            display: none;
-            position: fixed;
-            z-index: 1000;
-            left: 0;
-            top: 0;
-            width: 100%;
-            height: 100%;
-            background-color: rgba(0,0,0,0.5);
-            animation: fadeIn 0.3s;
-        }
-        @keyframes fadeIn {
-            from { opacity: 0; }
-            to { opacity: 1; }
-        }
-        .modal-content {
-            background-color: white;
-            margin: 5% auto;
-            padding: 0;
-            border-radius: 12px;
-            max-width: 700px;
-            max-height: 85vh;
-            overflow-y: auto;
-            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-            animation: slideDown 0.3s;
-        }
-        @keyframes slideDown {
-            from { transform: translateY(-50px); opacity: 0; }
-            to { transform: translateY(0); opacity: 1; }
-        }
-        .modal-header {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 20px 30px;
-            border-radius: 12px 12px 0 0;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        .modal-header h2 {
-            margin: 0;
-            font-size: 24px;
-        }
-        .modal-close {
-            font-size: 32px;
-            font-weight: 300;
-            cursor: pointer;
-            opacity: 0.8;
-            transition: opacity 0.2s;
-        }
-        .modal-close:hover {
-            opacity: 1;
-        }
-        .modal-body {
-            padding: 30px;
-        }
-        .recording-pulse {
-            display: inline-block;
-            animation: pulse 1s infinite;
-        }
-        @keyframes pulse {
-            0%, 100% { opacity: 1; }
-            50% { opacity: 0.3; }
-        }
-        .attachment-preview {
-            display: inline-block;
-            margin: 5px;
-            padding: 10px;
-            background: #F4F5F7;
-            border-radius: 4px;
-            border: 2px solid #DFE1E6;
-        }
-        .attachment-preview img {
-            max-width: 150px;
-            max-height: 150px;
-            display: block;
-            margin-bottom: 5px;
-            border-radius: 4px;
-        }
-        .attachment-preview video {
-            max-width: 200px;
-            max-height: 150px;
-            display: block;
-            margin-bottom: 5px;
-            border-radius: 4px;
-        }
-        .attachment-preview button {
-            font-size: 11px;
-            padding: 4px 8px;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🧭 Waypoint</h1>
-            <p>Simplifying Jira administration and team flow</p>
-        </div>
-
-        <div class="tabs">
-            <button class="tab active" onclick="switchTab('dashboard', event)">📊 Dashboard</button>
-            <button class="tab" onclick="switchTab('po', event)">👔 PO</button>
-            <button class="tab" onclick="switchTab('dev', event)">💻 Dev</button>
-            <button class="tab" onclick="switchTab('sm', event)">📈 SM</button>
-            <button class="tab" onclick="switchTab('workflows', event)">⚙️ Workflows</button>
-            <button class="tab" onclick="switchTab('favorites', event)">⭐ Favorites</button>
-            <button class="tab" onclick="switchTab('logs', event)">📋 Logs</button>
-            <button class="tab" onclick="switchTab('settings', event)">🔧 Settings</button>
-        </div>
-
-        <div id="status"></div>
-
-        <!-- DASHBOARD TAB -->
-        <div id="dashboard" class="tab-content active">
-            <!-- Persona Selection Card -->
-            <div class="card">
-                <h2>Welcome! Select Your Primary Role</h2>
-                <p style="color: #5E6C84; margin-bottom: 15px;">
-                    Choose your role to see relevant quick actions on the dashboard. You can always access all features from the tabs above.
-                </p>
-                <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 15px;">
-                    <div class="persona-card" onclick="selectPersona('po')">
-                        <div style="font-size: 48px; margin-bottom: 10px;">👔</div>
-                        <div class="persona-title">Product Owner</div>
-                        <div class="persona-desc">Track features, visualize dependencies, export reports</div>
-                    </div>
-                    <div class="persona-card" onclick="selectPersona('dev')">
-                        <div style="font-size: 48px; margin-bottom: 10px;">💻</div>
-                        <div class="persona-title">Developer</div>
-                        <div class="persona-desc">Automate Jira updates from GitHub, reduce admin work</div>
-                    </div>
-                    <div class="persona-card" onclick="selectPersona('sm')">
-                        <div style="font-size: 48px; margin-bottom: 10px;">📈</div>
-                        <div class="persona-title">Scrum Master</div>
-                        <div class="persona-desc">Team metrics, hygiene reports, insights</div>
-                    </div>
-                </div>
-            </div>
-
-            <div class="card">
-                <h2>System Status</h2>
-                <div class="stat-grid">
-                    <div class="stat-card">
-                        <div class="stat-value" id="stat-status">●</div>
-                        <div class="stat-label">System Status</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-value" id="stat-updated">0</div>
-                        <div class="stat-label">Tickets Updated Today</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-value" id="stat-last-run">Never</div>
-                        <div class="stat-label">Last Sync</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-value" id="stat-workflows">0</div>
-                        <div class="stat-label">Active Workflows</div>
-                    </div>
-                </div>
-            </div>
+        self._send_json(response, cors=True)
 
-            <!-- Dynamic persona-specific quick actions -->
-            <div id="persona-quick-actions" class="card" style="display: none;">
-                <h2 id="persona-actions-title">Quick Actions</h2>
-                <div id="persona-actions-content"></div>
-            </div>
 
-            <div class="card">
-                <h2>Quick Actions</h2>
-                <div style="display: flex; gap: 10px; flex-wrap: wrap;">
-                    <button onclick="initializeBrowser()" class="btn-success">
-                        🚀 Initialize Browser
-                    </button>
-                    <button onclick="syncNow()" id="btn-sync-now">
-                        🔄 Sync Now
-                    </button>
-                    <button onclick="startScheduler()" id="btn-start-scheduler" class="btn-secondary">
-                        ⏰ Start Scheduler
-                    </button>
-                    <button onclick="stopScheduler()" id="btn-stop-scheduler" class="btn-danger">
-                        ⏹️ Stop Scheduler
-                    </button>
-                </div>
-            </div>
-
-            <div class="card">
-                <h2>Recent Activity</h2>
-                <div id="recent-activity" class="log-viewer">
-                    <div class="log-entry log-info">Waiting for first sync...</div>
-                </div>
-            </div>
-        </div>
-
-        <!-- PO TAB -->
-        <div id="po" class="tab-content">
-            <div class="card">
-                <h2>Team Mode</h2>
-                <div style="display: flex; gap: 15px; align-items: center; margin-bottom: 15px;">
-                    <label style="display: flex; align-items: center; gap: 8px; cursor: pointer;">
-                        <input type="radio" name="team-mode" value="scrum" onchange="toggleTeamMode('scrum')">
-                        <span>🏃 Scrum (Sprint-based)</span>
-                    </label>
-                    <label style="display: flex; align-items: center; gap: 8px; cursor: pointer;">
-                        <input type="radio" name="team-mode" value="kanban" checked onchange="toggleTeamMode('kanban')">
-                        <span>🌊 Kanban (Flow-based)</span>
-                    </label>
-                </div>
-            </div>
-
-            <!-- Scrum-specific metrics -->
-            <div id="scrum-metrics" class="card" style="display: none;">
-                <h2>Sprint Overview</h2>
-                <div class="stat-grid">
-                    <div class="stat-card">
-                        <div class="stat-value" id="po-sprint-name">Sprint 24</div>
-                        <div class="stat-label">Current Sprint</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-value" id="po-sprint-progress">65%</div>
-                        <div class="stat-label">Sprint Progress</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-value" id="po-velocity-current">38</div>
-                        <div class="stat-label">Velocity</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-value" id="po-sprint-days">5</div>
-                        <div class="stat-label">Days Remaining</div>
-                    </div>
-                </div>
-            </div>
-
-            <!-- Kanban-specific metrics -->
-            <div id="kanban-metrics" class="card">
-                <h2>Flow Metrics</h2>
-                <div class="stat-grid">
-                    <div class="stat-card">
-                        <div class="stat-value" id="po-wip-count">8</div>
-                        <div class="stat-label">WIP (Work in Progress)</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-value" id="po-cycle-time">4.2</div>
-                        <div class="stat-label">Avg Cycle Time (days)</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-value" id="po-throughput">12</div>
-                        <div class="stat-label">Weekly Throughput</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-value" id="po-blocked-count">2</div>
-                        <div class="stat-label">Blocked Items</div>
-                    </div>
-                </div>
-            </div>
-
-            <div class="card">
-                <h2>Features & Epics</h2>
-                <div style="margin-bottom: 15px; display: flex; gap: 10px; align-items: center;">
-                    <input type="text" id="feature-search" placeholder="Search features..." style="flex: 1;">
-                    <select id="feature-filter" style="width: auto;">
-                        <option value="all">All Features</option>
-                        <option value="in-progress">In Progress</option>
-                        <option value="completed">Completed</option>
-                        <option value="blocked">Blocked</option>
-                    </select>
-                    <button class="btn-small" onclick="refreshFeatures()">🔄 Refresh</button>
-                    <button class="btn-small btn-success" onclick="exportFeatures()">📥 Export CSV</button>
-                </div>
-                <div id="po-features-list">
-                    <!-- Populated by JavaScript -->
-                </div>
-            </div>
-
-            <div class="card">
-                <h2>Dependency Canvas</h2>
-                <p style="color: #5E6C84; margin-bottom: 15px;">
-                    Visualize issue dependencies and blockers. Provide a data structure to load dependencies.
-                </p>
-                
-                <!-- Data Input Section -->
-                <div style="background: #FFF4E5; border-left: 4px solid #FF991F; padding: 15px; margin-bottom: 15px; border-radius: 4px;">
-                    <h3 style="margin: 0 0 10px 0; color: #172B4D; font-size: 14px;">📋 Data Setup Required</h3>
-                    <p style="color: #5E6C84; font-size: 13px; margin-bottom: 10px;">
-                        Create a JSON file with your issue dependencies and provide the URL or upload it below.
-                    </p>
-                    <details style="margin-bottom: 10px;">
-                        <summary style="cursor: pointer; color: #0052CC; font-weight: 600; font-size: 13px;">
-                            📖 Show JSON Schema Example
-                        </summary>
-                        <pre style="background: white; padding: 10px; border-radius: 4px; margin-top: 10px; font-size: 11px; overflow-x: auto;">{
-  "PROJ-100": {
-    "key": "PROJ-100",
-    "summary": "User Authentication System",
-    "status": "inprogress",
-    "links": [
-      { "type": "blocks", "target": "PROJ-101" },
-      { "type": "depends", "target": "PROJ-200" }
-    ]
-  },
-  "PROJ-101": {
-    "key": "PROJ-101",
-    "summary": "OAuth2 Integration",
-    "status": "blocked",
-    "links": [
-      { "type": "blocked-by", "target": "PROJ-100" }
-    ]
-  }
+# POST endpoints that read the request and write the response themselves
+# (multipart uploads, non-JSON bodies, their own status codes)
+RAW_POST_ROUTES = {
+    '/log_frontend': SyncHandler._handle_frontend_logs,
+    '/api/feedback/console-log': SyncHandler._handle_console_log,
+    '/api/feedback/network-error': SyncHandler._handle_network_error,
+    '/api/import/csv': SyncHandler._handle_csv_upload,
+    '/api/import/save-mapping': SyncHandler._handle_save_mapping,
+    '/api/import/mappings': SyncHandler._handle_get_mappings,
+    '/api/import/process': SyncHandler._handle_process_csv,
+    '/api/feedback/submit': SyncHandler._handle_feedback_submit,  # multipart form data
 }
 
-Link Types: "blocks", "blocked-by", "depends", "required-by", "relates"
-Status: "todo", "inprogress", "review", "blocked", "done"</pre>
-                    </details>
-                    <div style="display: flex; gap: 10px;">
-                        <input type="text" id="canvas-data-url" placeholder="Paste URL to JSON file..." style="flex: 1;">
-                        <button class="btn-small btn-success" onclick="loadDependencyData()">📥 Load from URL</button>
-                        <label class="btn-small btn-secondary" style="margin: 0; cursor: pointer;">
-                            📁 Upload File
-                            <input type="file" id="canvas-data-file" accept=".json" style="display: none;" onchange="loadDependencyFile()">
-                        </label>
-                    </div>
-                </div>
+# JSON POST endpoints: path -> (handler, takes_data). do_POST parses the body,
+# calls the handler and sends its dict back. Handlers are resolved once here
+# rather than looked up on the instance for every request.
+POST_ROUTES = {
+    '/api/sync-now': (SyncHandler.handle_sync_now, False),
+    '/api/start-scheduler': (SyncHandler.handle_start_scheduler, False),
+    '/api/stop-scheduler': (SyncHandler.handle_stop_scheduler, False),
+    '/api/config': (SyncHandler.handle_save_config, True),
+    '/api/save-config': (SyncHandler.handle_save_config, True),
+    '/api/insights/resolve': (SyncHandler.handle_resolve_insight, True),
+    '/api/insights/run': (SyncHandler.handle_run_insights, True),
+    '/api/feedback/save-token': (SyncHandler.handle_save_feedback_token, True),
+    # Extension system endpoints (per-extension routes: EXTENSION_ROUTE_RE)
+    '/api/extensions': (SyncHandler._handle_list_extensions, False),
+    # Data import/export endpoints
+    '/api/data/import': (SyncHandler._handle_data_import, True),
+    '/api/data/export': (SyncHandler._handle_data_export, True),
+    '/api/data/features': (SyncHandler._handle_get_features, False),
+    '/api/data/dependencies': (SyncHandler._handle_get_dependencies, False),
+    # Update checker endpoints
+    '/api/updates/check': (SyncHandler._handle_check_updates, False),
+    '/api/updates/apply': (SyncHandler._handle_apply_update, True),
+    '/api/app/restart': (SyncHandler._handle_app_restart, False),
+    # Jira-specific endpoints
+    '/api/jira/query': (SyncHandler._handle_jira_query, True),
+    '/api/jira/update': (SyncHandler._handle_jira_update, True),
+    '/api/jira/bulk-update': (SyncHandler._handle_jira_bulk_update, True),
+    '/api/jira/test-connection': (SyncHandler._handle_jira_test_connection, False),
+    # Reporting endpoints
+    '/api/reports/daily-scrum': (SyncHandler._handle_daily_scrum_report, True),
+    '/api/reports/generate': (SyncHandler._handle_generate_report, True),
+    '/api/reports/insights': (SyncHandler._handle_get_insights, False),
+    '/api/integrations/save': (SyncHandler.handle_save_integrations, True),
+    '/api/integrations/test-github': (SyncHandler.handle_test_github_connection, True),
+    '/api/automation/save': (SyncHandler.handle_save_automation_rules, True),
+    '/api/selenium/open-jira': (SyncHandler.handle_open_jira_browser, True),
+    '/api/selenium/check-login': (SyncHandler.handle_check_jira_login, False),
+    '/api/po/load-data': (SyncHandler.handle_load_po_data, True),
+    '/api/sm/scrape-metrics': (SyncHandler.handle_scrape_sm_metrics, True),
+    '/api/snow-jira/save-config': (SyncHandler.handle_save_snow_config, True),
+    '/api/snow-jira/test-connection': (SyncHandler.handle_test_snow_connection, False),
+    '/api/export-logs': (SyncHandler.handle_export_logs, False),
+    '/api/snow-jira/validate-prb': (SyncHandler.handle_validate_prb, True),
+    '/api/snow-jira/sync': (SyncHandler.handle_snow_jira_sync, True),
+    '/api/bookmarklet/data': (SyncHandler.handle_bookmarklet_data, True),
+    '/api/bookmarklet/mode': (SyncHandler.handle_bookmarklet_mode, True),
+    '/api/bookmarklet/start-workflow': (SyncHandler.handle_start_bookmarklet_workflow, True),
+}
 
-                <div style="margin-bottom: 15px; display: flex; gap: 10px; align-items: center;">
-                    <input type="text" id="canvas-issue-key" placeholder="Enter issue key to focus (e.g., PROJ-100)" style="flex: 1;">
-                    <button class="btn-small btn-success" onclick="loadIssueDependencies()">📊 Load Issue</button>
-                    <button class="btn-small btn-secondary" onclick="clearCanvas()">🗑️ Clear Canvas</button>
-                    <button class="btn-small" onclick="resetCanvasZoom()">🔍 Reset View</button>
-                    <button class="btn-small" onclick="exportCanvasImage()">📸 Export PNG</button>
-                </div>
-                <div id="dependency-canvas-container" style="position: relative; width: 100%; height: 600px; background: #F4F5F7; border-radius: 8px; overflow: hidden;">
-                    <canvas id="dependency-canvas" style="position: absolute; top: 0; left: 0;"></canvas>
-                    <svg id="dependency-svg" style="position: absolute; top: 0; left: 0; pointer-events: none;"></svg>
-                    <div id="canvas-cards" style="position: absolute; top: 0; left: 0; width: 100%; height: 100%;"></div>
-                </div>
-                <div style="margin-top: 15px; padding: 10px; background: white; border-radius: 4px; font-size: 12px;">
-                    <strong>Legend:</strong>
-                    <span style="margin-left: 15px;">🔴 Blocks/Blocked</span>
-                    <span style="margin-left: 15px;">🟢 Depends On (numbered)</span>
-                    <span style="margin-left: 15px;">🔵 Related</span>
-                </div>
-            </div>
-        </div>
-
-        <!-- DEV TAB -->
-        <div id="dev" class="tab-content">
-            <div class="card">
-                <h2>GitHub → Jira Automation</h2>
-                <p style="color: #5E6C84; margin-bottom: 15px;">
-                    Reduce administrative burden by automatically syncing GitHub PRs to Jira tickets.
-                </p>
-                <div class="stat-grid">
-                    <div class="stat-card">
-                        <div class="stat-value" id="dev-prs-synced">0</div>
-                        <div class="stat-label">PRs Synced Today</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-value" id="dev-tickets-updated">0</div>
-                        <div class="stat-label">Tickets Auto-Updated</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-value" id="dev-last-sync">Never</div>
-                        <div class="stat-label">Last Sync</div>
-                    </div>
-                </div>
-            </div>
-
-            <div class="card">
-                <h2>Automation Rules</h2>
-                <div class="workflow-item">
-                    <div class="workflow-info">
-                        <div class="workflow-name">PR Merged → Move to Done</div>
-                        <div class="workflow-desc">Automatically move Jira ticket to "Done" when PR is merged</div>
-                    </div>
-                    <label class="toggle">
-                        <input type="checkbox" checked>
-                        <span class="slider"></span>
-                    </label>
-                </div>
-                <div class="workflow-item">
-                    <div class="workflow-info">
-                        <div class="workflow-name">PR Opened → Add Comment</div>
-                        <div class="workflow-desc">Add PR link as comment to linked Jira ticket</div>
-                    </div>
-                    <label class="toggle">
-                        <input type="checkbox" checked>
-                        <span class="slider"></span>
-                    </label>
-                </div>
-                <div class="workflow-item">
-                    <div class="workflow-info">
-                        <div class="workflow-name">PR Approved → Update Status</div>
-                        <div class="workflow-desc">Move ticket to "Ready for Deploy" when PR is approved</div>
-                    </div>
-                    <label class="toggle">
-                        <input type="checkbox">
-                        <span class="slider"></span>
-                    </label>
-                </div>
-            </div>
-
-            <div class="card">
-                <h2>Manual Sync</h2>
-                <div style="display: flex; gap: 10px; flex-wrap: wrap;">
-                    <button class="btn-success" onclick="syncGitHubToJira()">🔄 Sync All PRs</button>
-                    <button class="btn-secondary" onclick="viewSyncLog()">📋 View Sync Log</button>
-                </div>
-            </div>
-        </div>
-
-        <!-- SM TAB -->
-        <div id="sm" class="tab-content">
-            <div class="card">
-                <h2>Team Health Overview</h2>
-                <div class="stat-grid">
-                    <div class="stat-card" style="border-left-color: #00875A;">
-                        <div class="stat-value" id="sm-health-score">85</div>
-                        <div class="stat-label">Health Score</div>
-                    </div>
-                    <div class="stat-card" style="border-left-color: #FF991F;">
-                        <div class="stat-value" id="sm-stale-tickets">7</div>
-                        <div class="stat-label">Stale Tickets</div>
-                    </div>
-                    <div class="stat-card" style="border-left-color: #DE350B;">
-                        <div class="stat-value" id="sm-hygiene-issues">12</div>
-                        <div class="stat-label">Hygiene Issues</div>
-                    </div>
-                    <div class="stat-card" style="border-left-color: #0052CC;">
-                        <div class="stat-value" id="sm-velocity">42</div>
-                        <div class="stat-label">Avg Velocity</div>
-                    </div>
-                </div>
-            </div>
-
-            <div class="card">
-                <h2>📊 Insights</h2>
-                <p style="color: #5E6C84; margin-bottom: 15px;">
-                    Insights generated from your team's data. Click to see details.
-                </p>
-                <div id="sm-insights">
-                    <div class="favorite-item" style="border-left-color: #FF991F;">
-                        <div class="favorite-header">
-                            <div class="favorite-name">⚠️ Scope Creep Detected</div>
-                            <button class="btn-small" onclick="viewInsight('scope-creep')">View Details</button>
-                        </div>
-                        <div class="favorite-desc">
-                            3 stories in current sprint have grown by 40% in story points after sprint start.
-                        </div>
-                    </div>
-                    <div class="favorite-item" style="border-left-color: #DE350B;">
-                        <div class="favorite-header">
-                            <div class="favorite-name">🐛 Defect Leakage Alert</div>
-                            <button class="btn-small" onclick="viewInsight('defect-leakage')">View Details</button>
-                        </div>
-                        <div class="favorite-desc">
-                            5 production bugs found in stories marked "Done" last sprint. Review QA process.
-                        </div>
-                    </div>
-                    <div class="favorite-item" style="border-left-color: #0052CC;">
-                        <div class="favorite-header">
-                            <div class="favorite-name">📊 Velocity Trend</div>
-                            <button class="btn-small" onclick="viewInsight('velocity')">View Details</button>
-                        </div>
-                        <div class="favorite-desc">
-                            Team velocity has been stable at 40-45 points for last 4 sprints. Predictable delivery.
-                        </div>
-                    </div>
-                </div>
-            </div>
-
-            <div class="card">
-                <h2>Hygiene Report</h2>
-                <div style="margin-bottom: 15px;">
-                    <button class="btn-small btn-success" onclick="runHygieneCheck()">🔍 Run Check</button>
-                    <button class="btn-small" onclick="exportHygieneReport()">📥 Export Report</button>
-                </div>
-                <div id="sm-hygiene-report">
-                    <!-- Populated by JavaScript -->
-                </div>
-            </div>
-        </div>
-
-        <!-- WORKFLOWS TAB -->
-        <div id="workflows" class="tab-content">
-            <div class="card">
-                <h2>Automation Rules</h2>
-                <p style="color: #5E6C84; margin-bottom: 20px;">
-                    Define what happens when GitHub events occur. Changes save automatically.
-                </p>
-                
-                <!-- PR Opened Rules -->
-                <div style="margin-bottom: 30px; border-left: 4px solid #0052CC; padding-left: 15px;">
-                    <h3 style="margin-bottom: 10px;">🆕 PR Opened/Created</h3>
-                    <div class="input-group">
-                        <label style="display: flex; align-items: center; gap: 10px;">
-                            <input type="checkbox" id="pr-opened-enabled" onchange="saveAutomationRules()">
-                            <span>Enable this rule</span>
-                        </label>
-                    </div>
-                    <div class="input-group">
-                        <label>Move ticket to status:</label>
-                        <input type="text" id="pr-opened-status" placeholder="In Review" onchange="saveAutomationRules()">
-                        <small style="color: #5E6C84;">Status name must match Jira exactly</small>
-                    </div>
-                    <div class="input-group">
-                        <label>Add label:</label>
-                        <input type="text" id="pr-opened-label" placeholder="has-pr" onchange="saveAutomationRules()">
-                    </div>
-                    <div class="input-group">
-                        <label>
-                            <input type="checkbox" id="pr-opened-comment" onchange="saveAutomationRules()">
-                            Add comment to ticket
-                        </label>
-                    </div>
-                </div>
-                
-                <!-- PR Merged Rules -->
-                <div style="margin-bottom: 30px; border-left: 4px solid #00875A; padding-left: 15px;">
-                    <h3 style="margin-bottom: 10px;">✅ PR Merged (Branch-Specific)</h3>
-                    <p style="color: #5E6C84; font-size: 13px; margin-bottom: 15px;">
-                        Different actions based on which branch the PR was merged into.
-                    </p>
-                    
-                    <div id="branch-rules-list">
-                        <!-- Populated by JavaScript -->
-                    </div>
-                    
-                    <button onclick="addBranchRule()" class="btn-small">+ Add Branch Rule</button>
-                </div>
-                
-                <!-- PR Closed Rules -->
-                <div style="margin-bottom: 30px; border-left: 4px solid #DE350B; padding-left: 15px;">
-                    <h3 style="margin-bottom: 10px;">❌ PR Closed (Not Merged)</h3>
-                    <div class="input-group">
-                        <label style="display: flex; align-items: center; gap: 10px;">
-                            <input type="checkbox" id="pr-closed-enabled" onchange="saveAutomationRules()">
-                            <span>Enable this rule</span>
-                        </label>
-                    </div>
-                    <div class="input-group">
-                        <label>Add label:</label>
-                        <input type="text" id="pr-closed-label" placeholder="pr-closed" onchange="saveAutomationRules()">
-                    </div>
-                    <div class="input-group">
-                        <label>
-                            <input type="checkbox" id="pr-closed-comment" onchange="saveAutomationRules()">
-                            Add comment to ticket
-                        </label>
-                    </div>
-                </div>
-            </div>
-        </div>
-
-        <!-- FAVORITES TAB -->
-        <div id="favorites" class="tab-content">
-            <div class="card">
-                <h2>Saved Favorites</h2>
-                <p style="color: #5E6C84; margin-bottom: 20px;">
-                    Quick-run saved tasks for common operations.
-                </p>
-                <div id="favorites-list">
-                    <!-- Populated by JavaScript -->
-                </div>
-            </div>
-        </div>
-
-        <!-- LOGS TAB -->
-        <div id="logs" class="tab-content">
-            <div class="card">
-                <h2>System Logs</h2>
-                <div style="margin-bottom: 15px; display: flex; gap: 10px;">
-                    <button onclick="refreshLogs()" class="btn-small">🔄 Refresh</button>
-                    <button onclick="clearLogs()" class="btn-small btn-secondary">🗑️ Clear</button>
-                    <select id="log-level" onchange="filterLogs()" style="width: auto;">
-                        <option value="all">All Levels</option>
-                        <option value="info">INFO</option>
-                        <option value="warn">WARN</option>
-                        <option value="error">ERROR</option>
-                    </select>
-                </div>
-                <div id="logs-viewer" class="log-viewer">
-                    <div class="log-entry log-info">System initialized. Waiting for actions...</div>
-                </div>
-            </div>
-        </div>
-
-        <!-- SETTINGS TAB -->
-        <div id="settings" class="tab-content">
-            <div class="card">
-                <h2>Configuration</h2>
-                <div class="input-group">
-                    <label>Jira Base URL</label>
-                    <input type="text" id="setting-jira-url" placeholder="https://your-company.atlassian.net">
-                </div>
-                <div class="input-group">
-                    <label>GitHub Organization</label>
-                    <input type="text" id="setting-github-org" placeholder="your-org">
-                </div>
-                <div class="input-group">
-                    <label>GitHub Repositories (comma-separated)</label>
-                    <input type="text" id="setting-github-repos" placeholder="repo1, repo2, repo3">
-                </div>
-                <button onclick="saveSettings()" class="btn-success">💾 Save Settings</button>
-                <button onclick="testJiraConnection()" class="btn-secondary" style="margin-left: 10px;">
-                    🔗 Test Jira Connection
-                </button>
-            </div>
-
-            <div class="card">
-                <h2>ServiceNow Integration</h2>
-                <div class="input-group">
-                    <label>ServiceNow URL</label>
-                    <input type="text" id="setting-snow-url" placeholder="https://yourcompany.service-now.com">
-                </div>
-                <div class="input-group">
-                    <label>Jira Project Key (for PRB sync)</label>
-                    <input type="text" id="setting-snow-jira-project" placeholder="PROJ">
-                </div>
-                <button onclick="saveSnowConfig()" class="btn-success">💾 Save ServiceNow Config</button>
-                <button onclick="testSnowConnection()" class="btn-secondary" style="margin-left: 10px;">
-                    🔗 Test Connection
-                </button>
-                
-                <div style="margin-top: 20px; padding-top: 20px; border-top: 1px solid #DFE1E6;">
-                    <h3 style="margin-bottom: 10px;">PRB Validation Test</h3>
-                    <p style="color: #5E6C84; font-size: 13px; margin-bottom: 10px;">
-                        Test PRB validation by entering a PRB number below. The browser will auto-launch if needed.
-                    </p>
-                    <div class="input-group">
-                        <label>PRB Number</label>
-                        <input type="text" id="test-prb-number" placeholder="PRB0123456">
-                    </div>
-                    <button onclick="validateTestPRB()" class="btn-success">✅ Validate PRB</button>
-                    <div id="prb-validation-result" style="margin-top: 15px; display: none;"></div>
-                </div>
-            </div>
-
-            <div class="card">
-                <h2>Advanced</h2>
-                <button onclick="editConfig()" class="btn-secondary">📝 Edit config.yaml</button>
-                <button onclick="viewLogs()" class="btn-secondary" style="margin-left: 10px;">
-                    📄 View Log File
-                </button>
-            </div>
-        </div>
-    </div>
-
-    <!-- Floating Feedback Button -->
-    <button id="feedback-btn" class="feedback-floating-btn">
-        🐛
-    </button>
-
-    <!-- Feedback Modal -->
-    <div id="feedback-modal" class="modal">
-        <div class="modal-content">
-            <div class="modal-header">
-                <h2>📝 Report Feedback</h2>
-                <button 
-                    class="btn-close" 
-                    onclick="minimizeFeedbackModal()"
-                    title="Minimize (keeps your input)"
-                    style="display: flex; align-items: center; justify-content: center; background: transparent; border: none; color: white; cursor: pointer; font-size: 24px; padding: 0; width: 32px; height: 32px;"
-                >
-                    <span style="line-height: 1;">−</span>
-                </button>
-            </div>
-            <div class="modal-body">
-                <div class="input-group">
-                    <label>Title *</label>
-                    <input type="text" id="feedback-title" placeholder="Brief description of the issue">
-                </div>
-                
-                <div class="input-group">
-                    <label>Description *</label>
-                    <textarea id="feedback-description" placeholder="Please describe what happened, what you expected, and steps to reproduce..." rows="6"></textarea>
-                </div>
-                
-                <div class="input-group">
-                    <label style="display: flex; align-items: center; gap: 8px;">
-                        <input type="checkbox" id="feedback-include-logs" checked>
-                        <span>Include logs (last 5 minutes)</span>
-                    </label>
-                </div>
-                
-                <div style="display: flex; gap: 10px; margin: 20px 0;">
-                    <button class="btn-secondary btn-small" onclick="captureScreenshot()">
-                        📸 Capture Screenshot
-                    </button>
-                    <button class="btn-secondary btn-small" onclick="prepareRecording()" id="record-video-btn">
-                        🎥 Record Video (30s max)
-                    </button>
-                </div>
-                
-                <div id="feedback-attachments" style="margin: 15px 0;">
-                    <!-- Attachment previews will be added here -->
-                </div>
-                
-                <div style="display: flex; gap: 10px; justify-content: flex-end; margin-top: 20px;">
-                    <button class="btn-secondary" onclick="closeFeedbackModal()">Cancel</button>
-                    <button class="btn-success" onclick="submitFeedback()" id="submit-feedback-btn">
-                        Submit Feedback
-                    </button>
-                </div>
-                
-                <div id="feedback-status" style="margin-top: 15px; display: none;"></div>
-            </div>
-        </div>
-    </div>
-
-    <!-- GitHub Token Setup Modal -->
-    <div id="github-token-modal" class="modal">
-        <div class="modal-content" style="max-width: 600px;">
-            <div class="modal-header">
-                <h2>🔑 GitHub Token Setup</h2>
-                <span class="modal-close" onclick="closeGitHubTokenModal()">&times;</span>
-            </div>
-            <div class="modal-body">
-                <p style="color: #5E6C84; margin-bottom: 15px;">
-                    To submit feedback to GitHub, configure your Personal Access Token.<br>
-                    <strong>Feedback will be saved locally even if you skip this.</strong>
-                </p>
-                
-                <div class="input-group">
-                    <label>GitHub Personal Access Token</label>
-                    <input type="password" id="github-token-input" placeholder="ghp_xxxxxxxxxxxx">
-                    <small style="color: #5E6C84; display: block; margin-top: 5px;">
-                        Create at: <a href="https://github.com/settings/tokens/new?scopes=public_repo&description=Jira+Automation+Feedback" target="_blank" style="color: #60a5fa;">Generate Token →</a><br>
-                        Required scope: <code>public_repo</code>
-                    </small>
-                </div>
-                
-                <div style="display: flex; gap: 10px; justify-content: flex-end; margin-top: 20px;">
-                    <button class="btn-secondary" onclick="closeGitHubTokenModal()">Skip (Save Locally Only)</button>
-                    <button class="btn-success" onclick="saveGitHubToken()">
-                        Save & Validate Token
-                    </button>
-                </div>
-                
-                <div id="token-status" style="margin-top: 15px; display: none;"></div>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        let currentConfig = {};
-        let logs = [];
-        let selectedPersona = localStorage.getItem('selectedPersona') || null;
-
-        // Tab switching
-        function switchTab(tabName, event) {
-            document.querySelectorAll('.tab').forEach(t => t.classList.remove('active'));
-            document.querySelectorAll('.tab-content').forEach(c => c.classList.remove('active'));
-            
-            if (event && event.target) {
-                event.target.classList.add('active');
-            } else {
-                // Find button by onclick attribute matching
-                document.querySelectorAll('.tab').forEach(btn => {
-                    if (btn.getAttribute('onclick')?.includes(`'${tabName}'`)) {
-                        btn.classList.add('active');
-                    }
-                });
-            }
-            document.getElementById(tabName).classList.add('active');
-            
-            // Load data when switching to tabs
-            if (tabName === 'po') loadPOView();
-            if (tabName === 'dev') loadDevView();
-            if (tabName === 'sm') loadSMView();
-            if (tabName === 'workflows') loadWorkflows();
-            if (tabName === 'favorites') loadFavorites();
-            if (tabName === 'logs') refreshLogs();
-            if (tabName === 'settings') loadSettings();
-        }
-
-        // Persona selection
-        function selectPersona(persona) {
-            selectedPersona = persona;
-            localStorage.setItem('selectedPersona', persona);
-            
-            // Update UI
-            document.querySelectorAll('.persona-card').forEach(card => {
-                card.classList.remove('selected');
-            });
-            event.target.closest('.persona-card').classList.add('selected');
-            
-            // Show persona-specific quick actions
-            const actionsCard = document.getElementById('persona-quick-actions');
-            const actionsTitle = document.getElementById('persona-actions-title');
-            const actionsContent = document.getElementById('persona-actions-content');
-            
-            actionsCard.style.display = 'block';
-            
-            if (persona === 'po') {
-                actionsTitle.textContent = '👔 PO Quick Actions';
-                actionsContent.innerHTML = `
-                    <div style="display: flex; gap: 10px; flex-wrap: wrap;">
-                        <button class="btn-success" onclick="switchTab('po')">📊 View Features</button>
-                        <button class="btn-secondary" onclick="switchTab('po'); setTimeout(() => document.getElementById('canvas-issue-key').focus(), 100)">
-                            🔗 Load Dependencies
-                        </button>
-                        <button onclick="exportFeatures()">📥 Export Features</button>
-                    </div>
-                `;
-                addLog('info', 'Selected PO persona - Focus on feature tracking and visualization');
-            } else if (persona === 'dev') {
-                actionsTitle.textContent = '💻 Dev Quick Actions';
-                actionsContent.innerHTML = `
-                    <div style="display: flex; gap: 10px; flex-wrap: wrap;">
-                        <button class="btn-success" onclick="syncGitHubToJira()">🔄 Sync GitHub PRs</button>
-                        <button class="btn-secondary" onclick="switchTab('dev')">⚙️ View Automation Rules</button>
-                        <button onclick="viewSyncLog()">📋 View Sync Log</button>
-                    </div>
-                `;
-                addLog('info', 'Selected Dev persona - Focus on automation and GitHub sync');
-            } else if (persona === 'sm') {
-                actionsTitle.textContent = '📈 SM Quick Actions';
-                actionsContent.innerHTML = `
-                    <div style="display: flex; gap: 10px; flex-wrap: wrap;">
-                        <button class="btn-success" onclick="runHygieneCheck()">🔍 Run Hygiene Check</button>
-                        <button class="btn-secondary" onclick="switchTab('sm')">📊 View Metrics</button>
-                        <button onclick="exportHygieneReport()">📥 Export Report</button>
-                    </div>
-                `;
-                addLog('info', 'Selected SM persona - Focus on metrics and team health');
-            }
-        }
-
-        // Status message display
-        function showStatus(message, type) {
-            const status = document.getElementById('status');
-            status.textContent = message;
-            status.className = 'status-' + type;
-            status.style.display = 'block';
-            if (type === 'success') {
-                setTimeout(() => status.style.display = 'none', 5000);
-            }
-        }
-
-        // Initialize browser
-        async function initializeBrowser() {
-            const jiraUrl = document.getElementById('setting-jira-url').value || 
-                           'https://your-company.atlassian.net';
-            
-            showStatus('Initializing browser...', 'info');
-            try {
-                const response = await fetch('/api/init', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({jiraUrl})
-                });
-                const data = await response.json();
-                
-                if (data.success) {
-                    showStatus('✅ Browser initialized! Please log in to Jira.', 'success');
-                    updateStatus('initialized');
-                    addLog('info', 'Browser initialized successfully');
-                } else {
-                    showStatus('❌ Error: ' + data.error, 'error');
-                    addLog('error', 'Failed to initialize: ' + data.error);
-                }
-            } catch (error) {
-                showStatus('❌ Connection failed: ' + error.message, 'error');
-                addLog('error', 'Connection error: ' + error.message);
-            }
-        }
-
-        // Sync now
-        async function syncNow() {
-            showStatus('Running sync...', 'info');
-            addLog('info', 'Manual sync started');
-            
-            try {
-                const response = await fetch('/api/sync-now', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'}
-                });
-                const data = await response.json();
-                
-                if (data.success) {
-                    showStatus('✅ Sync completed successfully!', 'success');
-                    addLog('success', 'Sync completed: ' + data.message);
-                    updateLastRun();
-                } else {
-                    showStatus('❌ Error: ' + data.error, 'error');
-                    addLog('error', 'Sync failed: ' + data.error);
-                }
-            } catch (error) {
-                showStatus('❌ Sync failed: ' + error.message, 'error');
-                addLog('error', 'Sync error: ' + error.message);
-            }
-        }
-
-        // Start scheduler
-        async function startScheduler() {
-            showStatus('Starting scheduler...', 'info');
-            try {
-                const response = await fetch('/api/start-scheduler', {
-                    method: 'POST'
-                });
-                const data = await response.json();
-                
-                if (data.success) {
-                    showStatus('✅ Scheduler started!', 'success');
-                    addLog('success', 'Scheduler started');
-                    updateStatus('running');
-                } else {
-                    showStatus('❌ Error: ' + data.error, 'error');
-                    addLog('error', 'Scheduler error: ' + data.error);
-                }
-            } catch (error) {
-                showStatus('❌ Failed: ' + error.message, 'error');
-            }
-        }
-
-        // Stop scheduler
-        async function stopScheduler() {
-            showStatus('Stopping scheduler...', 'info');
-            try {
-                const response = await fetch('/api/stop-scheduler', {
-                    method: 'POST'
-                });
-                const data = await response.json();
-                
-                if (data.success) {
-                    showStatus('✅ Scheduler stopped!', 'success');
-                    addLog('info', 'Scheduler stopped');
-                    updateStatus('stopped');
-                } else {
-                    showStatus('⚠️ ' + data.error, 'info');
-                    addLog('warn', data.error);
-                }
-            } catch (error) {
-                showStatus('❌ Failed: ' + error.message, 'error');
-            }
-        }
-
-        // Load automation rules
-        async function loadWorkflows() {
-            try {
-                const response = await fetch('/api/config');
-                const config = await response.json();
-                if (config.error) {
-                    showStatus('Failed to load config: ' + config.error, 'error');
-                    return;
-                }
-                currentConfig = config;
-                
-                const automation = config.automation || {};
-                
-                // Load PR Opened rules
-                const prOpened = automation.pr_opened || {};
-                document.getElementById('pr-opened-enabled').checked = prOpened.enabled !== false;
-                document.getElementById('pr-opened-status').value = prOpened.set_status || '';
-                document.getElementById('pr-opened-label').value = prOpened.add_label || '';
-                document.getElementById('pr-opened-comment').checked = prOpened.add_comment !== false;
-                
-                // Load PR Closed rules
-                const prClosed = automation.pr_closed || {};
-                document.getElementById('pr-closed-enabled').checked = prClosed.enabled !== false;
-                document.getElementById('pr-closed-label').value = prClosed.add_label || '';
-                document.getElementById('pr-closed-comment').checked = prClosed.add_comment !== false;
-                
-                // Load PR Merged branch rules
-                loadBranchRules(automation.pr_merged || {});
-                
-                // Update stat
-                let count = 0;
-                if (prOpened.enabled !== false) count++;
-                if (prClosed.enabled !== false) count++;
-                if (automation.pr_merged && automation.pr_merged.enabled !== false) count++;
-                document.getElementById('stat-workflows').textContent = count;
-                
-            } catch (error) {
-                showStatus('Failed to load automation rules: ' + error.message, 'error');
-            }
-        }
-        
-        function loadBranchRules(prMerged) {
-            const container = document.getElementById('branch-rules-list');
-            container.innerHTML = '';
-            
-            const branchRules = prMerged.branch_rules || [];
-            
-            branchRules.forEach((rule, index) => {
-                if (rule.branch === 'default') return; // Skip default rule in UI
-                
-                const ruleDiv = document.createElement('div');
-                ruleDiv.className = 'branch-rule-container';
-                ruleDiv.innerHTML = `
-                    <div class="branch-rule-content">
-                        <div class="branch-rule-grid">
-                            <div class="branch-rule-field">
-                                <label>Branch Name</label>
-                                <input type="text" value="${rule.branch}" 
-                                       onchange="updateBranchRule(${index}, 'branch', this.value)"
-                                       placeholder="e.g., DEV, INT, PVS">
-                            </div>
-                            <div class="branch-rule-field">
-                                <label>Move to Status</label>
-                                <input type="text" value="${rule.set_status || ''}" 
-                                       onchange="updateBranchRule(${index}, 'set_status', this.value)"
-                                       placeholder="e.g., Ready for QA">
-                            </div>
-                            <div class="branch-rule-field">
-                                <label>Add Label</label>
-                                <input type="text" value="${rule.add_label || ''}" 
-                                       onchange="updateBranchRule(${index}, 'add_label', this.value)"
-                                       placeholder="e.g., merged-dev">
-                            </div>
-                            <div class="branch-rule-field branch-rule-checkbox">
-                                <label>
-                                    <input type="checkbox" ${rule.add_comment !== false ? 'checked' : ''}
-                                           onchange="updateBranchRule(${index}, 'add_comment', this.checked)">
-                                    <span>Add comment</span>
-                                </label>
-                            </div>
-                        </div>
-                        <button class="btn-small btn-danger branch-rule-delete" onclick="removeBranchRule(${index})" 
-                                title="Delete this branch rule">
-                            🗑️
-                        </button>
-                    </div>
-                `;
-                container.appendChild(ruleDiv);
-            });
-        }
-        
-        function addBranchRule() {
-            if (!currentConfig.automation) currentConfig.automation = {};
-            if (!currentConfig.automation.pr_merged) currentConfig.automation.pr_merged = {};
-            if (!currentConfig.automation.pr_merged.branch_rules) {
-                currentConfig.automation.pr_merged.branch_rules = [];
-            }
-            
-            currentConfig.automation.pr_merged.branch_rules.push({
-                branch: 'NEW',
-                add_comment: true,
-                comment_template: '✅ Merged to {target_branch}: {pr_url}',
-                set_status: '',
-                add_label: ''
-            });
-            
-            loadBranchRules(currentConfig.automation.pr_merged);
-            saveAutomationRules();
-        }
-        
-        function removeBranchRule(index) {
-            if (!currentConfig.automation?.pr_merged?.branch_rules) return;
-            currentConfig.automation.pr_merged.branch_rules.splice(index, 1);
-            loadBranchRules(currentConfig.automation.pr_merged);
-            saveAutomationRules();
-        }
-        
-        function updateBranchRule(index, field, value) {
-            if (!currentConfig.automation?.pr_merged?.branch_rules?.[index]) return;
-            currentConfig.automation.pr_merged.branch_rules[index][field] = value;
-            saveAutomationRules();
-        }
-        
-        async function saveAutomationRules() {
-            try {
-                // Build automation object from UI
-                const automation = {
-                    pr_opened: {
-                        enabled: document.getElementById('pr-opened-enabled').checked,
-                        add_comment: document.getElementById('pr-opened-comment').checked,
-                        comment_template: "🔗 Pull Request opened: {pr_url}\\nBranch: {branch_name}\\nAuthor: {author}",
-                        update_pr_field: true,
-                        add_label: document.getElementById('pr-opened-label').value,
-                        set_status: document.getElementById('pr-opened-status').value
-                    },
-                    pr_updated: {
-                        enabled: true,
-                        add_comment: true,
-                        comment_template: "🔄 Pull Request updated: {pr_url}",
-                        update_pr_field: false,
-                        add_label: "",
-                        set_status: ""
-                    },
-                    pr_merged: currentConfig.automation?.pr_merged || {
-                        enabled: true,
-                        branch_rules: []
-                    },
-                    pr_closed: {
-                        enabled: document.getElementById('pr-closed-enabled').checked,
-                        add_comment: document.getElementById('pr-closed-comment').checked,
-                        comment_template: "❌ Pull Request closed without merging: {pr_url}",
-                        update_pr_field: false,
-                        add_label: document.getElementById('pr-closed-label').value,
-                        set_status: ""
-                    }
-                };
-                
-                currentConfig.automation = automation;
-                
-                const response = await fetch('/api/save-config', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify(currentConfig)
-                });
-                
-                const result = await response.json();
-                if (result.success) {
-                    showStatus('Automation rules saved', 'success');
-                } else {
-                    showStatus('Failed to save: ' + result.error, 'error');
-                }
-            } catch (error) {
-                showStatus('Error saving rules: ' + error.message, 'error');
-            }
-        }
-
-        // Load favorites
-        async function loadFavorites() {
-            try {
-                const response = await fetch('/api/config');
-                const config = await response.json();
-                
-                const favoritesList = document.getElementById('favorites-list');
-                favoritesList.innerHTML = '';
-                
-                const favorites = config.favorites || {};
-                
-                for (const [key, favorite] of Object.entries(favorites)) {
-                    const item = document.createElement('div');
-                    item.className = 'favorite-item';
-                    item.innerHTML = `
-                        <div class="favorite-header">
-                            <div class="favorite-name">${favorite.name}</div>
-                            <button class="btn-small btn-success" onclick="runFavorite('${key}')">
-                                ▶️ Run
-                            </button>
-                        </div>
-                        <div class="favorite-desc">${favorite.description}</div>
-                        <div class="favorite-jql">JQL: ${favorite.jql_query}</div>
-                    `;
-                    favoritesList.appendChild(item);
-                }
-                
-            } catch (error) {
-                showStatus('Failed to load favorites: ' + error.message, 'error');
-            }
-        }
-
-        // Run favorite
-        async function runFavorite(key) {
-            showStatus('Running favorite: ' + key, 'info');
-            addLog('info', 'Running favorite: ' + key);
-            
-            // TODO: Implement favorite execution
-            showStatus('⚠️ Favorite execution not yet implemented', 'info');
-        }
-
-        // Run workflow
-        async function runWorkflow(key) {
-            showStatus('Running workflow: ' + key, 'info');
-            addLog('info', 'Running workflow: ' + key);
-            
-            // TODO: Implement workflow execution
-            showStatus('⚠️ Workflow execution not yet implemented', 'info');
-        }
-
-        // Toggle workflow
-        async function toggleWorkflow(key, enabled) {
-            addLog('info', `Workflow ${key} ${enabled ? 'enabled' : 'disabled'}`);
-            // TODO: Save to config
-        }
-
-        // Load settings
-        async function loadSettings() {
-            try {
-                const response = await fetch('/api/config');
-                const config = await response.json();
-                
-                document.getElementById('setting-jira-url').value = 
-                    config.jira?.base_url || '';
-                document.getElementById('setting-github-org').value = 
-                    config.github?.organization || '';
-                document.getElementById('setting-github-repos').value = 
-                    (config.github?.repositories || []).join(', ');
-                
-                // Load ServiceNow config
-                document.getElementById('setting-snow-url').value = 
-                    config.servicenow?.url || '';
-                document.getElementById('setting-snow-jira-project').value = 
-                    config.servicenow?.jira_project || '';
-                    
-            } catch (error) {
-                showStatus('Failed to load settings: ' + error.message, 'error');
-            }
-        }
-
-        // Save settings
-        async function saveSettings() {
-            const jiraUrl = document.getElementById('setting-jira-url').value;
-            const githubOrg = document.getElementById('setting-github-org').value;
-            const repos = document.getElementById('setting-github-repos').value
-                .split(',').map(r => r.trim());
-            
-            currentConfig.jira = currentConfig.jira || {};
-            currentConfig.jira.base_url = jiraUrl;
-            currentConfig.github = currentConfig.github || {};
-            currentConfig.github.organization = githubOrg;
-            currentConfig.github.repositories = repos;
-            
-            showStatus('Saving settings...', 'info');
-            
-            try {
-                const response = await fetch('/api/config', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify(currentConfig)
-                });
-                const data = await response.json();
-                
-                if (data.success) {
-                    showStatus('✅ Settings saved!', 'success');
-                    addLog('success', 'Configuration updated');
-                } else {
-                    showStatus('❌ Error: ' + data.error, 'error');
-                }
-            } catch (error) {
-                showStatus('❌ Failed to save: ' + error.message, 'error');
-            }
-        }
-
-        // Test Jira connection
-        async function testJiraConnection() {
-            const jiraUrl = document.getElementById('setting-jira-url').value;
-            if (!jiraUrl) {
-                showStatus('Please enter Jira URL first', 'error');
-                return;
-            }
-            
-            await initializeBrowser();
-        }
-
-        // ServiceNow configuration
-        async function saveSnowConfig() {
-            const snowUrl = document.getElementById('setting-snow-url').value;
-            const jiraProject = document.getElementById('setting-snow-jira-project').value;
-            
-            if (!snowUrl || !jiraProject) {
-                showStatus('Please enter both ServiceNow URL and Jira Project Key', 'error');
-                return;
-            }
-            
-            showStatus('Saving ServiceNow configuration...', 'info');
-            
-            try {
-                const response = await fetch('/api/snow-jira/config', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({
-                        url: snowUrl,
-                        jira_project: jiraProject
-                    })
-                });
-                const data = await response.json();
-                
-                if (data.success) {
-                    showStatus('✅ ServiceNow configuration saved!', 'success');
-                    addLog('success', 'ServiceNow configured');
-                } else {
-                    showStatus('❌ Error: ' + data.error, 'error');
-                }
-            } catch (error) {
-                showStatus('❌ Failed to save: ' + error.message, 'error');
-            }
-        }
-
-        async function testSnowConnection() {
-            const snowUrl = document.getElementById('setting-snow-url').value;
-            if (!snowUrl) {
-                showStatus('Please configure ServiceNow URL first', 'error');
-                return;
-            }
-            
-            showStatus('Testing ServiceNow connection...', 'info');
-            addLog('info', 'Testing ServiceNow connection...');
-            
-            try {
-                const response = await fetch('/api/snow-jira/test-connection', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'}
-                });
-                const data = await response.json();
-                
-                if (data.success) {
-                    showStatus('✅ ServiceNow connection successful!', 'success');
-                    addLog('success', 'ServiceNow connection test passed');
-                } else {
-                    showStatus('❌ Connection failed: ' + data.error, 'error');
-                    addLog('error', `ServiceNow test failed: ${data.error}`);
-                }
-            } catch (error) {
-                showStatus('❌ Test failed: ' + error.message, 'error');
-                addLog('error', `ServiceNow test error: ${error.message}`);
-            }
-        }
-
-        async function validateTestPRB() {
-            console.log('[DEBUG] validateTestPRB called');
-            
-            const prbNumber = document.getElementById('test-prb-number')?.value?.trim();
-            const resultDiv = document.getElementById('prb-validation-result');
-            
-            console.log('[DEBUG] PRB number:', prbNumber);
-            console.log('[DEBUG] resultDiv:', resultDiv);
-            
-            if (!resultDiv) {
-                console.error('[DEBUG] prb-validation-result element not found!');
-                return;
-            }
-            
-            if (!prbNumber) {
-                resultDiv.style.display = 'block';
-                resultDiv.innerHTML = '<div style="background: #FFEBE6; border-left: 4px solid #DE350B; padding: 10px; border-radius: 4px;">Please enter a PRB number</div>';
-                return;
-            }
-                
-            resultDiv.style.display = 'block';
-            resultDiv.innerHTML = '<div style="background: #DEEBFF; border-left: 4px solid #0052CC; padding: 10px; border-radius: 4px;">⏳ Validating PRB ' + prbNumber + '... (browser will auto-launch if needed)</div>';
-            addLog('info', `Validating PRB ${prbNumber}...`);
-            
-            try {
-                const response = await fetch('/api/snow-jira/validate-prb', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({
-                        prb_number: prbNumber
-                    })
-                });
-                const data = await response.json();
-                
-                if (data.success) {
-                    const prbData = data.data || {};
-                    const incidents = data.incidents || [];
-                    
-                    let html = '<div style="background: #E3FCEF; border-left: 4px solid #00875A; padding: 10px; border-radius: 4px;">';
-                    html += '<strong>✅ PRB Validation Successful</strong><br>';
-                    html += '<div style="margin-top: 10px;">';
-                    html += `<strong>Number:</strong> ${prbData.number || prbNumber}<br>`;
-                    html += `<strong>Short Description:</strong> ${prbData.short_description || 'N/A'}<br>`;
-                    html += `<strong>State:</strong> ${prbData.state || 'N/A'}<br>`;
-                    html += `<strong>Priority:</strong> ${prbData.priority || 'N/A'}<br>`;
-                    if (incidents.length > 0) {
-                        html += `<strong>Related Incidents:</strong> ${incidents.join(', ')}<br>`;
-                    }
-                    html += '</div></div>';
-                    
-                    resultDiv.innerHTML = html;
-                    addLog('success', `PRB ${prbNumber} validated successfully`);
-                } else {
-                    let errorHtml = '<div style="background: #FFEBE6; border-left: 4px solid #DE350B; padding: 10px; border-radius: 4px;">';
-                    errorHtml += '<strong>❌ Validation Failed</strong><br>';
-                    errorHtml += data.error;
-                    
-                    // Show diagnostics path if available
-                    if (data.diagnostics_path) {
-                        errorHtml += '<br><br><small style="color: #666;">📁 Diagnostics (screenshots/logs): ' + data.diagnostics_path + '</small>';
-                    }
-                    if (data.hint) {
-                        errorHtml += '<br><small style="color: #666;">' + data.hint + '</small>';
-                    }
-                    if (data.current_url) {
-                        errorHtml += '<br><small style="color: #666;">📍 Current URL: ' + data.current_url + '</small>';
-                    }
-                    errorHtml += '</div>';
-                    
-                    resultDiv.innerHTML = errorHtml;
-                    addLog('error', `PRB validation failed: ${data.error}`);
-                }
-            } catch (error) {
-                console.error('[DEBUG] validateTestPRB fetch error:', error);
-                resultDiv.innerHTML = '<div style="background: #FFEBE6; border-left: 4px solid #DE350B; padding: 10px; border-radius: 4px;"><strong>❌ Error</strong><br>' + error.message + '</div>';
-                addLog('error', `PRB validation error: ${error.message}`);
-            }
-        }
-
-        // Log management
-        function addLog(level, message) {
-            const timestamp = new Date().toLocaleTimeString();
-            logs.push({timestamp, level, message});
-            
-            const entry = document.createElement('div');
-            entry.className = `log-entry log-${level}`;
-            entry.textContent = `[${timestamp}] ${level.toUpperCase()}: ${message}`;
-            
-            const viewer = document.getElementById('logs-viewer');
-            viewer.insertBefore(entry, viewer.firstChild);
-            
-            // Keep only last 100 logs
-            if (viewer.children.length > 100) {
-                viewer.removeChild(viewer.lastChild);
-            }
-            
-            // Also add to recent activity
-            const activity = document.getElementById('recent-activity');
-            const activityEntry = entry.cloneNode(true);
-            activity.insertBefore(activityEntry, activity.firstChild);
-            if (activity.children.length > 10) {
-                activity.removeChild(activity.lastChild);
-            }
-        }
-
-        function refreshLogs() {
-            addLog('info', 'Logs refreshed');
-        }
-
-        function clearLogs() {
-            document.getElementById('logs-viewer').innerHTML = '';
-            logs = [];
-            addLog('info', 'Logs cleared');
-        }
-
-        function filterLogs() {
-            const level = document.getElementById('log-level').value;
-            // TODO: Implement log filtering
-            addLog('info', 'Filter set to: ' + level);
-        }
-
-        // Status updates
-        function updateStatus(status) {
-            const statusElem = document.getElementById('stat-status');
-            if (status === 'initialized' || status === 'running') {
-                statusElem.textContent = '🟢';
-                statusElem.style.color = '#00875A';
-            } else if (status === 'stopped') {
-                statusElem.textContent = '🟡';
-                statusElem.style.color = '#FFAB00';
-            } else {
-                statusElem.textContent = '🔴';
-                statusElem.style.color = '#DE350B';
-            }
-        }
-
-        function updateLastRun() {
-            document.getElementById('stat-last-run').textContent = 
-                new Date().toLocaleTimeString();
-        }
-
-        function editConfig() {
-            alert('Config editor coming soon! For now, edit config.yaml directly.');
-        }
-
-        function viewLogs() {
-            alert('Log viewer coming soon! For now, check jira-sync.log file.');
-        }
-
-        // Toggle team mode (Scrum vs Kanban)
-        function toggleTeamMode(mode) {
-            const scrumMetrics = document.getElementById('scrum-metrics');
-            const kanbanMetrics = document.getElementById('kanban-metrics');
-            
-            if (mode === 'scrum') {
-                scrumMetrics.style.display = 'block';
-                kanbanMetrics.style.display = 'none';
-                addLog('info', 'Switched to Scrum mode');
-            } else {
-                scrumMetrics.style.display = 'none';
-                kanbanMetrics.style.display = 'block';
-                addLog('info', 'Switched to Kanban mode');
-            }
-        }
-
-        // Load PO view
-        async function loadPOView() {
-            addLog('info', 'Loading PO view...');
-            
-            // TODO: Fetch real data from Jira API
-            // For now, showing placeholder data
-            refreshFeatures();
-            
-            showStatus('PO view loaded (placeholder data)', 'info');
-        }
-
-        // Refresh features list
-        function refreshFeatures() {
-            const featuresList = document.getElementById('po-features-list');
-            
-            // TODO: Replace with actual Jira API data
-            const sampleFeatures = [
-                {
-                    key: 'PROJ-100',
-                    title: 'User Authentication & Authorization',
-                    progress: 75,
-                    completed: 6,
-                    total: 8,
-                    children: [
-                        { key: 'PROJ-101', summary: 'Implement OAuth2 login', status: 'done' },
-                        { key: 'PROJ-102', summary: 'Add role-based access control', status: 'done' },
-                        { key: 'PROJ-103', summary: 'Create user permissions UI', status: 'inprogress' },
-                        { key: 'PROJ-104', summary: 'Add JWT token refresh', status: 'inprogress' },
-                        { key: 'PROJ-105', summary: 'Implement MFA support', status: 'todo' },
-                        { key: 'PROJ-106', summary: 'Add session management', status: 'todo' },
-                        { key: 'PROJ-107', summary: 'Security audit and fixes', status: 'done' },
-                        { key: 'PROJ-108', summary: 'Documentation for auth flow', status: 'done' }
-                    ]
-                },
-                {
-                    key: 'PROJ-200',
-                    title: 'Payment Processing Integration',
-                    progress: 40,
-                    completed: 2,
-                    total: 5,
-                    children: [
-                        { key: 'PROJ-201', summary: 'Stripe API integration', status: 'done' },
-                        { key: 'PROJ-202', summary: 'Payment webhook handlers', status: 'done' },
-                        { key: 'PROJ-203', summary: 'Refund processing logic', status: 'inprogress' },
-                        { key: 'PROJ-204', summary: 'Payment receipt generation', status: 'blocked' },
-                        { key: 'PROJ-205', summary: 'PCI compliance review', status: 'todo' }
-                    ]
-                },
-                {
-                    key: 'PROJ-300',
-                    title: 'Mobile App - iOS',
-                    progress: 20,
-                    completed: 1,
-                    total: 5,
-                    children: [
-                        { key: 'PROJ-301', summary: 'Setup React Native project', status: 'done' },
-                        { key: 'PROJ-302', summary: 'Build login screen', status: 'inprogress' },
-                        { key: 'PROJ-303', summary: 'Implement navigation', status: 'review' },
-                        { key: 'PROJ-304', summary: 'Add push notifications', status: 'todo' },
-                        { key: 'PROJ-305', summary: 'App Store submission', status: 'todo' }
-                    ]
-                }
-            ];
-            
-            featuresList.innerHTML = sampleFeatures.map((feature, index) => `
-                <div class="feature-card">
-                    <div class="feature-header">
-                        <div style="flex: 1;">
-                            <div class="feature-title">${feature.title}</div>
-                            <div class="feature-key">${feature.key}</div>
-                        </div>
-                        <div class="feature-progress">
-                            <div class="progress-bar">
-                                <div class="progress-fill" style="width: ${feature.progress}%;"></div>
-                            </div>
-                            <div class="progress-text">${feature.completed}/${feature.total} complete (${feature.progress}%)</div>
-                        </div>
-                    </div>
-                    <div style="display: flex; justify-content: space-between; align-items: center;">
-                        <button class="expand-toggle" onclick="toggleFeature(${index})">
-                            <span id="toggle-icon-${index}">▼</span> 
-                            <span style="font-size: 13px; font-weight: 600;">Show ${feature.total} child issues</span>
-                        </button>
-                    </div>
-                    <div id="feature-children-${index}" class="child-issues" style="display: none;">
-                        ${feature.children.map(child => `
-                            <div class="child-issue">
-                                <div class="child-issue-info">
-                                    <span class="child-issue-key">${child.key}</span>
-                                    <span class="child-issue-summary">${child.summary}</span>
-                                </div>
-                                <span class="child-issue-status status-${child.status}">
-                                    ${child.status === 'todo' ? 'To Do' : 
-                                      child.status === 'inprogress' ? 'In Progress' :
-                                      child.status === 'review' ? 'Review' :
-                                      child.status === 'blocked' ? 'Blocked' : 'Done'}
-                                </span>
-                            </div>
-                        `).join('')}
-                    </div>
-                </div>
-            `).join('');
-            
-            addLog('info', `Loaded ${sampleFeatures.length} features`);
-        }
-
-        // Export features to CSV
-        function exportFeatures() {
-            // TODO: Get actual feature data
-            const csv = 'Feature Key,Title,Progress,Completed,Total,Status\\n' +
-                        'PROJ-100,User Authentication,75%,6,8,In Progress\\n' +
-                        'PROJ-200,Payment Processing,40%,2,5,In Progress\\n' +
-                        'PROJ-300,Mobile App iOS,20%,1,5,In Progress\\n';
-            
-            const blob = new Blob([csv], { type: 'text/csv' });
-            const url = window.URL.createObjectURL(blob);
-            const a = document.createElement('a');
-            a.href = url;
-            a.download = `features-export-${new Date().toISOString().split('T')[0]}.csv`;
-            a.click();
-            
-            showStatus('✅ Features exported to CSV', 'success');
-            addLog('success', 'Features exported to CSV');
-        }
-
-        // Toggle feature expansion
-        function toggleFeature(index) {
-            const children = document.getElementById(`feature-children-${index}`);
-            const icon = document.getElementById(`toggle-icon-${index}`);
-            
-            if (children.style.display === 'none') {
-                children.style.display = 'block';
-                icon.textContent = '▲';
-            } else {
-                children.style.display = 'none';
-                icon.textContent = '▼';
-            }
-        }
-
-        // Dependency Canvas
-        let canvasState = {
-            cards: [],
-            links: [],
-            selectedCard: null,
-            zoom: 1,
-            panX: 0,
-            panY: 0,
-            isDragging: false,
-            dragStartX: 0,
-            dragStartY: 0,
-            draggedCard: null,
-            dataStore: {} // Store loaded dependency data
-        };
-
-        // Load dependency data from URL
-        async function loadDependencyData() {
-            const url = document.getElementById('canvas-data-url').value.trim();
-            if (!url) {
-                showStatus('Please enter a URL', 'error');
-                return;
-            }
-
-            try {
-                addLog('info', `Loading dependency data from ${url}...`);
-                const response = await fetch(url);
-                const data = await response.json();
-                
-                canvasState.dataStore = data;
-                showStatus(`✅ Loaded ${Object.keys(data).length} issues from URL`, 'success');
-                addLog('success', `Data loaded: ${Object.keys(data).length} issues`);
-            } catch (error) {
-                showStatus('❌ Failed to load data: ' + error.message, 'error');
-                addLog('error', 'Failed to load dependency data: ' + error.message);
-            }
-        }
-
-        // Load dependency data from file
-        function loadDependencyFile() {
-            const fileInput = document.getElementById('canvas-data-file');
-            const file = fileInput.files[0];
-            
-            if (!file) return;
-            
-            const reader = new FileReader();
-            reader.onload = function(e) {
-                try {
-                    const data = JSON.parse(e.target.result);
-                    canvasState.dataStore = data;
-                    showStatus(`✅ Loaded ${Object.keys(data).length} issues from file`, 'success');
-                    addLog('success', `Data loaded from ${file.name}: ${Object.keys(data).length} issues`);
-                } catch (error) {
-                    showStatus('❌ Invalid JSON file: ' + error.message, 'error');
-                    addLog('error', 'Failed to parse JSON file: ' + error.message);
-                }
-            };
-            reader.readAsText(file);
-        }
-
-        // Load issue dependencies
-        async function loadIssueDependencies() {
-            const issueKey = document.getElementById('canvas-issue-key').value.trim();
-            
-            // Check if we have data loaded
-            if (Object.keys(canvasState.dataStore).length === 0) {
-                showStatus('⚠️ Please load dependency data first (URL or file)', 'error');
-                return;
-            }
-            
-            if (!issueKey) {
-                showStatus('Please enter an issue key', 'error');
-                return;
-            }
-
-            const rootIssue = canvasState.dataStore[issueKey];
-            if (!rootIssue) {
-                showStatus(`Issue ${issueKey} not found in loaded data`, 'error');
-                return;
-            }
-
-            addLog('info', `Loading dependencies for ${issueKey}...`);
-
-            // Clear and rebuild canvas
-            clearCanvas();
-            
-            // Add root card at center
-            addCanvasCard(rootIssue, 400, 200, true);
-            
-            // Add linked issues in a circular layout
-            const linkedKeys = new Set();
-            rootIssue.links.forEach(link => linkedKeys.add(link.target));
-            
-            const radius = 200;
-            const angleStep = (2 * Math.PI) / linkedKeys.size;
-            let angle = 0;
-            
-            linkedKeys.forEach(key => {
-                const issue = canvasState.dataStore[key];
-                if (issue) {
-                    const x = 400 + radius * Math.cos(angle);
-                    const y = 200 + radius * Math.sin(angle);
-                    addCanvasCard(issue, x, y, false);
-                    angle += angleStep;
-                }
-            });
-            
-            // Add links
-            rootIssue.links.forEach(link => {
-                addCanvasLink(rootIssue.key, link.target, link.type);
-            });
-            
-            renderCanvas();
-            showStatus(`Loaded ${linkedKeys.size + 1} issues with dependencies`, 'success');
-        }
-
-        // Add card to canvas
-        function addCanvasCard(issue, x, y, isRoot) {
-            const card = {
-                id: issue.key,
-                key: issue.key,
-                summary: issue.summary,
-                status: issue.status,
-                x: x,
-                y: y,
-                isRoot: isRoot,
-                links: issue.links || []
-            };
-            
-            canvasState.cards.push(card);
-        }
-
-        // Add link between cards
-        function addCanvasLink(fromKey, toKey, type) {
-            canvasState.links.push({
-                from: fromKey,
-                to: toKey,
-                type: type
-            });
-        }
-
-        // Render canvas
-        function renderCanvas() {
-            const container = document.getElementById('canvas-cards');
-            const svg = document.getElementById('dependency-svg');
-            
-            // Set SVG size
-            const rect = container.getBoundingClientRect();
-            svg.setAttribute('width', rect.width);
-            svg.setAttribute('height', rect.height);
-            
-            // Clear existing content
-            container.innerHTML = '';
-            svg.innerHTML = '';
-            
-            // Draw links first (so they appear behind cards)
-            canvasState.links.forEach((link, index) => {
-                const fromCard = canvasState.cards.find(c => c.id === link.from);
-                const toCard = canvasState.cards.find(c => c.id === link.to);
-                
-                if (fromCard && toCard) {
-                    drawLink(svg, fromCard, toCard, link.type, index);
-                }
-            });
-            
-            // Draw cards
-            canvasState.cards.forEach((card, index) => {
-                const cardEl = createCardElement(card, index);
-                container.appendChild(cardEl);
-            });
-        }
-
-        // Create card DOM element
-        function createCardElement(card, index) {
-            const div = document.createElement('div');
-            div.className = 'canvas-card' + (card.status === 'blocked' ? ' blocked' : '');
-            div.style.left = card.x + 'px';
-            div.style.top = card.y + 'px';
-            div.dataset.index = index;
-            
-            const statusClass = 'status-' + card.status;
-            const statusText = card.status === 'todo' ? 'To Do' : 
-                              card.status === 'inprogress' ? 'In Progress' :
-                              card.status === 'review' ? 'Review' :
-                              card.status === 'blocked' ? 'Blocked' : 'Done';
-            
-            div.innerHTML = `
-                <div class="canvas-card-key">${card.key}</div>
-                <div class="canvas-card-summary">${card.summary}</div>
-                <span class="canvas-card-status ${statusClass}">${statusText}</span>
-                ${card.links.length > 0 ? `<div class="canvas-card-links">🔗 ${card.links.length} link${card.links.length > 1 ? 's' : ''}</div>` : ''}
-            `;
-            
-            // Make card draggable
-            div.addEventListener('mousedown', (e) => startDragCard(e, index));
-            div.addEventListener('click', (e) => {
-                e.stopPropagation();
-                selectCard(index);
-            });
-            
-            return div;
-        }
-
-        // Draw link between cards
-        function drawLink(svg, fromCard, toCard, type, index) {
-            const fromX = fromCard.x + 110; // Center of card (220/2)
-            const fromY = fromCard.y + 50;
-            const toX = toCard.x + 110;
-            const toY = toCard.y + 50;
-            
-            let color, strokeDasharray, strokeWidth;
-            
-            if (type === 'blocks' || type === 'blocked-by') {
-                color = '#DE350B'; // Red for blockers
-                strokeDasharray = '5,5'; // Dashed line
-                strokeWidth = 2;
-            } else if (type === 'depends' || type === 'required-by') {
-                color = '#00875A'; // Green for dependencies
-                strokeDasharray = 'none';
-                strokeWidth = 2;
-            } else {
-                color = '#0052CC'; // Blue for related
-                strokeDasharray = 'none';
-                strokeWidth = 1;
-            }
-            
-            // Draw arrow line
-            const line = document.createElementNS('http://www.w3.org/2000/svg', 'line');
-            line.setAttribute('x1', fromX);
-            line.setAttribute('y1', fromY);
-            line.setAttribute('x2', toX);
-            line.setAttribute('y2', toY);
-            line.setAttribute('stroke', color);
-            line.setAttribute('stroke-width', strokeWidth);
-            if (strokeDasharray !== 'none') {
-                line.setAttribute('stroke-dasharray', strokeDasharray);
-            }
-            line.setAttribute('marker-end', `url(#arrowhead-${type})`);
-            svg.appendChild(line);
-            
-            // Add arrowhead marker if not exists
-            if (!document.getElementById(`arrowhead-${type}`)) {
-                const defs = document.createElementNS('http://www.w3.org/2000/svg', 'defs');
-                const marker = document.createElementNS('http://www.w3.org/2000/svg', 'marker');
-                marker.setAttribute('id', `arrowhead-${type}`);
-                marker.setAttribute('markerWidth', '10');
-                marker.setAttribute('markerHeight', '10');
-                marker.setAttribute('refX', '9');
-                marker.setAttribute('refY', '3');
-                marker.setAttribute('orient', 'auto');
-                
-                const polygon = document.createElementNS('http://www.w3.org/2000/svg', 'polygon');
-                polygon.setAttribute('points', '0 0, 10 3, 0 6');
-                polygon.setAttribute('fill', color);
-                
-                marker.appendChild(polygon);
-                defs.appendChild(marker);
-                svg.appendChild(defs);
-            }
-            
-            // Add sequence number for dependency chains
-            if (type === 'depends' || type === 'required-by') {
-                const midX = (fromX + toX) / 2;
-                const midY = (fromY + toY) / 2;
-                
-                const circle = document.createElementNS('http://www.w3.org/2000/svg', 'circle');
-                circle.setAttribute('cx', midX);
-                circle.setAttribute('cy', midY);
-                circle.setAttribute('r', '12');
-                circle.setAttribute('fill', 'white');
-                circle.setAttribute('stroke', color);
-                circle.setAttribute('stroke-width', '2');
-                svg.appendChild(circle);
-                
-                const text = document.createElementNS('http://www.w3.org/2000/svg', 'text');
-                text.setAttribute('x', midX);
-                text.setAttribute('y', midY + 4);
-                text.setAttribute('text-anchor', 'middle');
-                text.setAttribute('font-size', '12');
-                text.setAttribute('font-weight', 'bold');
-                text.setAttribute('fill', color);
-                text.textContent = index + 1;
-                svg.appendChild(text);
-            }
-        }
-
-        // Card dragging
-        function startDragCard(e, index) {
-            e.stopPropagation();
-            canvasState.draggedCard = index;
-            canvasState.dragStartX = e.clientX - canvasState.cards[index].x;
-            canvasState.dragStartY = e.clientY - canvasState.cards[index].y;
-            
-            document.addEventListener('mousemove', dragCard);
-            document.addEventListener('mouseup', stopDragCard);
-        }
-
-        function dragCard(e) {
-            if (canvasState.draggedCard !== null) {
-                const card = canvasState.cards[canvasState.draggedCard];
-                card.x = e.clientX - canvasState.dragStartX;
-                card.y = e.clientY - canvasState.dragStartY;
-                renderCanvas();
-            }
-        }
-
-        function stopDragCard() {
-            canvasState.draggedCard = null;
-            document.removeEventListener('mousemove', dragCard);
-            document.removeEventListener('mouseup', stopDragCard);
-        }
-
-        // Select card
-        function selectCard(index) {
-            canvasState.selectedCard = index;
-            
-            // Highlight selected card
-            const cards = document.querySelectorAll('.canvas-card');
-            cards.forEach((card, i) => {
-                if (i === index) {
-                    card.classList.add('selected');
-                } else {
-                    card.classList.remove('selected');
-                }
-            });
-            
-            const selectedIssue = canvasState.cards[index];
-            addLog('info', `Selected: ${selectedIssue.key} - ${selectedIssue.summary}`);
-        }
-
-        // Clear canvas
-        function clearCanvas() {
-            canvasState.cards = [];
-            canvasState.links = [];
-            canvasState.selectedCard = null;
-            document.getElementById('canvas-cards').innerHTML = '';
-            document.getElementById('dependency-svg').innerHTML = '';
-            addLog('info', 'Canvas cleared');
-        }
-
-        // Reset zoom
-        function resetCanvasZoom() {
-            canvasState.zoom = 1;
-            canvasState.panX = 0;
-            canvasState.panY = 0;
-            renderCanvas();
-            addLog('info', 'Canvas view reset');
-        }
-
-        // Export canvas as image
-        function exportCanvasImage() {
-            const container = document.getElementById('dependency-canvas-container');
-            
-            // TODO: Implement proper canvas export using html2canvas or similar
-            showStatus('⚠️ Canvas export feature coming soon!', 'info');
-            addLog('info', 'Canvas export requested');
-        }
-
-        // Dev persona functions
-        function loadDevView() {
-            addLog('info', 'Loading Dev view...');
-            // TODO: Load GitHub sync status
-        }
-
-        function syncGitHubToJira() {
-            showStatus('🔄 Syncing GitHub PRs to Jira...', 'info');
-            addLog('info', 'Starting GitHub → Jira sync');
-            // TODO: Trigger actual sync
-            setTimeout(() => {
-                showStatus('✅ Sync completed!', 'success');
-                addLog('success', 'GitHub sync completed');
-            }, 2000);
-        }
-
-        function viewSyncLog() {
-            switchTab('logs');
-            addLog('info', 'Viewing sync log');
-        }
-
-        // SM persona functions
-        async function loadSMView() {
-            addLog('info', 'Loading SM view...');
-            await loadRealInsights();
-            loadHygieneReport();
-        }
-
-        async function loadRealInsights() {
-            try {
-                const response = await fetch('/api/insights', {
-                    headers: {'X-Days': '7'}
-                });
-                const data = await response.json();
-                
-                if (data.insights && data.insights.length > 0) {
-                    displayInsights(data.insights);
-                } else {
-                    // Show placeholder if no insights yet
-                    displayPlaceholderInsights();
-                }
-            } catch (error) {
-                addLog('error', 'Failed to load insights: ' + error.message);
-                displayPlaceholderInsights();
-            }
-        }
-
-        function displayInsights(insights) {
-            const container = document.getElementById('sm-insights');
-            container.innerHTML = '';
-            
-            insights.forEach(insight => {
-                const severityColor = {
-                    'error': '#DE350B',
-                    'warning': '#FF991F',
-                    'info': '#0052CC'
-                }[insight.severity] || '#0052CC';
-                
-                const item = document.createElement('div');
-                item.className = 'favorite-item';
-                item.style.borderLeftColor = severityColor;
-                item.innerHTML = `
-                    <div class="favorite-header">
-                        <div class="favorite-name">${insight.title}</div>
-                        <div style="display: flex; gap: 5px;">
-                            <button class="btn-small" onclick="viewInsightDetails(${insight.id})">View</button>
-                            ${!insight.resolved ? `<button class="btn-small btn-success" onclick="resolveInsight(${insight.id})">✓ Resolve</button>` : ''}
-                        </div>
-                    </div>
-                    <div class="favorite-desc">${insight.message}</div>
-                    <div style="font-size: 11px; color: #5E6C84; margin-top: 8px;">
-                        ${new Date(insight.timestamp).toLocaleString()}
-                    </div>
-                `;
-                container.appendChild(item);
-            });
-            
-            addLog('info', `Loaded ${insights.length} insights`);
-        }
-
-        function displayPlaceholderInsights() {
-            const container = document.getElementById('sm-insights');
-            container.innerHTML = `
-                <div class="favorite-item" style="border-left-color: #0052CC;">
-                    <div class="favorite-header">
-                        <div class="favorite-name">📊 No Insights Yet</div>
-                    </div>
-                    <div class="favorite-desc">
-                        Run insights analysis to detect patterns, issues, and trends in your Jira data.
-                        Click "Run Hygiene Check" to generate insights.
-                    </div>
-                </div>
-            `;
-        }
-
-        async function resolveInsight(insightId) {
-            try {
-                const response = await fetch('/api/insights/resolve', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({id: insightId})
-                });
-                const data = await response.json();
-                
-                if (data.success) {
-                    showStatus('✅ Insight marked as resolved', 'success');
-                    loadRealInsights(); // Refresh
-                } else {
-                    showStatus('❌ Failed to resolve: ' + data.error, 'error');
-                }
-            } catch (error) {
-                showStatus('❌ Error: ' + error.message, 'error');
-            }
-        }
-
-        function viewInsightDetails(insightId) {
-            addLog('info', `Viewing insight #${insightId}`);
-            showStatus(`📊 Viewing insight details...`, 'info');
-            // TODO: Show detailed modal or navigate to detail view
-        }
-
-        function loadHygieneReport() {
-            const report = document.getElementById('sm-hygiene-report');
-            report.innerHTML = `
-                <div class="workflow-item" style="border-left-color: #FF991F;">
-                    <div class="workflow-info">
-                        <div class="workflow-name">7 Stale Tickets</div>
-                        <div class="workflow-desc">No updates in 14+ days</div>
-                    </div>
-                    <button class="btn-small">View</button>
-                </div>
-                <div class="workflow-item" style="border-left-color: #FF991F;">
-                    <div class="workflow-info">
-                        <div class="workflow-name">5 Missing Story Points</div>
-                        <div class="workflow-desc">Stories without estimates</div>
-                    </div>
-                    <button class="btn-small">View</button>
-                </div>
-                <div class="workflow-item" style="border-left-color: #DE350B;">
-                    <div class="workflow-info">
-                        <div class="workflow-name">3 Long-Running Stories</div>
-                        <div class="workflow-desc">In progress > 10 days</div>
-                    </div>
-                    <button class="btn-small">View</button>
-                </div>
-            `;
-        }
-
-        async function runHygieneCheck() {
-            showStatus('🔍 Running hygiene check...', 'info');
-            addLog('info', 'Running team hygiene check');
-            
-            // TODO: Gather real Jira data from scraper
-            // For now, run with sample data
-            const sampleData = {
-                stories: [],
-                bugs: [],
-                tickets: [],
-                velocity_history: [38, 42, 45, 40, 38],
-                sprint_data: {}
-            };
-            
-            try {
-                const response = await fetch('/api/insights/run', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({jira_data: sampleData})
-                });
-                const data = await response.json();
-                
-                if (data.success) {
-                    showStatus(`✅ Analysis complete: ${data.insights.length} insights generated`, 'success');
-                    addLog('success', `Hygiene check completed: ${data.insights.length} insights`);
-                    loadRealInsights(); // Refresh display
-                } else {
-                    showStatus('❌ Analysis failed: ' + data.error, 'error');
-                }
-            } catch (error) {
-                showStatus('❌ Error: ' + error.message, 'error');
-                addLog('error', 'Hygiene check failed: ' + error.message);
-            }
-        }
-
-        function exportHygieneReport() {
-            const csv = 'Issue Type,Count,Severity,Description\\n' +
-                        'Stale Tickets,7,Medium,No updates in 14+ days\\n' +
-                        'Missing Story Points,5,Medium,Stories without estimates\\n' +
-                        'Long-Running Stories,3,High,In progress > 10 days\\n';
-            
-            const blob = new Blob([csv], { type: 'text/csv' });
-            const url = window.URL.createObjectURL(blob);
-            const a = document.createElement('a');
-            a.href = url;
-            a.download = `hygiene-report-${new Date().toISOString().split('T')[0]}.csv`;
-            a.click();
-            
-            showStatus('✅ Hygiene report exported', 'success');
-            addLog('success', 'Hygiene report exported to CSV');
-        }
-
-        function viewInsight(type) {
-            addLog('info', `Viewing ${type} insight`);
-            showStatus(`📊 Viewing ${type} insight details...`, 'info');
-            // TODO: Show detailed insight modal or navigate to detail view
-        }
-
-        // ========================================
-        // FEEDBACK SYSTEM
-        // ========================================
-        let feedbackAttachments = [];
-        let mediaRecorder = null;
-        let recordedChunks = [];
-        let recordingStartTime = null;
-        let recordingInterval = null;
-        let hasGitHubToken = false;
-
-        // Console log capture
-        (function() {
-            const originalLog = console.log;
-            const originalError = console.error;
-            const originalWarn = console.warn;
-            
-            console.log = function(...args) {
-                captureConsoleLog('log', args.join(' '));
-                originalLog.apply(console, args);
-            };
-            
-            console.error = function(...args) {
-                captureConsoleLog('error', args.join(' '));
-                originalError.apply(console, args);
-            };
-            
-            console.warn = function(...args) {
-                captureConsoleLog('warn', args.join(' '));
-                originalWarn.apply(console, args);
-            };
-            
-            window.addEventListener('error', (event) => {
-                captureConsoleLog('error', `${event.message} at ${event.filename}:${event.lineno}`);
-            });
-        })();
-
-        function captureConsoleLog(level, message) {
-            fetch('/api/feedback/console-log', {
-                method: 'POST',
-                headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify({
-                    level: level,
-                    message: message,
-                    timestamp: new Date().toISOString()
-                })
-            }).catch(() => {});  // Silent fail
-        }
-
-        async function initFeedbackSystem() {
-            // First check localStorage (fastest path)
-            const savedToken = localStorage.getItem('jira_github_token');
-            if (savedToken) {
-                hasGitHubToken = true;
-                console.log('GitHub token found in localStorage');
-                return;
-            }
-            
-            // No token in localStorage - check if saved in server config (persisted across restarts)
-            try {
-                const response = await fetch('/api/config');
-                if (response.ok) {
-                    const config = await response.json();
-                    const serverToken = config?.feedback?.github_token;
-                    
-                    // If server has a valid token, sync it to localStorage
-                    if (serverToken && 
-                        serverToken !== '' && 
-                        serverToken !== 'YOUR_GITHUB_TOKEN_HERE' &&
-                        serverToken !== 'your_token_here') {
-                        localStorage.setItem('jira_github_token', serverToken);
-                        hasGitHubToken = true;
-                        console.log('GitHub token loaded from server config and synced to localStorage');
-                        return;
-                    }
-                }
-            } catch (error) {
-                console.warn('Failed to check server for feedback token:', error);
-            }
-            
-            hasGitHubToken = false;
-            console.log('No GitHub token - feedback will save locally only');
-        }
-
-        function openFeedbackModal() {
-            // Check if token is configured
-            const savedToken = localStorage.getItem('jira_github_token');
-            if (!savedToken) {
-                // Show setup modal first
-                document.getElementById('github-token-modal').style.display = 'block';
-                return;
-            }
-            
-            // Token exists, open feedback modal directly
-            document.getElementById('feedback-modal').style.display = 'block';
-        }
-
-        function minimizeFeedbackModal() {
-            // Hide the modal
-            document.getElementById('feedback-modal').style.display = 'none';
-            
-            // Show minimized indicator
-            const indicator = document.getElementById('feedback-minimized-indicator');
-            if (!indicator) {
-                // Create indicator if it doesn't exist
-                const div = document.createElement('div');
-                div.id = 'feedback-minimized-indicator';
-                div.style.cssText = `
-                    position: fixed;
-                    bottom: 20px;
-                    right: 90px;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    padding: 12px 20px;
-                    border-radius: 8px;
-                    box-shadow: 0 4px 12px rgba(0,0,0,0.3);
-                    cursor: pointer;
-                    z-index: 998;
-                    font-weight: 600;
-                    display: flex;
-                    align-items: center;
-                    gap: 8px;
-                    transition: transform 0.2s;
-                `;
-                div.innerHTML = '📝 Feedback (minimized)';
-                div.onclick = restoreFeedbackModal;
-                div.onmouseenter = function() { this.style.transform = 'scale(1.05)'; };
-                div.onmouseleave = function() { this.style.transform = 'scale(1)'; };
-                document.body.appendChild(div);
-            } else {
-                indicator.style.display = 'flex';
-            }
-            
-            addLog('info', 'Feedback modal minimized (data preserved)');
-        }
-
-        function restoreFeedbackModal() {
-            // Show the modal
-            document.getElementById('feedback-modal').style.display = 'block';
-            
-            // Hide minimized indicator
-            const indicator = document.getElementById('feedback-minimized-indicator');
-            if (indicator) {
-                indicator.style.display = 'none';
-            }
-            
-            addLog('info', 'Feedback modal restored');
-        }
-
-        function closeFeedbackModal() {
-            document.getElementById('feedback-modal').style.display = 'none';
-            
-            // Hide minimized indicator if visible
-            const indicator = document.getElementById('feedback-minimized-indicator');
-            if (indicator) {
-                indicator.style.display = 'none';
-            }
-            
-            // Reset form
-            document.getElementById('feedback-title').value = '';
-            document.getElementById('feedback-description').value = '';
-            document.getElementById('feedback-attachments').innerHTML = '';
-            feedbackAttachments = [];
-            
-            // Stop recording if active
-            if (mediaRecorder && mediaRecorder.state === 'recording') {
-                stopRecordingAndRestore();
-            }
-        }
-
-        function closeGitHubTokenModal() {
-            document.getElementById('github-token-modal').style.display = 'none';
-        }
-
-        async function saveGitHubToken() {
-            const token = document.getElementById('github-token-input').value.trim();
-            
-            if (!token) {
-                showTokenStatus('Please enter a token', 'error');
-                return;
-            }
-            
-            showTokenStatus('Validating token...', 'info');
-            
-            try {
-                // Validate token by calling GitHub API directly
-                const response = await fetch('https://api.github.com/user', {
-                    headers: {
-                        'Authorization': `token ${token}`
-                    }
-                });
-                
-                if (response.ok) {
-                    const userData = await response.json();
-                    
-                    // Save to localStorage (for current session)
-                    localStorage.setItem('jira_github_token', token);
-                    
-                    // Also save to server config (for persistence across app restarts)
-                    try {
-                        const saveResponse = await fetch('/api/feedback/save-token', {
-                            method: 'POST',
-                            headers: {'Content-Type': 'application/json'},
-                            body: JSON.stringify({
-                                token: token,
-                                repo: 'mikejsmith1985/jira-automation'
-                            })
-                        });
-                        if (!saveResponse.ok) {
-                            console.warn('Failed to save token to server config');
-                        } else {
-                            console.log('Token saved to server config for persistence');
-                        }
-                    } catch (saveError) {
-                        console.warn('Error saving token to server:', saveError);
-                    }
-                    
-                    showTokenStatus(`✅ Token validated for user: ${userData.login}`, 'success');
-                    hasGitHubToken = true;
-                    setTimeout(() => {
-                        closeGitHubTokenModal();
-                        openFeedbackModal();
-                    }, 1500);
-                } else {
-                    const errorData = await response.json();
-                    showTokenStatus('Invalid token: ' + errorData.message, 'error');
-                }
-            } catch (error) {
-                showTokenStatus('Validation failed: ' + error.message, 'error');
-            }
-        }
-
-        function showTokenStatus(message, type) {
-            const status = document.getElementById('token-status');
-            status.textContent = message;
-            status.className = 'status-' + type;
-            status.style.display = 'block';
-        }
-
-        async function captureScreenshot() {
-            try {
-                addLog('info', 'Capturing screenshot...');
-                
-                // Use html2canvas to capture the page
-                const canvas = await html2canvas(document.body);
-                const blob = await new Promise(resolve => canvas.toBlob(resolve, 'image/png', 0.9));
-                const reader = new FileReader();
-                
-                reader.onloadend = function() {
-                    const base64 = reader.result.split(',')[1];
-                    feedbackAttachments.push({
-                        name: `screenshot-${Date.now()}.png`,
-                        content: base64,
-                        mime_type: 'image/png',
-                        type: 'image'
-                    });
-                    renderAttachments();
-                    showStatus('✅ Screenshot captured', 'success');
-                };
-                
-                reader.readAsDataURL(blob);
-                
-            } catch (error) {
-                showStatus('❌ Screenshot failed: ' + error.message, 'error');
-                addLog('error', 'Screenshot capture failed: ' + error.message);
-            }
-        }
-
-        // Recording flow: Step 1 - User clicks "Record Video" button
-        function prepareRecording() {
-            // Minimize modal
-            minimizeFeedbackModal();
-            
-            // Show "Start Recording" overlay button
-            const overlay = document.createElement('div');
-            overlay.id = 'recording-start-overlay';
-            overlay.style.cssText = `
-                position: fixed;
-                top: 20px;
-                right: 20px;
-                z-index: 99999;
-                background: rgba(0, 0, 0, 0.9);
-                padding: 20px;
-                border-radius: 12px;
-                box-shadow: 0 4px 20px rgba(0,0,0,0.5);
-            `;
-            overlay.innerHTML = `
-                <div style="color: white; text-align: center;">
-                    <div style="font-size: 18px; font-weight: 600; margin-bottom: 10px;">Ready to Record</div>
-                    <div style="font-size: 14px; color: #aaa; margin-bottom: 15px;">Navigate to where you want to start</div>
-                    <button id="start-record-btn" style="
-                        background: #DE350B;
-                        color: white;
-                        border: none;
-                        padding: 12px 24px;
-                        border-radius: 6px;
-                        font-size: 16px;
-                        font-weight: 600;
-                        cursor: pointer;
-                        transition: background 0.2s;
-                    ">⏺ Start Recording</button>
-                </div>
-            `;
-            document.body.appendChild(overlay);
-            
-            document.getElementById('start-record-btn').onclick = startActualRecording;
-            
-            addLog('info', 'Recording prepared - waiting for user to click Start');
-        }
-
-        // Recording flow: Step 2 - User clicks "Start Recording"
-        async function startActualRecording() {
-            // Remove the start overlay
-            const startOverlay = document.getElementById('recording-start-overlay');
-            if (startOverlay) startOverlay.remove();
-            
-            try {
-                const stream = await navigator.mediaDevices.getDisplayMedia({
-                    video: { mediaSource: 'screen' },
-                    audio: false
-                });
-                
-                mediaRecorder = new MediaRecorder(stream, {
-                    mimeType: 'video/webm'
-                });
-                
-                recordedChunks = [];
-                
-                mediaRecorder.ondataavailable = (event) => {
-                    if (event.data.size > 0) {
-                        recordedChunks.push(event.data);
-                    }
-                };
-                
-                mediaRecorder.onstop = async () => {
-                    const blob = new Blob(recordedChunks, { type: 'video/webm' });
-                    const reader = new FileReader();
-                    
-                    reader.onloadend = function() {
-                        const base64 = reader.result.split(',')[1];
-                        feedbackAttachments.push({
-                            name: `recording-${Date.now()}.webm`,
-                            content: base64,
-                            mime_type: 'video/webm',
-                            type: 'video'
-                        });
-                        renderAttachments();
-                        
-                        // Remove recording overlay
-                        const overlay = document.getElementById('recording-timer-overlay');
-                        if (overlay) overlay.remove();
-                        
-                        // Restore modal
-                        restoreFeedbackModal();
-                        showFeedbackStatus('✅ Video recording saved', 'success');
-                    };
-                    
-                    reader.readAsDataURL(blob);
-                    stream.getTracks().forEach(track => track.stop());
-                };
-                
-                mediaRecorder.start();
-                recordingStartTime = Date.now();
-                
-                // Show recording timer overlay
-                const overlay = document.createElement('div');
-                overlay.id = 'recording-timer-overlay';
-                overlay.style.cssText = `
-                    position: fixed;
-                    top: 20px;
-                    right: 20px;
-                    z-index: 99999;
-                    background: rgba(222, 53, 11, 0.95);
-                    padding: 15px 20px;
-                    border-radius: 8px;
-                    box-shadow: 0 4px 20px rgba(0,0,0,0.5);
-                    display: flex;
-                    align-items: center;
-                    gap: 12px;
-                `;
-                overlay.innerHTML = `
-                    <span style="color: white; font-size: 24px; animation: pulse 1s infinite;">⏺</span>
-                    <div style="color: white;">
-                        <div style="font-weight: 600; font-size: 16px;" id="recording-timer-text">00:0</div>
-                        <div style="font-size: 12px; opacity: 0.9;">Recording...</div>
-                    </div>
-                    <button id="stop-record-btn" style="
-                        background: rgba(0,0,0,0.3);
-                        color: white;
-                        border: 1px solid rgba(255,255,255,0.3);
-                        padding: 8px 16px;
-                        border-radius: 6px;
-                        font-size: 14px;
-                        font-weight: 600;
-                        cursor: pointer;
-                        margin-left: 8px;
-                    ">⏹ Stop</button>
-                `;
-                
-                // Add pulse animation
-                const style = document.createElement('style');
-                style.textContent = '@keyframes pulse { 0%, 100% { opacity: 1; } 50% { opacity: 0.3; } }';
-                document.head.appendChild(style);
-                
-                document.body.appendChild(overlay);
-                
-                document.getElementById('stop-record-btn').onclick = stopRecording;
-                
-                // Update timer
-                recordingInterval = setInterval(() => {
-                    if (recordingStartTime) {
-                        const elapsed = Date.now() - recordingStartTime;
-                        const seconds = Math.floor(elapsed / 1000);
-                        const ms = Math.floor((elapsed % 1000) / 100);
-                        const timerEl = document.getElementById('recording-timer-text');
-                        if (timerEl) {
-                            timerEl.textContent = `${String(seconds).padStart(2, '0')}:${ms}`;
-                        }
-                    }
-                }, 100);
-                
-                // Auto-stop after 30 seconds
-                setTimeout(() => {
-                    if (mediaRecorder && mediaRecorder.state === 'recording') {
-                        stopRecording();
-                    }
-                }, 30000);
-                
-                addLog('info', 'Recording started (30s max)');
-                
-            } catch (error) {
-                // Remove any overlays on error
-                const startOverlay = document.getElementById('recording-start-overlay');
-                if (startOverlay) startOverlay.remove();
-                
-                restoreFeedbackModal();
-                showFeedbackStatus('❌ Recording failed: ' + error.message, 'error');
-                addLog('error', 'Video recording failed: ' + error.message);
-            }
-        }
-
-        // Recording flow: Step 3 - Stop recording (manual or auto)
-        function stopRecording() {
-            if (mediaRecorder && mediaRecorder.state === 'recording') {
-                mediaRecorder.stop();
-                clearInterval(recordingInterval);
-                addLog('info', 'Recording stopped');
-            }
-        }
-
-        function updateRecordingTimer() {
-            if (recordingStartTime) {
-                const elapsed = Date.now() - recordingStartTime;
-                const seconds = Math.floor(elapsed / 1000);
-                const ms = Math.floor((elapsed % 1000) / 100);
-                document.getElementById('recording-timer').textContent = 
-                    `${String(seconds).padStart(2, '0')}:${ms}`;
-            }
-        }
-
-        function renderAttachments() {
-            const container = document.getElementById('feedback-attachments');
-            container.innerHTML = '';
-            
-            feedbackAttachments.forEach((attachment, index) => {
-                const preview = document.createElement('div');
-                preview.className = 'attachment-preview';
-                
-                if (attachment.type === 'image') {
-                    preview.innerHTML = `
-                        <img src="data:${attachment.mime_type};base64,${attachment.content}" alt="${attachment.name}">
-                        <div style="font-size: 11px; color: #5E6C84; margin-bottom: 5px;">${attachment.name}</div>
-                        <button class="btn-danger btn-small" onclick="removeAttachment(${index})">Remove</button>
-                    `;
-                } else if (attachment.type === 'video') {
-                    preview.innerHTML = `
-                        <video controls src="data:${attachment.mime_type};base64,${attachment.content}"></video>
-                        <div style="font-size: 11px; color: #5E6C84; margin-bottom: 5px;">${attachment.name}</div>
-                        <button class="btn-danger btn-small" onclick="removeAttachment(${index})">Remove</button>
-                    `;
-                }
-                
-                container.appendChild(preview);
-            });
-        }
-
-        function removeAttachment(index) {
-            feedbackAttachments.splice(index, 1);
-            renderAttachments();
-        }
-
-        async function submitFeedback() {
-            const title = document.getElementById('feedback-title').value.trim();
-            const description = document.getElementById('feedback-description').value.trim();
-            const includeLogs = document.getElementById('feedback-include-logs').checked;
-            
-            if (!title || !description) {
-                showFeedbackStatus('Please fill in title and description', 'error');
-                return;
-            }
-            
-            const submitBtn = document.getElementById('submit-feedback-btn');
-            submitBtn.disabled = true;
-            submitBtn.textContent = 'Submitting...';
-            
-            // Get GitHub token from localStorage (like forge-terminal)
-            const githubToken = localStorage.getItem('jira_github_token');
-            const repoName = 'mikejsmith1985/jira-automation';
-            
-            let githubIssueUrl = null;
-            let githubIssueNumber = null;
-            
-            // Try to create GitHub issue (frontend, won't crash server)
-            if (githubToken) {
-                try {
-                    showFeedbackStatus('Creating GitHub issue...', 'info');
-                    
-                    // Build issue body
-                    let body = description + '\\n\\n';
-                    
-                    // Add logs if requested
-                    if (includeLogs) {
-                        body += '## Application Logs\\n```\\n';
-                        body += logs.map(l => `[${l.timestamp}] ${l.level.toUpperCase()}: ${l.message}`).join('\\n');
-                        body += '\\n```\\n\\n';
-                    }
-                    
-                    // Add system info
-                    body += '## System Information\\n';
-                    body += `- User Agent: ${navigator.userAgent}\\n`;
-                    body += `- Timestamp: ${new Date().toISOString()}\\n`;
-                    
-                    // Upload screenshots to GitHub repo (if any)
-                    const imageUrls = [];
-                    for (let i = 0; i < feedbackAttachments.length; i++) {
-                        const attachment = feedbackAttachments[i];
-                        if (attachment.type === 'image') {
-                            try {
-                                showFeedbackStatus(`Uploading screenshot ${i + 1}/${feedbackAttachments.length}...`, 'info');
-                                const timestamp = new Date().toISOString().replace(/[:.]/g, '-');
-                                const filename = `feedback-${timestamp}-${i}.png`;
-                                const content = attachment.content;
-                                
-                                const uploadRes = await fetch(`https://api.github.com/repos/${repoName}/contents/feedback-screenshots/${filename}`, {
-                                    method: 'PUT',
-                                    headers: {
-                                        'Authorization': `token ${githubToken}`,
-                                        'Content-Type': 'application/json',
-                                    },
-                                    body: JSON.stringify({
-                                        message: 'Upload feedback screenshot',
-                                        content: content,
-                                    })
-                                });
-                                
-                                if (uploadRes.ok) {
-                                    const uploadData = await uploadRes.json();
-                                    imageUrls.push(uploadData.content.download_url);
-                                    addLog('success', `Screenshot ${i + 1} uploaded successfully`);
-                                } else {
-                                    const errorData = await uploadRes.json();
-                                    const errorMsg = `Screenshot upload failed: ${uploadRes.status} - ${errorData.message || 'Unknown error'}`;
-                                    console.error(errorMsg, errorData);
-                                    addLog('error', errorMsg);
-                                }
-                            } catch (err) {
-                                const errorMsg = `Screenshot upload error: ${err.message}`;
-                                console.error(errorMsg, err);
-                                addLog('error', errorMsg);
-                            }
-                        }
-                    }
-                    
-                    // Add screenshots to body
-                    if (imageUrls.length > 0) {
-                        body += '\\n## Screenshots\\n';
-                        imageUrls.forEach(url => {
-                            body += `![screenshot](${url})\\n\\n`;
-                        });
-                        addLog('success', `${imageUrls.length} screenshot(s) attached to issue`);
-                    } else if (feedbackAttachments.length > 0) {
-                        // Had attachments but none uploaded successfully
-                        const imgCount = feedbackAttachments.filter(a => a.type === 'image').length;
-                        if (imgCount > 0) {
-                            addLog('warn', `${imgCount} screenshot(s) failed to upload - check token permissions`);
-                        }
-                    }
-                    
-                    // Create the issue via GitHub API
-                    showFeedbackStatus('Creating issue...', 'info');
-                    const issueRes = await fetch(`https://api.github.com/repos/${repoName}/issues`, {
-                        method: 'POST',
-                        headers: {
-                            'Authorization': `token ${githubToken}`,
-                            'Content-Type': 'application/json',
-                        },
-                        body: JSON.stringify({
-                            title: title,
-                            body: body,
-                            labels: ['user-feedback', 'bug']
-                        })
-                    });
-                    
-                    if (issueRes.ok) {
-                        const issueData = await issueRes.json();
-                        githubIssueUrl = issueData.html_url;
-                        githubIssueNumber = issueData.number;
-                        addLog('success', `GitHub issue #${githubIssueNumber} created`);
-                    } else {
-                        const errorData = await issueRes.json();
-                        addLog('warn', `GitHub issue creation failed: ${errorData.message}`);
-                    }
-                } catch (error) {
-                    console.error('GitHub submission failed:', error);
-                    addLog('warn', 'GitHub submission failed, saving locally only');
-                }
-            }
-            
-            // Always save to SQLite (via backend)
-            try {
-                showFeedbackStatus('Saving feedback...', 'info');
-                const response = await fetch('/api/feedback/submit', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({
-                        title: title,
-                        description: description,
-                        attachments: feedbackAttachments,
-                        include_logs: includeLogs,
-                        github_issue_url: githubIssueUrl,
-                        github_issue_number: githubIssueNumber
-                    })
-                });
-                
-                const data = await response.json();
-                
-                if (data.success) {
-                    if (githubIssueUrl) {
-                        showFeedbackStatus(
-                            `✅ Feedback submitted! <a href="${githubIssueUrl}" target="_blank" style="color: inherit;">View issue #${githubIssueNumber}</a>`,
-                            'success'
-                        );
-                    } else {
-                        showFeedbackStatus('✅ Feedback saved locally (configure GitHub token to sync)', 'success');
-                    }
-                    
-                    setTimeout(() => {
-                        closeFeedbackModal();
-                    }, 3000);
-                } else {
-                    showFeedbackStatus('❌ Error: ' + data.error, 'error');
-                }
-                
-            } catch (error) {
-                showFeedbackStatus('❌ Failed: ' + error.message, 'error');
-                addLog('error', 'Feedback submission error: ' + error.message);
-            } finally {
-                submitBtn.disabled = false;
-                submitBtn.textContent = 'Submit Feedback';
-            }
-        }
-
-        function showFeedbackStatus(message, type) {
-            const status = document.getElementById('feedback-status');
-            status.innerHTML = message;
-            status.className = 'status-' + type;
-            status.style.display = 'block';
-        }
-
-        // Initialize on load
-        window.addEventListener('load', () => {
-            addLog('info', 'UI initialized');
-            loadWorkflows();
-            loadSettings();
-            initFeedbackSystem();
-            
-            // Attach feedback button event listener
-            const feedbackBtn = document.getElementById('feedback-btn');
-            if (feedbackBtn) {
-                feedbackBtn.addEventListener('click', openFeedbackModal);
-            }
-            
-            // Restore selected persona if exists
-            if (selectedPersona) {
-                const personaCards = document.querySelectorAll('.persona-card');
-                personaCards.forEach((card, index) => {
-                    const personas = ['po', 'dev', 'sm'];
-                    if (personas[index] === selectedPersona) {
-                        card.classList.add('selected');
-                        // Trigger persona selection to show quick actions
-                        setTimeout(() => {
-                            card.click();
-                        }, 100);
-                    }
-                });
-            }
-        });
-    </script>
-</body>
-</html>
-"""
 
 def open_browser():
     """Open default browser to the app"""
@@ -6577,7 +3539,6 @@ def open_browser():
     max_attempts = 30  # 3 seconds total (30 * 0.1s)
     for attempt in range(max_attempts):
         try:
-            import urllib.request
             urllib.request.urlopen('http://127.0.0.1:5000/api/status', timeout=0.5)
             safe_print(f"[BROWSER] Server ready after {(attempt + 1) * 0.1:.1f}s")
             break
@@ -6598,27 +3559,26 @@ def run_server():
     global github_feedback
     
     # Initialize GitHub feedback if token exists in config
-    config_path = os.path.join(DATA_DIR, 'config.yaml')
-    if os.path.exists(config_path):
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-                
-            if config and 'feedback' in config:
-                token = config['feedback'].get('github_token')
-                repo = config['feedback'].get('repo')
-                
-                if token and repo and token not in ['YOUR_GITHUB_TOKEN_HERE', 'your_token_here']:
-                    github_feedback = GitHubFeedback(token=token, repo_name=repo)
-                    print("[OK] GitHub feedback system initialized")
-        except yaml.YAMLError as e:
-            print(f"[WARN] Config file is corrupt: {str(e)}")
-        except Exception as e:
-            print(f"[WARN] Could not load config: {str(e)}")
-    # If config doesn't exist, silently continue (first launch)
+    try:
+        config = load_config()
+            
+        if config and 'feedback' in config:
+            token = config['feedback'].get('github_token')
+            repo = config['feedback'].get('repo')
+            
+            if repo and is_real_token(token):
+                github_feedback = GitHubFeedback(token=token, repo_name=repo)
+                print("[OK] GitHub feedback system initialized")
+    except FileNotFoundError:
+        pass  # If config doesn't exist, silently continue (first launch)
+    except yaml.YAMLError as e:
+        print(f"[WARN] Config file is corrupt: {str(e)}")
+    except Exception as e:
+        print(f"[WARN] Could not load config: {str(e)}")
     
     server_address = ('127.0.0.1', 5000)
-    httpd = HTTPServer(server_address, SyncHandler)
+    httpd = ThreadingHTTPServer(server_address, SyncHandler)
+    threading.Thread(target=preload_browser_modules, name='preload', daemon=True).start()
     safe_print("[START] Waypoint starting...")
     safe_print("[SERVER] http://127.0.0.1:5000")
     safe_print("[BROWSER] Opening browser...")
@@ -6697,25 +3657,22 @@ if __name__ == '__main__':
     
     try:
         # Ensure config.yaml exists in DATA_DIR
-        config_file = os.path.join(DATA_DIR, 'config.yaml')
         
         # Migration: Check if running as frozen executable and config doesn't exist in new location
-        if getattr(sys, 'frozen', False) and not os.path.exists(config_file):
+        if getattr(sys, 'frozen', False) and not os.path.exists(CONFIG_PATH):
             # Look for config in old location (exe directory)
             old_config = os.path.join(os.path.dirname(sys.executable), 'config.yaml')
             if os.path.exists(old_config):
-                import shutil
-                shutil.copy(old_config, config_file)
-                safe_print(f"[MIGRATE] Copied config from old location to {config_file}")
+                shutil.copy(old_config, CONFIG_PATH)
+                safe_print(f"[MIGRATE] Copied config from old location to {CONFIG_PATH}")
                 safe_print(f"[INFO] Config is now stored in {DATA_DIR} for persistence across versions")
         
-        if not os.path.exists(config_file):
+        if not os.path.exists(CONFIG_PATH):
             # Copy from bundled template if it doesn't exist
             template_file = os.path.join(BASE_DIR, 'config.yaml')
             if os.path.exists(template_file):
-                import shutil
-                shutil.copy(template_file, config_file)
-                safe_print(f"[INIT] Created config.yaml at {config_file}")
+                shutil.copy(template_file, CONFIG_PATH)
+                safe_print(f"[INIT] Created config.yaml at {CONFIG_PATH}")
             else:
                 safe_print(f"[WARN] No config template found, creating minimal config")
                 # Create minimal config
@@ -6725,8 +3682,7 @@ if __name__ == '__main__':
                     'feedback': {'github_token': '', 'repo': ''},
                     'automation': {}
                 }
-                with open(config_file, 'w', encoding='utf-8') as f:
-                    yaml.dump(minimal_config, f, default_flow_style=False)
+                save_config(minimal_config)
         
         # Start browser opener in background
         threading.Thread(target=open_browser, daemon=True).start()
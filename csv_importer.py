@@ -7,6 +7,7 @@ import io
 import logging
 import sys
 import platform
+from contextlib import contextmanager
 
 # Increase CSV field size limit to handle large descriptions/images
 # Use 2^31-1 on Windows (C long is 32-bit even on 64-bit Windows)
@@ -18,21 +19,37 @@ class JiraCSVImporter:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
 
-    def parse_csv(self, file_content_bytes):
+    @contextmanager
+    def open_reader(self, file_content):
         """
-        Parses raw CSV bytes and returns headers and rows.
+        Yields a csv.DictReader over raw bytes or a binary file object.
+        
+        Rows are decoded and parsed lazily, so callers that don't need the
+        whole export at once (e.g. map_data) can consume them as a stream.
         """
+        if isinstance(file_content, (bytes, bytearray)):
+            file_content = io.BytesIO(file_content)
+        
+        # Decode on the fly; newline='' lets csv handle quoted line breaks and
+        # utf-8-sig drops the BOM Excel-saved exports start with
+        f = io.TextIOWrapper(file_content, encoding='utf-8-sig', newline='')
         try:
-            # Decode bytes to string
-            content = file_content_bytes.decode('utf-8')
-            
-            # Use StringIO to create a file-like object
-            f = io.StringIO(content)
-            
-            # Read CSV
-            reader = csv.DictReader(f)
-            headers = reader.fieldnames
-            rows = list(reader)
+            yield csv.DictReader(f)
+        finally:
+            # Hand the underlying file back to its owner instead of closing it
+            f.detach()
+
+    def parse_csv(self, file_content):
+        """
+        Parses CSV content and returns headers and rows.
+        
+        Accepts raw bytes or a binary file object; file objects are decoded
+        incrementally so large exports are never held in memory twice.
+        """
+        try:
+            with self.open_reader(file_content) as reader:
+                headers = reader.fieldnames
+                rows = list(reader)
             
             return {
                 'success': True,
@@ -49,7 +66,7 @@ class JiraCSVImporter:
         Maps raw CSV rows to internal schema based on provided mapping.
         
         Args:
-            rows: List of dicts (from CSV)
+            rows: Iterable of dicts (from CSV, or an open_reader() reader)
             mapping: Dict of {internal_field: csv_header}
                      e.g. {'key': 'Issue key', 'summary': 'Summary'}
         """
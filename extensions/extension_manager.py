@@ -4,6 +4,7 @@ Handles loading, configuration, and lifecycle of all extensions
 """
 import os
 import yaml
+from yaml_compat import YamlLoader, YamlDumper
 import importlib
 from typing import Dict, List, Optional, Type
 from datetime import datetime
@@ -33,7 +34,7 @@ class ExtensionManager:
         try:
             if os.path.exists(self.config_path):
                 with open(self.config_path, 'r') as f:
-                    config = yaml.safe_load(f) or {}
+                    config = yaml.load(f, Loader=YamlLoader) or {}
                     self.extension_configs = config.get('extensions', {})
                     
                     # Backwards compatibility for flat config structure
@@ -53,12 +54,12 @@ class ExtensionManager:
             config = {}
             if os.path.exists(self.config_path):
                 with open(self.config_path, 'r') as f:
-                    config = yaml.safe_load(f) or {}
+                    config = yaml.load(f, Loader=YamlLoader) or {}
             
             config['extensions'] = self.extension_configs
             
             with open(self.config_path, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False)
+                yaml.dump(config, f, Dumper=YamlDumper, default_flow_style=False)
         except Exception as e:
             print(f"Error saving extension config: {e}")
     
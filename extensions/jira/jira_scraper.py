@@ -5,13 +5,18 @@ Extracts data from Jira via Selenium WebDriver
 import time
 import re
 import urllib.parse
-from typing import Dict, List, Any, Optional
+from contextlib import contextmanager
+from typing import Dict, List, Any
 from datetime import datetime
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+# Issue key in a Jira issue link, e.g. https://jira.example.com/browse/PROJ-123.
+# Project keys start with a letter and may contain digits and underscores (AB2-12, MY_PROJ-7)
+ISSUE_KEY_RE = re.compile(r'/browse/([A-Z][A-Z0-9_]*-\d+)')
+
 
 class JiraScraper:
     """
@@ -19,6 +24,76 @@ class JiraScraper:
     Navigates Jira UI, executes searches, and parses HTML results.
     """
     
+    # Finds and reads every search-result row in the browser in one
+    # execute_script call (instead of a find_element round-trip per field per
+    # row). Mirrors the selector fallbacks the per-row parser used. Rows without
+    # a key attribute fall back to their first /browse/ link; rows with neither
+    # map to null.
+    ISSUE_ROWS_JS = """
+        var rows = Array.prototype.slice.call(document.querySelectorAll('[data-issuekey]'));
+        if (!rows.length) {
+            // Legacy list view: getElementsBy* skips selector parsing
+            var lists = document.getElementsByClassName('issue-list');
+            for (var i = 0; i < lists.length; i++) {
+                Array.prototype.push.apply(rows, lists[i].getElementsByTagName('tr'));
+            }
+        }
+        return rows.map(function(row) {
+            function text(el) { return el ? (el.innerText || '').trim() : ''; }
+            function altOrText(el) { return el ? (el.getAttribute('alt') || text(el)) : ''; }
+            var key = row.getAttribute('data-issuekey');
+            if (!key) {
+                var keyElem = row.querySelector('.issuekey a, [data-issue-key]');
+                key = keyElem ? (text(keyElem) || keyElem.getAttribute('data-issue-key')) : '';
+            }
+            var link = key ? null : row.querySelector('a[href*="/browse/"]');
+            if (!key && !link) return null;
+            return {
+                key: key,
+                href: link ? link.href : '',
+                summary: text(row.querySelector('.summary, [data-field-id="summary"]')),
+                status: text(row.querySelector('.status, [data-field-id="status"]')),
+                type: altOrText(row.querySelector('.issuetype img, [data-field-id="issuetype"]')),
+                priority: altOrText(row.querySelector('.priority img, [data-field-id="priority"]')),
+                assignee: text(row.querySelector('.assignee, [data-field-id="assignee"]'))
+            };
+        });
+    """
+    
+    # Reads the optional fields of an issue page in one execute_script call
+    # (instead of a find_element per field, each raising when the field is
+    # absent). Missing fields come back as empty values.
+    ISSUE_DETAILS_JS = """
+        function text(el) { return el ? (el.innerText || '').trim() : ''; }
+        var type = document.querySelector('#type-val, [data-test-id="issue.views.issue-base.foundation.issue-type.icon"]');
+        var labels = document.querySelectorAll('#labels-val .lozenge, [data-test-id="issue.views.field.multi-select.labels"] span');
+        return {
+            status: text(document.querySelector('#status-val, [data-test-id="issue.views.issue-base.foundation.status.status-field-wrapper"]')),
+            type: type ? (text(type) || type.getAttribute('alt') || '') : '',
+            priority: text(document.querySelector('#priority-val')),
+            assignee: text(document.querySelector('#assignee-val, [data-test-id="issue.views.field.user.assignee"]')),
+            labels: Array.prototype.map.call(labels, text).filter(function(label) { return label; })
+        };
+    """
+    
+    # Reads every issue-link entry on an issue page in one execute_script call
+    # (instead of two find_element round-trips plus a .text per link). Entries
+    # missing a link type or linked issue are dropped, as before.
+    ISSUE_LINKS_JS = """
+        var elems = document.querySelectorAll('#linkingmodule .link-content, [data-test-id="issue.views.field.issuelinks"]');
+        var links = [];
+        for (var i = 0; i < elems.length; i++) {
+            var type = elems[i].querySelector('.link-type, .css-1n7f8a4');
+            var target = elems[i].querySelector('.link-issue-key a, [data-test-id="issue-link"]');
+            if (!type || !target) continue;
+            links.push({
+                type: (type.innerText || '').trim(),
+                target: (target.innerText || '').trim()
+            });
+        }
+        return links;
+    """
+    
     def __init__(self, driver, config: Dict):
         self.driver = driver
         self.config = config
@@ -47,6 +122,20 @@ class JiraScraper:
         except TimeoutException:
             return None
     
+    @contextmanager
+    def _no_implicit_wait(self):
+        """
+        Make missing-element lookups fail immediately instead of waiting out
+        the driver's implicit wait; the probes below expect some selectors to
+        be absent, so each miss would otherwise stall.
+        """
+        previous = self.driver.timeouts.implicit_wait
+        self.driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(previous)
+    
     def navigate_to_search(self) -> bool:
         """Navigate to Jira issue search page"""
         try:
@@ -78,6 +167,9 @@ class JiraScraper:
             self.driver.get(search_url)
             time.sleep(2)
             
+            # Keyed by issue key so rows repeated across pages are kept once
+            issues_by_key = {}
+            
             page = 1
             while len(issues) < max_results:
                 page_issues = self._parse_issue_list()
@@ -85,7 +177,10 @@ class JiraScraper:
                 if not page_issues:
                     break
                 
-                issues.extend(page_issues)
+                for issue in page_issues:
+                    if issue['key'] not in issues_by_key:
+                        issues_by_key[issue['key']] = issue
+                        issues.append(issue)
                 
                 if not self._go_to_next_page():
                     break
@@ -104,91 +199,43 @@ class JiraScraper:
         issues = []
         
         try:
-            issue_rows = self.driver.find_elements(By.CSS_SELECTOR, '[data-issuekey]')
-            
-            if not issue_rows:
-                issue_rows = self.driver.find_elements(By.CSS_SELECTOR, '.issue-list tr')
-            
-            for row in issue_rows:
-                try:
-                    issue = self._parse_issue_row(row)
-                    if issue:
-                        issues.append(issue)
-                except Exception as e:
-                    print(f"Error parsing issue row: {e}")
+            for row_data in self.driver.execute_script(self.ISSUE_ROWS_JS):
+                if not row_data:
                     continue
+                if not row_data['key']:
+                    match = ISSUE_KEY_RE.search(row_data['href'])
+                    if not match:
+                        continue
+                    row_data['key'] = match.group(1)
+                issues.append(self._parse_issue_row(row_data))
                     
         except Exception as e:
             print(f"Error parsing issue list: {e}")
         
         return issues
     
-    def _parse_issue_row(self, row) -> Optional[Dict]:
-        """Parse a single issue row from search results"""
-        try:
-            issue_key = row.get_attribute('data-issuekey')
-            if not issue_key:
-                key_elem = row.find_element(By.CSS_SELECTOR, '.issuekey a, [data-issue-key]')
-                issue_key = key_elem.text or key_elem.get_attribute('data-issue-key')
-            
-            if not issue_key:
-                return None
-            
-            issue = {
-                'key': issue_key,
-                'summary': '',
-                'status': '',
-                'type': '',
-                'priority': '',
-                'assignee': '',
-                'created': '',
-                'updated': '',
-                'epic_link': '',
-                'story_points': 0,
-                'labels': [],
-                'links': []
-            }
-            
-            try:
-                summary_elem = row.find_element(By.CSS_SELECTOR, '.summary, [data-field-id="summary"]')
-                issue['summary'] = summary_elem.text
-            except:
-                pass
-            
-            try:
-                status_elem = row.find_element(By.CSS_SELECTOR, '.status, [data-field-id="status"]')
-                issue['status'] = status_elem.text
-            except:
-                pass
-            
-            try:
-                type_elem = row.find_element(By.CSS_SELECTOR, '.issuetype img, [data-field-id="issuetype"]')
-                issue['type'] = type_elem.get_attribute('alt') or type_elem.text
-            except:
-                pass
-            
-            try:
-                priority_elem = row.find_element(By.CSS_SELECTOR, '.priority img, [data-field-id="priority"]')
-                issue['priority'] = priority_elem.get_attribute('alt') or priority_elem.text
-            except:
-                pass
-            
-            try:
-                assignee_elem = row.find_element(By.CSS_SELECTOR, '.assignee, [data-field-id="assignee"]')
-                issue['assignee'] = assignee_elem.text
-            except:
-                pass
-            
-            return issue
-            
-        except Exception as e:
-            print(f"Error parsing issue row: {e}")
-            return None
+    def _parse_issue_row(self, row_data: Dict) -> Dict:
+        """Build an issue dict from one row snapshot returned by ISSUE_ROWS_JS"""
+        return {
+            'key': row_data['key'],
+            'summary': row_data.get('summary', ''),
+            'status': row_data.get('status', ''),
+            'type': row_data.get('type', ''),
+            'priority': row_data.get('priority', ''),
+            'assignee': row_data.get('assignee', ''),
+            'created': '',
+            'updated': '',
+            'epic_link': '',
+            'story_points': 0,
+            'labels': [],
+            'links': []
+        }
     
     def _go_to_next_page(self) -> bool:
         """Navigate to next page of results"""
         try:
-            next_btn = self.driver.find_element(By.CSS_SELECTOR, '.pagination-next:not(.disabled), [data-page="next"]')
+            with self._no_implicit_wait():
+                next_btn = self.driver.find_element(By.CSS_SELECTOR, '.pagination-next:not(.disabled), [data-page="next"]')
             if next_btn and next_btn.is_enabled():
                 next_btn.click()
                 time.sleep(1)
@@ -234,41 +281,17 @@ class JiraScraper:
             self.driver.get(issue_url)
             time.sleep(2)
             
-            try:
-                summary = self.driver.find_element(By.CSS_SELECTOR, '#summary-val, [data-test-id="issue.views.issue-base.foundation.summary.heading"]')
+            # The summary is the load barrier: wait for it explicitly, then read
+            # the optional fields in one batch
+            with self._no_implicit_wait():
+                summary = self._wait_for_element(By.CSS_SELECTOR, '#summary-val, [data-test-id="issue.views.issue-base.foundation.summary.heading"]')
+            if summary:
                 issue['summary'] = summary.text
-            except:
-                pass
-            
-            try:
-                status = self.driver.find_element(By.CSS_SELECTOR, '#status-val, [data-test-id="issue.views.issue-base.foundation.status.status-field-wrapper"]')
-                issue['status'] = status.text
-            except:
-                pass
-            
-            try:
-                issue_type = self.driver.find_element(By.CSS_SELECTOR, '#type-val, [data-test-id="issue.views.issue-base.foundation.issue-type.icon"]')
-                issue['type'] = issue_type.text or issue_type.get_attribute('alt')
-            except:
-                pass
             
-            try:
-                priority = self.driver.find_element(By.CSS_SELECTOR, '#priority-val')
-                issue['priority'] = priority.text
-            except:
-                pass
-            
-            try:
-                assignee = self.driver.find_element(By.CSS_SELECTOR, '#assignee-val, [data-test-id="issue.views.field.user.assignee"]')
-                issue['assignee'] = assignee.text
-            except:
-                pass
-            
-            try:
-                labels = self.driver.find_elements(By.CSS_SELECTOR, '#labels-val .lozenge, [data-test-id="issue.views.field.multi-select.labels"] span')
-                issue['labels'] = [l.text for l in labels if l.text]
-            except:
-                pass
+            details = self.driver.execute_script(self.ISSUE_DETAILS_JS) or {}
+            for field in ('status', 'type', 'priority', 'assignee', 'labels'):
+                if details.get(field):
+                    issue[field] = details[field]
             
             issue['links'] = self.get_issue_links(issue_key)
             
@@ -290,21 +313,13 @@ class JiraScraper:
         links = []
         
         try:
-            link_elements = self.driver.find_elements(By.CSS_SELECTOR, '#linkingmodule .link-content, [data-test-id="issue.views.field.issuelinks"]')
-            
-            for elem in link_elements:
-                try:
-                    link_type = elem.find_element(By.CSS_SELECTOR, '.link-type, .css-1n7f8a4').text
-                    linked_issue = elem.find_element(By.CSS_SELECTOR, '.link-issue-key a, [data-test-id="issue-link"]')
-                    linked_key = linked_issue.text
-                    
-                    links.append({
-                        'type': link_type,
-                        'target': linked_key,
-                        'direction': 'inward' if 'by' in link_type.lower() else 'outward'
-                    })
-                except:
-                    continue
+            for link in self.driver.execute_script(self.ISSUE_LINKS_JS) or []:
+                link_type = link.get('type', '')
+                links.append({
+                    'type': link_type,
+                    'target': link.get('target', ''),
+                    'direction': 'inward' if 'by' in link_type.lower() else 'outward'
+                })
                     
         except Exception as e:
             print(f"Error getting issue links: {e}")
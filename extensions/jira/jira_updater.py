@@ -44,12 +44,18 @@ class JiraUpdater:
         except TimeoutException:
             return None
     
+    # Present once an issue page has rendered (same load barrier as JiraScraper)
+    ISSUE_LOADED_SELECTOR = '#summary-val, [data-test-id="issue.views.issue-base.foundation.summary.heading"]'
+    
     def navigate_to_issue(self, issue_key: str) -> bool:
         """Navigate to an issue page"""
         try:
             issue_url = f"{self.base_url}/browse/{issue_key}"
             self.driver.get(issue_url)
-            time.sleep(2)
+            # Bulk updates share one browser, so they can't overlap; instead of a
+            # fixed 2s pause per issue, continue as soon as the page has rendered
+            if not self._wait_for_element(By.CSS_SELECTOR, self.ISSUE_LOADED_SELECTOR):
+                print(f"Issue page for {issue_key} did not finish loading; continuing")
             return True
         except Exception as e:
             print(f"Error navigating to issue {issue_key}: {e}")
@@ -374,7 +380,12 @@ class JiraUpdater:
             issues = self.scraper.execute_jql(jql)
             result['total'] = len(issues)
             
-            for issue in issues:
+            for index, issue in enumerate(issues):
+                # Updates drive a single browser session, so they stay sequential;
+                # only pause *between* issues, not after the last one
+                if index and delay_between:
+                    time.sleep(delay_between)
+                
                 issue_key = issue['key']
                 update_result = self.update_issue(issue_key, updates)
                 
@@ -384,8 +395,6 @@ class JiraUpdater:
                     result['updated'] += 1
                 else:
                     result['failed'] += 1
-                
-                time.sleep(delay_between)
             
             result['success'] = result['failed'] == 0
             
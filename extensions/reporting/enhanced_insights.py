@@ -3,6 +3,7 @@ Enhanced Insights Engine
 Flexible, configurable insights and analysis for SM persona
 """
 import re
+import time
 from typing import Dict, List, Any, Optional, Callable
 from datetime import datetime, timedelta
 from storage.data_store import get_data_store
@@ -136,9 +137,16 @@ class EnhancedInsightsEngine:
         }
     ]
     
+    # Seconds get_active_insights serves a cached result to polling clients
+    ACTIVE_INSIGHTS_TTL = 60
+    
     def __init__(self, custom_rules: List[Dict] = None):
         self.data_store = get_data_store()
         self.rules: List[InsightRule] = []
+        # Config version the custom rules came from (set by the owner)
+        self.rules_version: Optional[int] = None
+        # days -> (expiry, insights); cleared when insights are saved or resolved
+        self._active_insights_cache: Dict[int, tuple] = {}
         
         self._load_default_rules()
         
@@ -200,6 +208,7 @@ class EnhancedInsightsEngine:
                     message=insight['message'],
                     affected_issues=insight['affected_issues']
                 )
+                self._active_insights_cache.clear()
         
         insights.sort(key=lambda x: {
             'critical': 0, 'high': 1, 'medium': 2, 'low': 3, 'warning': 4
@@ -208,11 +217,18 @@ class EnhancedInsightsEngine:
         return insights
     
     def get_active_insights(self, days: int = 7) -> List[Dict]:
-        """Get unresolved insights from database"""
-        return self.data_store.get_active_insights(days)
+        """Get unresolved insights from database (cached for ACTIVE_INSIGHTS_TTL)"""
+        cached = self._active_insights_cache.get(days)
+        now = time.monotonic()
+        if cached and cached[0] > now:
+            return cached[1]
+        insights = self.data_store.get_active_insights(days)
+        self._active_insights_cache[days] = (now + self.ACTIVE_INSIGHTS_TTL, insights)
+        return insights
     
     def resolve_insight(self, insight_id: int) -> bool:
         """Mark an insight as resolved"""
+        self._active_insights_cache.clear()
         return self.data_store.resolve_insight(insight_id)
     
     def generate_daily_scrum_insights(self, issues: List[Dict]) -> Dict:
@@ -228,16 +244,20 @@ class EnhancedInsightsEngine:
         hygiene = [i for i in insights if i['category'] == 'hygiene']
         flow = [i for i in insights if i['category'] == 'flow']
         
+        # Normalize the status column once; the blocker list, health score and
+        # discussion points all count over it instead of re-reading each dict
+        statuses = [(issue.get('status') or '').lower() for issue in issues]
+        
         blocked_issues = [
-            issue for issue in issues 
-            if issue.get('status', '').lower() == 'blocked'
+            issue for issue, status in zip(issues, statuses)
+            if status == 'blocked'
         ]
         
         return {
             'summary': {
                 'total_insights': len(insights),
                 'critical_count': sum(1 for i in insights if i['severity'] in ['critical', 'high']),
-                'health_score': self._calculate_health_score(issues, insights)
+                'health_score': self._calculate_health_score(statuses, insights)
             },
             'blockers': {
                 'insights': blockers,
@@ -252,12 +272,12 @@ class EnhancedInsightsEngine:
             },
             'hygiene': hygiene,
             'flow': flow,
-            'discussion_points': self._generate_discussion_points(insights, issues)
+            'discussion_points': self._generate_discussion_points(insights, statuses)
         }
     
-    def _calculate_health_score(self, issues: List[Dict], insights: List[Dict]) -> int:
-        """Calculate team health score (0-100)"""
-        if not issues:
+    def _calculate_health_score(self, statuses: List[str], insights: List[Dict]) -> int:
+        """Calculate team health score (0-100) from lower-cased issue statuses"""
+        if not statuses:
             return 100
         
         score = 100
@@ -273,26 +293,26 @@ class EnhancedInsightsEngine:
             
             score -= severity_penalty
         
-        blocked_pct = sum(1 for i in issues if i.get('status', '').lower() == 'blocked') / len(issues) * 100
+        blocked_pct = statuses.count('blocked') / len(statuses) * 100
         score -= int(blocked_pct * 2)
         
         return max(0, min(100, score))
     
-    def _generate_discussion_points(self, insights: List[Dict], issues: List[Dict]) -> List[str]:
-        """Generate discussion points for daily scrum"""
+    def _generate_discussion_points(self, insights: List[Dict], statuses: List[str]) -> List[str]:
+        """Generate discussion points for daily scrum from lower-cased issue statuses"""
         points = []
         
         critical = [i for i in insights if i['severity'] in ['critical', 'high']]
         if critical:
             points.append(f"⚠️ {len(critical)} high-priority issues need attention")
         
-        blocked = [i for i in issues if i.get('status', '').lower() == 'blocked']
-        if blocked:
-            points.append(f"🚫 {len(blocked)} blocked issues to discuss")
+        blocked_count = statuses.count('blocked')
+        if blocked_count:
+            points.append(f"🚫 {blocked_count} blocked issues to discuss")
         
-        in_progress = [i for i in issues if i.get('status', '').lower() in ['in progress', 'in review']]
-        if len(in_progress) > 10:
-            points.append(f"📊 High WIP: {len(in_progress)} items in progress")
+        in_progress_count = statuses.count('in progress') + statuses.count('in review')
+        if in_progress_count > 10:
+            points.append(f"📊 High WIP: {in_progress_count} items in progress")
         
         if not points:
             points.append("✅ No critical issues - team health looks good!")
@@ -20,6 +20,10 @@ class FeedbackDB:
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
+        # WAL: a commit appends to the log instead of rewriting pages, and
+        # readers don't block the writer (the mode persists in the file)
+        cursor.execute('PRAGMA journal_mode=WAL')
+        
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS feedback (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -36,7 +40,8 @@ class FeedbackDB:
         conn.commit()
         conn.close()
     
-    def add_feedback(self, title, description, logs=None, attachments=None):
+    def add_feedback(self, title, description, logs=None, attachments=None,
+                     status='open', github_issue_url=None):
         """
         Store feedback in database
         
@@ -45,6 +50,8 @@ class FeedbackDB:
             description: Feedback description
             logs: JSON string of log data
             attachments: JSON string of attachments (base64 encoded)
+            status: Initial status ('open', 'local', 'synced')
+            github_issue_url: Issue URL if already synced to GitHub
             
         Returns:
             int: Feedback ID
@@ -55,9 +62,9 @@ class FeedbackDB:
         timestamp = datetime.now().isoformat()
         
         cursor.execute('''
-            INSERT INTO feedback (title, description, timestamp, logs, attachments)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (title, description, timestamp, logs, attachments))
+            INSERT INTO feedback (title, description, timestamp, logs, attachments, status, github_issue_url)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (title, description, timestamp, logs, attachments, status, github_issue_url))
         
         feedback_id = cursor.lastrowid
         conn.commit()
@@ -4,13 +4,38 @@ Submits bug reports and feedback as GitHub issues with attachments
 """
 import os
 import json
-import base64
 import tempfile
+import threading
+from collections import deque
 from datetime import datetime
-from github import Github, GithubException
+from itertools import islice
 from pathlib import Path
 
 
+def base64_decoded_size(content):
+    """
+    Size in bytes of the data a base64 string decodes to, without decoding it
+    
+    Args:
+        content: Base64 text (str or bytes); whitespace/newlines are ignored
+    
+    Raises:
+        ValueError: If content is not validly padded base64
+    """
+    if isinstance(content, str):
+        content = content.encode('ascii')
+    length = len(content) - sum(content.count(c) for c in b' \t\r\n')
+    if length % 4:
+        raise ValueError('Invalid base64 length')
+    if length and content.rstrip().endswith(b'=='):
+        padding = 2
+    elif length and content.rstrip().endswith(b'='):
+        padding = 1
+    else:
+        padding = 0
+    return length // 4 * 3 - padding
+
+
 class GitHubFeedback:
     """Manages feedback submission to GitHub issues"""
     
@@ -29,6 +54,8 @@ class GitHubFeedback:
     
     def _connect(self):
         """Establish connection to GitHub"""
+        # PyGithub is slow to import; load it only when feedback is actually sent
+        from github import Github, GithubException
         try:
             self.client = Github(self.token)
             self.repo = self.client.get_repo(self.repo_name)
@@ -75,7 +102,8 @@ class GitHubFeedback:
             title: Issue title
             body: Issue description
             labels: List of label names
-            attachments: List of dicts with 'name', 'content' (base64), 'mime_type'
+            attachments: List of dicts with 'name', 'mime_type' and either 'size'
+                (bytes) or 'content' (base64)
         
         Returns:
             dict: {'success': bool, 'issue_url': str, 'issue_number': int, 'error': str}
@@ -96,42 +124,51 @@ class GitHubFeedback:
                 labels=issue_labels
             )
             
-            # Upload attachments as comments if present
+            # Note attachments in a single comment. The issues API has no file
+            # upload, so no attachment bytes are ever sent, only their sizes;
+            # one comment keeps that to a single round trip however many files
             if attachments:
+                sections = []
                 for attachment in attachments:
                     name = attachment.get('name', 'attachment')
-                    content = attachment.get('content')  # base64 encoded
                     mime_type = attachment.get('mime_type', 'application/octet-stream')
                     
                     try:
-                        # Decode base64 back to binary
-                        import base64
-                        file_data = base64.b64decode(content)
+                        # Only the size is reported, so callers holding the raw
+                        # file pass it directly; otherwise derive it from the base64
+                        # content without decoding a copy of the file
+                        file_size = attachment.get('size')
+                        if file_size is None:
+                            file_size = base64_decoded_size(attachment.get('content'))
                         
                         # For images, embed in comment (GitHub supports this)
-                        if mime_type.startswith('image/') and len(file_data) < 10_000_000:  # 10MB limit
+                        if mime_type.startswith('image/') and file_size < 10_000_000:  # 10MB limit
                             # GitHub does NOT support data URLs in comments!
                             # GitHub comment limit is 65536 chars, base64 images exceed this
                             # Just note the attachment - user can describe what they saw
-                            size_kb = len(file_data) / 1024
-                            comment_body = f"### {name}\n\n"
-                            comment_body += f"**Type:** {mime_type}\n"
-                            comment_body += f"**Size:** {size_kb:.1f} KB\n\n"
-                            comment_body += "*Screenshot captured during feedback. GitHub API does not support direct image upload to issue comments.*\n"
-                            comment_body += "*Tip: Manually drag-and-drop the screenshot to add it, or describe the issue in the body.*"
-                            
-                            issue.create_comment(comment_body)
+                            size_kb = file_size / 1024
+                            section = f"### {name}\n\n"
+                            section += f"**Type:** {mime_type}\n"
+                            section += f"**Size:** {size_kb:.1f} KB\n\n"
+                            section += "*Screenshot captured during feedback. GitHub API does not support direct image upload to issue comments.*\n"
+                            section += "*Tip: Manually drag-and-drop the screenshot to add it, or describe the issue in the body.*"
                         else:
                             # For videos/large files, just note them
-                            size_mb = len(file_data) / (1024 * 1024)
-                            comment_body = f"### {name}\n\n"
-                            comment_body += f"**Type:** {mime_type}\n"
-                            comment_body += f"**Size:** {size_mb:.2f} MB\n\n"
-                            comment_body += "*Note: File too large to embed directly. Original file captured during feedback submission.*"
-                            issue.create_comment(comment_body)
+                            size_mb = file_size / (1024 * 1024)
+                            section = f"### {name}\n\n"
+                            section += f"**Type:** {mime_type}\n"
+                            section += f"**Size:** {size_mb:.2f} MB\n\n"
+                            section += "*Note: File too large to embed directly. Original file captured during feedback submission.*"
                     except Exception as attach_error:
-                        # If attachment fails, add a comment noting the failure
-                        issue.create_comment(f"⚠️ Failed to attach {name}: {str(attach_error)}")
+                        # If an attachment can't be described, note the failure instead
+                        section = f"⚠️ Failed to attach {name}: {str(attach_error)}"
+                    sections.append(section)
+                
+                try:
+                    issue.create_comment('\n\n'.join(sections))
+                except Exception as comment_error:
+                    # The issue itself was created; don't report it as failed
+                    print(f"[WARN] Failed to add attachment notes to issue #{issue.number}: {comment_error}")
             
             return {
                 'success': True,
@@ -222,6 +259,11 @@ class GitHubFeedback:
 class LogCapture:
     """Captures and aggregates logs for feedback submission"""
     
+    # Only the most recent entries are ever reported, so older ones are dropped
+    # as new ones arrive instead of growing for the life of the app
+    MAX_CONSOLE_LOGS = 1000
+    MAX_NETWORK_ERRORS = 500
+    
     def __init__(self, log_file='jira-sync.log'):
         """
         Initialize log capture
@@ -230,8 +272,21 @@ class LogCapture:
             log_file: Path to application log file
         """
         self.log_file = log_file
-        self.console_logs = []
-        self.network_errors = []
+        self.console_logs = deque(maxlen=self.MAX_CONSOLE_LOGS)
+        self.network_errors = deque(maxlen=self.MAX_NETWORK_ERRORS)
+        # Formatted browser sections of export_all_logs and the JSON array from
+        # export_entries_json, rebuilt only after new entries arrive (the
+        # application log section depends on the clock, so it isn't cached)
+        self._browser_export = None
+        self._entries_json = None
+        # Request threads add entries while a feedback submit iterates them;
+        # reentrant because the exports call get_console_logs/get_network_errors
+        self._lock = threading.RLock()
+    
+    def _entries_changed(self):
+        """Drop the cached exports after console logs or network errors change"""
+        self._browser_export = None
+        self._entries_json = None
     
     def capture_recent_logs(self, minutes=5):
         """
@@ -251,7 +306,10 @@ class LogCapture:
             cutoff_time = datetime.now() - timedelta(minutes=minutes)
             
             recent_logs = []
-            with open(self.log_file, 'r', encoding='utf-8', errors='replace') as f:
+            # Every line is scanned for its timestamp; a 1 MiB buffer keeps a
+            # multi-MB log to a handful of reads and decode passes
+            with open(self.log_file, 'r', encoding='utf-8', errors='replace',
+                      buffering=1024 * 1024) as f:
                 for line in f:
                     # Try to parse timestamp from log line
                     try:
@@ -289,7 +347,20 @@ class LogCapture:
         Args:
             log_entry: Dict with level, message, timestamp
         """
-        self.console_logs.append(log_entry)
+        with self._lock:
+            self.console_logs.append(log_entry)
+            self._entries_changed()
+    
+    def add_console_logs(self, log_entries):
+        """
+        Add a batch of browser console log entries
+        
+        Args:
+            log_entries: Iterable of dicts with level, message, timestamp
+        """
+        with self._lock:
+            self.console_logs.extend(log_entries)
+            self._entries_changed()
     
     def add_network_error(self, error_entry):
         """
@@ -298,7 +369,9 @@ class LogCapture:
         Args:
             error_entry: Dict with url, status, error, timestamp
         """
-        self.network_errors.append(error_entry)
+        with self._lock:
+            self.network_errors.append(error_entry)
+            self._entries_changed()
     
     def get_console_logs(self, limit=100):
         """
@@ -310,7 +383,8 @@ class LogCapture:
         Returns:
             list: Recent console log entries
         """
-        return self.console_logs[-limit:]
+        with self._lock:
+            return list(islice(self.console_logs, max(len(self.console_logs) - limit, 0), None))
     
     def get_network_errors(self, limit=50):
         """
@@ -322,7 +396,22 @@ class LogCapture:
         Returns:
             list: Recent network error entries
         """
-        return self.network_errors[-limit:]
+        with self._lock:
+            return list(islice(self.network_errors, max(len(self.network_errors) - limit, 0), None))
+    
+    def export_entries_json(self):
+        """
+        Serialize every buffered console log, then every network error
+        
+        Returns:
+            str: JSON array, reused until new entries arrive
+        """
+        with self._lock:
+            if self._entries_json is None:
+                self._entries_json = json.dumps(
+                    [*self.console_logs, *self.network_errors], separators=(',', ':')
+                )
+            return self._entries_json
     
     def export_all_logs(self):
         """
@@ -339,6 +428,19 @@ class LogCapture:
         output.append(self.capture_recent_logs(minutes=5))
         output.append("```\n")
         
+        with self._lock:
+            if self._browser_export is None:
+                self._browser_export = self._export_browser_logs()
+            browser_export = self._browser_export
+        if browser_export:
+            output.append(browser_export)
+        
+        return '\n'.join(output)
+    
+    def _export_browser_logs(self):
+        """Format the console log and network error sections of export_all_logs"""
+        output = []
+        
         # Console logs
         if self.console_logs:
             output.append("## Browser Console Logs\n")
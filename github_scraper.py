@@ -22,6 +22,9 @@ HOW IT WORKS:
 """
 import re
 
+# Jira ticket keys look like LETTERS-NUMBERS (like ABC-123); config.yaml can override this
+DEFAULT_TICKET_KEY_PATTERN = r'([A-Z]+-\d+)'
+
 class GitHubScraper:
     """
     The GitHub spy/detective that collects PR information
@@ -33,6 +36,51 @@ class GitHubScraper:
     - Brings the list back to you
     """
     
+    # Reads the first 20 PR boxes in one trip to the browser instead of
+    # several locator calls per PR. The merged/closed badges are found with
+    # one joined selector and told apart by their class afterwards. link.href
+    # (not the href attribute, which is a relative /org/repo/pull/N path) gives
+    # the absolute URL that get_pr_details() can navigate to.
+    PR_ROWS_JS = """
+        rows => rows.slice(0, 20).map(row => {
+            const link = row.querySelector('a.Link--primary');
+            if (!link) return null;
+            const badge = row.querySelector('.State--merged, .State--closed');
+            const author = row.querySelector('.opened-by a');
+            return {
+                title: link.textContent,
+                url: link.href,
+                state: badge ? (badge.classList.contains('State--merged') ? 'merged' : 'closed') : 'open',
+                author: author ? author.textContent : ''
+            };
+        })
+    """
+    
+    # Reads the branch names, latest commit and merger from a PR page in one
+    # trip to the browser. GitHub shows "username wants to merge X commits into
+    # BASE from HEAD"; older pages only have span.css-truncate-target for the
+    # source branch. Anything missing comes back as ''.
+    PR_DETAILS_JS = """
+        () => {
+            const text = selector => {
+                const el = document.querySelector(selector);
+                return el ? el.textContent.trim() : '';
+            };
+            const base = document.querySelector('.base-ref');
+            const head = document.querySelector('.head-ref');
+            return {
+                target_branch: text('.base-ref'),
+                branch_name: base && head ? text('.head-ref') : text('span.css-truncate-target'),
+                last_commit_message: text('a.Link--primary.text-bold'),
+                merged_by: text('.merged .author')
+            };
+        }
+    """
+    
+    # Present once a PR page has rendered its branch names
+    PR_LOADED_SELECTOR = '.base-ref, .head-ref'
+    PR_LOADED_TIMEOUT_MS = 10000
+    
     def __init__(self, page, config):
         """
         Initialize the scraper when it's first created
@@ -45,6 +93,9 @@ class GitHubScraper:
         self.config = config  # All our settings
         self.base_url = config['github']['base_url']  # Usually "https://github.com"
         self.org = config['github']['organization']  # Your company's GitHub org
+        # Compile the ticket key pattern once here instead of for every PR we read
+        pattern = config.get('ticket_keys', {}).get('pattern', DEFAULT_TICKET_KEY_PATTERN)
+        self.ticket_key_re = re.compile(pattern)
         
     def get_recent_prs(self, repo_name, hours_back=24):
         """
@@ -78,15 +129,17 @@ class GitHubScraper:
             
             prs = []  # Empty list to store PRs we find
             
-            # Step 2: Find all PR boxes on the page
+            # Step 2: Read all PR boxes on the page (first 20) in one go
             # GitHub shows PRs in divs with IDs like "issue_1", "issue_2", etc.
-            pr_elements = self.page.locator('div[id^="issue_"]').all()
+            pr_rows = self.page.locator('div[id^="issue_"]').evaluate_all(self.PR_ROWS_JS)
             
             # Step 3: Loop through each PR and extract its data
-            for pr_elem in pr_elements[:20]:  # Only look at first 20 PRs
+            for pr_row in pr_rows:
+                if not pr_row:
+                    continue  # PR box without a title link
                 try:
                     # Extract all the info from this PR
-                    pr_data = self._extract_pr_data(pr_elem, repo_name)
+                    pr_data = self._extract_pr_data(pr_row, repo_name)
                     
                     # Only add it to our list if we got valid data
                     if pr_data:
@@ -105,15 +158,15 @@ class GitHubScraper:
             print(f"Error getting PRs from {repo_name}: {e}")
             return []
     
-    def _extract_pr_data(self, pr_elem, repo_name):
+    def _extract_pr_data(self, pr_row, repo_name):
         """
-        Extract data from a single PR element (private helper function)
+        Extract data from a single PR row (private helper function)
         
         The underscore _ at the start means "this is a helper function, 
         not meant to be called from outside this class"
         
         Args:
-            pr_elem: The Playwright Locator containing PR info
+            pr_row: Dictionary read from the page by PR_ROWS_JS
             repo_name: The repository name
             
         Returns:
@@ -121,9 +174,8 @@ class GitHubScraper:
         """
         try:
             # Step 1: Get the PR title and URL
-            title_elem = pr_elem.locator('a.Link--primary').first
-            title = title_elem.text_content()  # Get the text
-            pr_url = title_elem.get_attribute('href')  # Get the link
+            title = pr_row['title']
+            pr_url = pr_row['url']
             
             # Step 2: Extract PR number from the URL
             # URL looks like: https://github.com/org/repo/pull/123
@@ -133,47 +185,28 @@ class GitHubScraper:
             # Step 3: Find Jira ticket keys in the title
             # Example title: "ABC-123: Fix login bug"
             # Pattern looks for: LETTERS-NUMBERS (like ABC-123)
-            pattern = self.config['ticket_keys']['pattern']
-            ticket_keys = re.findall(pattern, title)
+            ticket_keys = self.ticket_key_re.findall(title)
             
             # If no ticket keys found, this PR isn't linked to Jira
             # So we skip it by returning None
             if not ticket_keys:
                 return None
             
-            # Step 4: Figure out if PR is open, merged, or closed
-            status = 'open'  # Start by assuming it's open
-            try:
-                # Look for status badges
-                if pr_elem.locator('.State--merged').count() > 0:
-                    status = 'merged'  # Purple badge = merged
-                elif pr_elem.locator('.State--closed').count() > 0:
-                    status = 'closed'  # Red badge = closed
-            except:
-                pass  # If we can't find status, just use 'open'
-            
-            # Step 5: Get the author's name
-            author = ''
-            try:
-                # Look for the "opened by X" link
-                author_elem = pr_elem.locator('.opened-by a').first
-                if author_elem.count() > 0:
-                    author = author_elem.text_content()
-            except:
-                pass  # If can't find author, leave empty
+            # Step 4: Status ('open', 'merged' or 'closed') and author were
+            # already read from the badge and "opened by X" link in the browser
             
-            # Step 6: Get the branch name
+            # Step 5: Get the branch name
             # This might require visiting the PR page (slow), so we skip for now
             branch_name = self._get_branch_name(pr_url)
             
-            # Step 7: Return all the data we collected
+            # Step 6: Return all the data we collected
             return {
                 'repo': repo_name,
                 'number': pr_number,
                 'title': title,
                 'url': pr_url,
-                'status': status,
-                'author': author,
+                'status': pr_row['state'],
+                'author': pr_row['author'],
                 'branch': branch_name,
                 'ticket_keys': ticket_keys
             }
@@ -231,54 +264,30 @@ class GitHubScraper:
             }
         """
         try:
-            # Step 1: Navigate to the specific PR page
-            self.driver.get(pr_url)
-            time.sleep(2)  # Wait for page to load
+            # Step 1: Navigate to the specific PR page. GitHub keeps live-update
+            # requests open, so 'networkidle' may never settle; wait for the
+            # branch names to render instead
+            self.page.goto(pr_url, wait_until='domcontentloaded')
+            try:
+                self.page.locator(self.PR_LOADED_SELECTOR).first.wait_for(
+                    state='attached', timeout=self.PR_LOADED_TIMEOUT_MS)
+            except Exception as e:
+                # Older layouts have no .base-ref; read whatever is there
+                print(f"PR branch names not found on {pr_url}: {e}")
+            
+            # Step 2: Read everything we need from the page in one go
+            found = self.page.evaluate(self.PR_DETAILS_JS)
             
-            # Step 2: Create a dictionary to store what we find
+            # Step 3: Create a dictionary to store what we found
             details = {
                 'url': pr_url,
                 'commits': [],  # TODO: Could extract commit list later
-                'last_commit_message': '',
-                'merged_by': '',
-                'branch_name': '',
-                'target_branch': ''  # NEW: Target branch (DEV, INT, etc.)
+                'last_commit_message': found['last_commit_message'],
+                'merged_by': found['merged_by'],
+                'branch_name': found['branch_name'],
+                'target_branch': found['target_branch']  # NEW: Target branch (DEV, INT, etc.)
             }
             
-            # Step 3: Try to find the source and target branch names
-            try:
-                # GitHub shows: "username wants to merge X commits into BASE from HEAD"
-                # Look for the base branch element
-                base_branch_elem = self.driver.find_element(By.CSS_SELECTOR, '.base-ref')
-                details['target_branch'] = base_branch_elem.text.strip()
-                
-                # Also get the source branch (head)
-                head_branch_elem = self.driver.find_element(By.CSS_SELECTOR, '.head-ref')
-                details['branch_name'] = head_branch_elem.text.strip()
-            except:
-                # Fallback: try older selectors
-                try:
-                    branch_elem = self.driver.find_element(By.CSS_SELECTOR, 'span.css-truncate-target')
-                    details['branch_name'] = branch_elem.text
-                except:
-                    pass  # If not found, leave empty
-            
-            # Step 4: Try to find the last commit message
-            try:
-                # Latest commit is usually the first link with class "Link--primary text-bold"
-                commit_elem = self.driver.find_element(By.CSS_SELECTOR, 'a.Link--primary.text-bold')
-                details['last_commit_message'] = commit_elem.text
-            except:
-                pass
-            
-            # Step 5: Try to find who merged it (if it's merged)
-            try:
-                # Merged by info is in the "merged" section, class "author"
-                merged_elem = self.driver.find_element(By.CSS_SELECTOR, '.merged .author')
-                details['merged_by'] = merged_elem.text
-            except:
-                pass  # Not merged, or couldn't find info
-            
             # Return all the details we collected
             return details
             
@@ -25,8 +25,10 @@ def check_login_status(page, debug=False):
         except Exception as e:
             return False, None, f"Browser not accessible: {e}"
 
+        # Only build the diagnostic trail when the caller asked for it
         debug_info = []
-        debug_info.append(f"Current URL: {current_url}")
+        if debug:
+            debug_info.append(f"Current URL: {current_url}")
 
         # Quick check: if on login page, definitely not logged in
         if '/login' in current_url.lower() or '/auth' in current_url.lower():
@@ -42,8 +44,10 @@ def check_login_status(page, debug=False):
                 # Check if any are visible
                 for i in range(count):
                     if login_indicators.nth(i).is_visible():
-                        debug_info.append("Login form detected - not logged in")
-                        return False, None, "; ".join(debug_info)
+                        if debug:
+                            debug_info.append("Login form detected - not logged in")
+                            return False, None, "; ".join(debug_info)
+                        return False, None, "Login form detected - not logged in"
         except:
             pass
         
@@ -112,8 +116,8 @@ def check_login_status(page, debug=False):
                 continue
         
         if logged_in:
-            debug_info.append(f"Logged in detected via: {found_selector}")
             if debug:
+                debug_info.append(f"Logged in detected via: {found_selector}")
                 return logged_in, user_info, "; ".join(debug_info)
             return logged_in, user_info, None
         
@@ -131,8 +135,8 @@ def check_login_status(page, debug=False):
             ]
             for pattern in url_patterns_requiring_login:
                 if pattern in current_url:
-                    debug_info.append(f"Logged in detected via URL pattern: {pattern}")
                     if debug:
+                        debug_info.append(f"Logged in detected via URL pattern: {pattern}")
                         return True, None, "; ".join(debug_info)
                     return True, None, None
         
@@ -142,19 +146,20 @@ def check_login_status(page, debug=False):
             cookies = page.context.cookies()
             jira_cookies = [c for c in cookies if 'atlassian' in c.get('domain', '').lower() or 'jira' in c.get('name', '').lower()]
             if jira_cookies:
-                debug_info.append(f"Found {len(jira_cookies)} Jira-related cookies")
+                if debug:
+                    debug_info.append(f"Found {len(jira_cookies)} Jira-related cookies")
                 # Check for authentication cookies
                 auth_cookies = [c for c in jira_cookies if any(x in c.get('name', '').lower() for x in ['token', 'session', 'auth', 'tenant'])]
                 if auth_cookies:
-                    debug_info.append(f"Authentication cookies present: {[c['name'] for c in auth_cookies]}")
                     if debug:
+                        debug_info.append(f"Authentication cookies present: {[c['name'] for c in auth_cookies]}")
                         return True, None, "; ".join(debug_info)
                     return True, None, None
         except:
             pass
         
-        debug_info.append("No login indicators found")
         if debug:
+            debug_info.append("No login indicators found")
             return False, None, "; ".join(debug_info)
         return False, None, None
                 
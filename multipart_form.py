@@ -0,0 +1,142 @@
+"""
+Multipart Form Parser
+Streams multipart/form-data request bodies (CSV imports, feedback attachments)
+in fixed-size chunks, spooling each part to a temporary file so an upload is
+never held in memory whole. Replaces cgi.FieldStorage, which is deprecated and
+removed in Python 3.13.
+"""
+import tempfile
+from email.parser import BytesHeaderParser
+from email.utils import collapse_rfc2231_value
+
+CHUNK_SIZE = 64 * 1024
+SPOOL_MAX_SIZE = 1024 * 1024  # Parts larger than this move from memory to a temp file
+MAX_HEADER_SIZE = 16 * 1024  # Upper bound on one part's header block
+
+
+class MultipartField:
+    """One form part: name, filename (None for plain fields) and a binary file at offset 0"""
+
+    def __init__(self, name, filename, file):
+        self.name = name
+        self.filename = filename
+        self.file = file
+
+    @property
+    def value(self):
+        """The part's content decoded as UTF-8 (for plain text fields)"""
+        self.file.seek(0)
+        data = self.file.read()
+        self.file.seek(0)
+        return data.decode('utf-8', 'replace')
+
+
+class MultipartForm(dict):
+    """Parsed form fields keyed by name, with cgi.FieldStorage's getvalue()"""
+
+    def getvalue(self, name, default=None):
+        field = self.get(name)
+        return field.value if field is not None else default
+
+
+def _get_boundary(content_type):
+    """Extract the boundary parameter from a multipart Content-Type header"""
+    headers = BytesHeaderParser().parsebytes(
+        b'Content-Type: ' + (content_type or '').encode('latin-1') + b'\r\n\r\n'
+    )
+    if headers.get_content_maintype() != 'multipart':
+        raise ValueError('Expected a multipart/form-data request')
+    boundary = headers.get_param('boundary')
+    if not boundary:
+        raise ValueError('Multipart request has no boundary')
+    return collapse_rfc2231_value(boundary).encode('latin-1')
+
+
+def parse_multipart(fp, content_type, content_length):
+    """
+    Parse a multipart/form-data body read from fp.
+
+    Args:
+        fp: Binary stream positioned at the start of the body (e.g. rfile)
+        content_type: The request's Content-Type header (carries the boundary)
+        content_length: Number of body bytes to read from fp
+
+    Returns:
+        MultipartForm mapping field name -> MultipartField
+
+    Raises:
+        ValueError: If the body is not well-formed multipart data
+    """
+    delimiter = b'\r\n--' + _get_boundary(content_type)
+    header_parser = BytesHeaderParser()
+    form = MultipartForm()
+    remaining = content_length
+    # A leading CRLF lets the opening boundary match the same delimiter as the rest
+    buf = b'\r\n'
+
+    def fill():
+        """Append the next chunk of the body to buf; False once it is exhausted"""
+        nonlocal buf, remaining
+        if remaining <= 0:
+            return False
+        chunk = fp.read(min(CHUNK_SIZE, remaining))
+        if not chunk:
+            remaining = 0  # Client closed the connection early
+            return False
+        remaining -= len(chunk)
+        buf += chunk
+        return True
+
+    # Skip any preamble up to the first boundary
+    while True:
+        index = buf.find(delimiter)
+        if index >= 0:
+            buf = buf[index + len(delimiter):]
+            break
+        buf = buf[-(len(delimiter) - 1):]
+        if not fill():
+            raise ValueError('Multipart body has no boundary')
+
+    while True:
+        # After a boundary, "--" closes the body; otherwise part headers follow
+        while len(buf) < 4 and fill():
+            pass
+        if buf.startswith(b'--'):
+            break
+        if not buf.startswith(b'\r\n'):
+            raise ValueError('Malformed multipart boundary line')
+
+        header_end = buf.find(b'\r\n\r\n')
+        while header_end < 0:
+            if len(buf) > MAX_HEADER_SIZE or not fill():
+                raise ValueError('Malformed multipart part headers')
+            header_end = buf.find(b'\r\n\r\n')
+        headers = header_parser.parsebytes(buf[2:header_end + 4])
+        buf = buf[header_end + 4:]
+
+        # Stream the part body to a spool file, holding back enough bytes to
+        # catch a delimiter split across two reads
+        spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+        while True:
+            index = buf.find(delimiter)
+            if index >= 0:
+                spool.write(buf[:index])
+                buf = buf[index + len(delimiter):]
+                break
+            keep = len(delimiter) - 1
+            if len(buf) > keep:
+                spool.write(buf[:-keep])
+                buf = buf[-keep:]
+            if not fill():
+                spool.close()
+                raise ValueError('Multipart body ended before its closing boundary')
+        spool.seek(0)
+
+        name = headers.get_param('name', header='content-disposition')
+        if name is None:
+            spool.close()
+            continue
+        name = collapse_rfc2231_value(name)
+        form[name] = MultipartField(name, headers.get_filename(), spool)
+
+    return form
@@ -3,11 +3,27 @@ ServiceNow scraper module - Playwright version
 Handles data extraction from ServiceNow PRB tickets via browser automation
 Now using Playwright for better modern web app support and native Shadow DOM handling
 """
+import re
 import time
 import logging
 import os
 from datetime import datetime
 
+# Page-text patterns for extract_prb_data, compiled once rather than per ticket
+PRB_NUMBER_RE = re.compile(r'(PRB\d{7,})')
+INCIDENT_NUMBER_RE = re.compile(r'INC\d{7,}')
+# Common patterns: "Short description\n<value>" or "Short description: <value>"
+SHORT_DESCRIPTION_RES = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'Short description[:\s]+(.+?)(?:\n|$)',
+    r'Problem statement[:\s]+(.+?)(?:\n|$)',
+    r'short_description[:\s]+(.+?)(?:\n|$)',
+)]
+# "Description" label followed by content until next field/section
+DESCRIPTION_RES = [re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in (
+    r'Description[:\s]+(.+?)(?:\n\n|\nProblem statement|\nConfiguration item|\nRelated|$)',
+    r'problem\.description[:\s]+(.+?)(?:\n\n|\nProblem statement|\nConfiguration item|$)',
+)]
+
 class ServiceNowScraper:
     """Scrapes data from ServiceNow Problem (PRB) tickets using Playwright"""
     
@@ -17,6 +33,20 @@ class ServiceNowScraper:
     ELEMENT_TIMEOUT_MS = 10000  # 10 seconds max wait for elements (failure timeout)
     FAST_TIMEOUT_MS = 3000  # 3 seconds for optional checks (reduced from aggressive 500ms)
     
+    # Incident list rows -> [{number, summary}] (header row skipped, rows
+    # without a link in the first cell dropped)
+    INCIDENT_ROWS_JS = """
+        rows => rows.slice(1).map(row => {
+            const cells = row.querySelectorAll('td');
+            const link = cells.length >= 2 ? cells[0].querySelector('a') : null;
+            if (!link) return null;
+            return {
+                number: link.textContent.trim(),
+                summary: cells.length >= 3 ? cells[2].textContent.trim() : ''
+            };
+        }).filter(row => row !== null)
+    """
+    
     def __init__(self, page, config):
         """
         Initialize ServiceNow scraper
@@ -83,8 +113,12 @@ class ServiceNowScraper:
             self._log(f"Failed to capture screenshot: {e}", 'error')
             return None
     
-    def _capture_page_state(self, prb_number):
-        """Capture comprehensive page state for debugging"""
+    def _capture_page_state(self, prb_number, content=None):
+        """Capture comprehensive page state for debugging
+
+        Pass content when the caller already holds page.content() so the
+        (possibly multi-MB) HTML isn't serialized twice.
+        """
         self._log("=== DIAGNOSTIC SNAPSHOT ===")
         
         screenshot_path = None
@@ -102,7 +136,8 @@ class ServiceNowScraper:
             screenshot_path = self._capture_diagnostic_screenshot(prb_number, "failure")
             
             # Page content preview
-            content = self.page.content()
+            if content is None:
+                content = self.page.content()
             preview = content[:500].replace('\n', ' ').replace('\r', '')
             self._log(f"Content preview: {preview}...")
             
@@ -135,8 +170,10 @@ class ServiceNowScraper:
             
             # Save full HTML for debugging
             html_path = os.path.join(self.diagnostics_dir, f"prb_fail_{prb_number}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html")
-            with open(html_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Encode in chunks so a large page never exists as str and bytes at once
+            with open(html_path, 'wb') as f:
+                for start in range(0, len(content), 64 * 1024):
+                    f.write(content[start:start + 64 * 1024].encode('utf-8', 'replace'))
             self._log(f"HTML saved: {html_path}")
             
         except Exception as e:
@@ -194,6 +231,7 @@ class ServiceNowScraper:
             bool: True if navigation successful, False otherwise
         """
         self.start_time = time.time()
+        self.frame = None  # Re-detected per PRB; the scraper may be reused across navigations
         screenshot_path = None
         
         try:
@@ -262,38 +300,32 @@ class ServiceNowScraper:
                 "input[id*='problem']",  # Any input with 'problem' in ID
             ]
             
+            # One wait on the selector union: returns as soon as any of them is
+            # attached, instead of a full timeout per selector that isn't there
+            form_selector = ', '.join(form_selectors)
+            
             form_found = False
-            for selector in form_selectors:
-                try:
-                    self._log(f"Checking for element: {selector}")
-                    locator = self.page.locator(selector).first
-                    # Playwright waits efficiently - returns immediately when element appears
-                    locator.wait_for(state='attached', timeout=self.ELEMENT_TIMEOUT_MS)
-                    self._log(f"✓ Found form element: {selector}")
-                    form_found = True
-                    break
-                except Exception as e:
-                    self._log(f"Not found: {selector} ({str(e)[:50]}...)")
-                    continue
+            try:
+                self._log(f"Checking for any of: {form_selector}")
+                locator = self.page.locator(form_selector).first
+                locator.wait_for(state='attached', timeout=self.ELEMENT_TIMEOUT_MS)
+                form_found = True
+                self._log(f"✓ Found form element: #{locator.get_attribute('id')}")
+            except Exception as e:
+                self._log(f"Form elements not found ({str(e)[:50]}...)")
             
             if not form_found:
                 # Try iframe - ServiceNow commonly uses #gsft_main iframe
                 self._log("Form not found in main page, checking iframe...")
                 try:
                     frame = self.page.frame_locator('#gsft_main')
-                    for selector in form_selectors:
-                        try:
-                            locator = frame.locator(selector).first
-                            locator.wait_for(state='attached', timeout=self.ELEMENT_TIMEOUT_MS)
-                            self._log(f"✓ Found form element in iframe: {selector}")
-                            form_found = True
-                            self.frame = frame
-                            break
-                        except Exception as e:
-                            self._log(f"Iframe selector {selector} failed: {str(e)[:50]}")
-                            continue
+                    locator = frame.locator(form_selector).first
+                    locator.wait_for(state='attached', timeout=self.ELEMENT_TIMEOUT_MS)
+                    form_found = True
+                    self.frame = frame
+                    self._log(f"✓ Found form element in iframe: #{locator.get_attribute('id')}")
                 except Exception as e:
-                    self._log(f"Iframe check failed: {e}", 'warning')
+                    self._log(f"Iframe check failed: {str(e)[:50]}", 'warning')
             
             if not form_found:
                 # Last resort: check if PRB number is anywhere in page content
@@ -305,7 +337,7 @@ class ServiceNowScraper:
                     self.frame = self.page
                 else:
                     self._log(f"✗ PRB {prb_number} NOT found in page content", 'error')
-                    screenshot_path = self._capture_page_state(prb_number)
+                    screenshot_path = self._capture_page_state(prb_number, content)
                     return False
             
             # === STEP 4: Final verification ===
@@ -356,8 +388,6 @@ class ServiceNowScraper:
         prb_data = {}
         
         try:
-            import re
-            
             # Get all visible text from page body (works for read-only and editable fields)
             self._log("Extracting visible text from page...")
             page_text = self.page.inner_text('body')
@@ -372,41 +402,30 @@ class ServiceNowScraper:
                 pass
             
             # 1. Extract PRB number (should be in page somewhere)
-            prb_match = re.search(r'(PRB\d{7,})', page_text)
+            prb_match = PRB_NUMBER_RE.search(page_text)
             prb_data['prb_number'] = prb_match.group(1) if prb_match else ''
             self._log(f"PRB Number: {prb_data['prb_number']}")
             
             # 2. Extract short description (look for label + value pattern)
-            # Common patterns: "Short description\n<value>" or "Short description: <value>"
-            short_patterns = [
-                r'Short description[:\s]+(.+?)(?:\n|$)',
-                r'Problem statement[:\s]+(.+?)(?:\n|$)',
-                r'short_description[:\s]+(.+?)(?:\n|$)',
-            ]
             prb_data['short_description'] = ''
-            for pattern in short_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE)
+            for pattern in SHORT_DESCRIPTION_RES:
+                match = pattern.search(page_text)
                 if match:
                     prb_data['short_description'] = match.group(1).strip()
                     break
             self._log(f"Short Description: {prb_data['short_description'][:100]}...")
             
             # 3. Extract long description (multi-line field)
-            # Look for "Description" label followed by content until next field/section
-            desc_patterns = [
-                r'Description[:\s]+(.+?)(?:\n\n|\nProblem statement|\nConfiguration item|\nRelated|$)',
-                r'problem\.description[:\s]+(.+?)(?:\n\n|\nProblem statement|\nConfiguration item|$)',
-            ]
             prb_data['description'] = ''
-            for pattern in desc_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE | re.DOTALL)
+            for pattern in DESCRIPTION_RES:
+                match = pattern.search(page_text)
                 if match:
                     prb_data['description'] = match.group(1).strip()
                     break
             self._log(f"Description: {prb_data['description'][:100]}...")
             
             # 4. Extract all related INC numbers from anywhere in the page
-            inc_matches = re.findall(r'INC\d{7,}', page_text)
+            inc_matches = INCIDENT_NUMBER_RE.findall(page_text)
             prb_data['related_incidents'] = list(set(inc_matches))  # Dedupe
             self._log(f"Related Incidents: {prb_data['related_incidents']}")
             
@@ -451,7 +470,7 @@ class ServiceNowScraper:
                 if value:
                     return value
             except Exception as e:
-                self.logger.debug(f"[SNOW] GlideForm failed for {field_id}: {e}")
+                self.logger.debug("[SNOW] GlideForm failed for %s: %s", field_id, e)
         
         # APPROACH 1: Container-based extraction (works in read-only view)
         # Playwright waits efficiently - returns immediately when element is ready
@@ -460,7 +479,10 @@ class ServiceNowScraper:
             container = self.frame.locator(f"[id='{container_id}']").first
             container.wait_for(state='attached', timeout=self.FAST_TIMEOUT_MS)
             
-            # Try read-only value spans first (for closed/resolved tickets)
+            # Try read-only value spans first (for closed/resolved tickets).
+            # The container and its children are rendered together, so once the
+            # container is attached an absent child won't appear later: check
+            # with count() instead of waiting out a timeout per missing selector
             readonly_selectors = [
                 '.readonly-value',
                 '[id*="readonly"]',
@@ -470,8 +492,8 @@ class ServiceNowScraper:
             for selector in readonly_selectors:
                 try:
                     readonly_el = container.locator(selector).first
-                    # Playwright's smart wait - no time wasted!
-                    readonly_el.wait_for(state='attached', timeout=1000)
+                    if readonly_el.count() == 0:
+                        continue
                     value = readonly_el.text_content().strip()
                     if value:
                         return value
@@ -481,7 +503,8 @@ class ServiceNowScraper:
             # If no read-only value, try input within container (edit mode)
             try:
                 input_el = container.locator('input, textarea, select').first
-                input_el.wait_for(state='attached', timeout=1000)
+                if input_el.count() == 0:
+                    raise LookupError(f"no input in {container_id}")
                 
                 tag_name = input_el.evaluate('el => el.tagName.toLowerCase()')
                 if tag_name == 'select':
@@ -495,7 +518,7 @@ class ServiceNowScraper:
                 pass
                 
         except Exception as e:
-            self.logger.debug(f"[SNOW] Container approach failed for {field_id}: {e}")
+            self.logger.debug("[SNOW] Container approach failed for %s: %s", field_id, e)
         
         # APPROACH 2: Direct field lookup (legacy, reduced timeout 2000ms → 500ms)
         field_variations = [field_id]
@@ -524,7 +547,7 @@ class ServiceNowScraper:
                     return locator.input_value()
                     
             except Exception as e:
-                self.logger.debug(f"[SNOW] Direct lookup failed for {variation}: {e}")
+                self.logger.debug("[SNOW] Direct lookup failed for %s: %s", variation, e)
                 continue
         
         self.logger.warning(f"[SNOW] Field not found: {field_id}")
@@ -546,29 +569,18 @@ class ServiceNowScraper:
             # Wait for incident table to load using element check instead of sleep
             self.frame.locator(".list_table").first.wait_for(state='visible', timeout=5000)
             
-            # Find all incident rows
-            rows = self.frame.locator(".list_table tr").all()
-            
-            for row in rows[1:]:  # Skip header
-                try:
-                    cells = row.locator("td").all()
-                    if len(cells) >= 2:
-                        inc_number = cells[0].locator("a").text_content().strip()
-                        
-                        inc_summary = ''
-                        if len(cells) >= 3:
-                            inc_summary = cells[2].text_content().strip()
-                        
-                        if inc_number.startswith('INC'):
-                            incidents.append({
-                                'number': inc_number,
-                                'summary': inc_summary
-                            })
-                            self.logger.info(f"[SNOW] Found incident: {inc_number}")
-                            
-                except Exception as e:
-                    self.logger.warning(f"[SNOW] Error parsing incident row: {e}")
-                    continue
+            # Read every incident row in one evaluate call instead of a
+            # locator round-trip per row and per cell
+            rows = self.frame.locator(".list_table tr").evaluate_all(self.INCIDENT_ROWS_JS)
+            
+            for row in rows:
+                inc_number = row['number']
+                if inc_number.startswith('INC'):
+                    incidents.append({
+                        'number': inc_number,
+                        'summary': row['summary']
+                    })
+                    self.logger.info(f"[SNOW] Found incident: {inc_number}")
             
             if not incidents:
                 self.logger.warning("[SNOW] No incidents found in Incidents tab")
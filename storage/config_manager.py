@@ -4,6 +4,7 @@ YAML-based configuration management with schema validation
 """
 import os
 import yaml
+from yaml_compat import YamlLoader, YamlDumper
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
@@ -61,6 +62,9 @@ class ConfigManager:
         self.config_path = config_path
         self._config: Dict = {}
         self._last_modified: Optional[datetime] = None
+        # Bumped on every load or in-memory change, so callers that build
+        # objects from config (e.g. the insights engine) know when to rebuild
+        self.version = 0
         self.load()
     
     def load(self) -> Dict:
@@ -68,7 +72,7 @@ class ConfigManager:
         try:
             if os.path.exists(self.config_path):
                 with open(self.config_path, 'r', encoding='utf-8') as f:
-                    self._config = yaml.safe_load(f) or {}
+                    self._config = yaml.load(f, Loader=YamlLoader) or {}
                 self._last_modified = datetime.fromtimestamp(
                     os.path.getmtime(self.config_path)
                 )
@@ -82,13 +86,14 @@ class ConfigManager:
             self._config = {}
             self._apply_defaults()
         
+        self.version += 1
         return self._config
     
     def save(self) -> bool:
         """Save configuration to file"""
         try:
             with open(self.config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(self._config, f, default_flow_style=False, allow_unicode=True)
+                yaml.dump(self._config, f, Dumper=YamlDumper, default_flow_style=False, allow_unicode=True)
             self._last_modified = datetime.now()
             return True
         except Exception as e:
@@ -148,6 +153,7 @@ class ConfigManager:
                 config = config[k]
             
             config[keys[-1]] = value
+            self.version += 1
             
             if save:
                 return self.save()
@@ -164,6 +170,7 @@ class ConfigManager:
     def set_section(self, section: str, data: Dict, save: bool = True) -> bool:
         """Set entire configuration section"""
         self._config[section] = data
+        self.version += 1
         if save:
             return self.save()
         return True
@@ -178,6 +185,7 @@ class ConfigManager:
         Merges with existing config.
         """
         self._config = self._merge_defaults(self._config, updates)
+        self.version += 1
         if save:
             return self.save()
         return True
@@ -192,6 +200,7 @@ class ConfigManager:
             self._config['extensions'] = {}
         
         self._config['extensions'][extension_name] = config
+        self.version += 1
         
         if save:
             return self.save()
@@ -210,6 +219,7 @@ class ConfigManager:
             self._config['insights']['rules'] = []
         
         self._config['insights']['rules'].append(rule)
+        self.version += 1
         
         if save:
             return self.save()
@@ -219,6 +229,7 @@ class ConfigManager:
         """Remove an insight rule by name"""
         rules = self._config.get('insights', {}).get('rules', [])
         self._config['insights']['rules'] = [r for r in rules if r.get('name') != rule_name]
+        self.version += 1
         
         if save:
             return self.save()
@@ -261,6 +272,7 @@ class ConfigManager:
                 self._config[section] = self.DEFAULT_CONFIG[section].copy()
         else:
             self._config = self.DEFAULT_CONFIG.copy()
+        self.version += 1
         
         if save:
             return self.save()
@@ -268,15 +280,16 @@ class ConfigManager:
     
     def export_config(self) -> str:
         """Export configuration as YAML string"""
-        return yaml.dump(self._config, default_flow_style=False, allow_unicode=True)
+        return yaml.dump(self._config, Dumper=YamlDumper, default_flow_style=False, allow_unicode=True)
     
     def import_config(self, yaml_str: str, save: bool = True) -> bool:
         """Import configuration from YAML string"""
         try:
-            new_config = yaml.safe_load(yaml_str)
+            new_config = yaml.load(yaml_str, Loader=YamlLoader)
             if isinstance(new_config, dict):
                 self._config = new_config
                 self._apply_defaults()
+                self.version += 1
                 if save:
                     return self.save()
                 return True
@@ -293,9 +306,9 @@ def get_config_manager(config_path: str = None) -> ConfigManager:
     """Get or create the global config manager instance"""
     global _config_instance
     if _config_instance is None:
-        # If no path provided, use DATA_DIR/config.yaml
+        # If no path provided, use the app's DATA_DIR/config.yaml
         if config_path is None:
-            from app import DATA_DIR
-            config_path = os.path.join(DATA_DIR, 'config.yaml')
+            from app import CONFIG_PATH
+            config_path = CONFIG_PATH
         _config_instance = ConfigManager(config_path)
     return _config_instance
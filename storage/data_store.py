@@ -5,6 +5,7 @@ SQLite-based storage for imported data, insights, and metrics
 import os
 import json
 import sqlite3
+import threading
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 from contextlib import contextmanager
@@ -18,16 +19,29 @@ class DataStore:
     
     def __init__(self, db_path: str = 'data/waypoint.db'):
         self.db_path = db_path
+        # Connection of the transaction() block open on each thread, if any
+        self._local = threading.local()
         
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         
         self._init_schema()
     
+    def _connect(self):
+        """Open a connection; WAL (set in _init_schema) makes NORMAL sync crash-safe"""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+    
     @contextmanager
     def _get_connection(self):
         """Get database connection with context manager"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        shared = getattr(self._local, 'conn', None)
+        if shared is not None:
+            # Inside transaction(): it commits or rolls back once at the end
+            yield shared
+            return
+        conn = self._connect()
         try:
             yield conn
             conn.commit()
@@ -37,9 +51,35 @@ class DataStore:
         finally:
             conn.close()
     
+    @contextmanager
+    def transaction(self):
+        """
+        Run several saves on one connection and commit them together.
+        
+        Each save otherwise opens its own connection and commits (one disk
+        sync each); inside this block they share a single write transaction.
+        """
+        if getattr(self._local, 'conn', None) is not None:
+            yield  # Already inside an outer transaction on this thread
+            return
+        conn = self._connect()
+        self._local.conn = conn
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            yield
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._local.conn = None
+            conn.close()
+    
     def _init_schema(self):
         """Initialize database schema"""
         with self._get_connection() as conn:
+            # Journal mode is stored in the database file, so setting it once is enough
+            conn.execute('PRAGMA journal_mode=WAL')
             cursor = conn.cursor()
             
             cursor.execute('''
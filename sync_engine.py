@@ -3,6 +3,7 @@ GitHub-Jira Sync Engine - Playwright version
 Orchestrates the sync between GitHub PRs and Jira tickets
 """
 import yaml
+from yaml_compat import YamlLoader
 import time
 import logging
 from datetime import datetime
@@ -13,13 +14,17 @@ from jira_automator import JiraAutomator
 class SyncEngine:
     """Main sync orchestration engine"""
     
-    def __init__(self, page, config_path='config.yaml'):
+    def __init__(self, page, config_path='config.yaml', config=None):
         self.page = page  # Playwright Page object
         
-        # Load configuration (handle missing file gracefully)
+        # Load configuration (handle missing file gracefully); callers that
+        # already hold the parsed config pass it in to skip re-reading the file
         try:
-            with open(config_path, 'r') as f:
-                self.config = yaml.safe_load(f)
+            if config is not None:
+                self.config = config
+            else:
+                with open(config_path, 'r') as f:
+                    self.config = yaml.load(f, Loader=YamlLoader)
         except FileNotFoundError:
             # Config doesn't exist yet - use minimal defaults
             self.config = {
@@ -88,7 +93,7 @@ class SyncEngine:
                         self.logger.info(f"  🔄 PR state changed: {pr_id} ({previous_status} → {current_status})")
                         should_process = True
                     else:
-                        self.logger.debug(f"  ⏭️ Skipping {pr_id} (no state change)")
+                        self.logger.debug("  ⏭️ Skipping %s (no state change)", pr_id)
                         should_process = False
                     
                     if should_process:
@@ -215,8 +220,15 @@ class SyncEngine:
         # If no rules defined, return empty
         return {}
     
-    def start_scheduled(self):
-        """Start scheduled sync runs"""
+    def start_scheduled(self, run_sync=None):
+        """Start scheduled sync runs
+        
+        Args:
+            run_sync: Called instead of sync_once() for each scheduled run, so a
+                host app can run it on its browser thread and skip it while
+                another sync is in progress
+        """
+        self._run_sync = run_sync or self.sync_once
         sched_config = self.config['schedule']
         
         if not sched_config['enabled']:
@@ -252,4 +264,4 @@ class SyncEngine:
             return
         
         # Run sync
-        self.sync_once()
+        self._run_sync()
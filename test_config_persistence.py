@@ -6,6 +6,11 @@ import unittest
 from unittest.mock import Mock, patch
 import os
 import sys
+import json
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 
 class TestConfigPersistenceAcrossUpdates(unittest.TestCase):
@@ -87,5 +92,104 @@ class TestUpdateProcess(unittest.TestCase):
         pass
 
 
+class TestConfigJsonSidecar(unittest.TestCase):
+    """Test the config.yaml.json parse cache load_config() reads through"""
+    
+    def setUp(self):
+        import app
+        self.app = app
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.temp_dir, 'config.yaml')
+        self.sidecar_path = self.config_path + '.json'
+        self.patches = [
+            patch.object(app, 'CONFIG_PATH', self.config_path),
+            patch.object(app, 'CONFIG_JSON_CACHE_PATH', self.sidecar_path),
+        ]
+        for p in self.patches:
+            p.start()
+        app.config_cache['key'] = None
+    
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        self.app.config_cache['key'] = None
+        shutil.rmtree(self.temp_dir)
+    
+    def write_yaml(self, text):
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        # The in-process cache is keyed the same way; start each read cold
+        self.app.config_cache['key'] = None
+    
+    def read_sidecar(self):
+        with open(self.sidecar_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def test_sidecar_written_and_used(self):
+        """Test: First load writes the sidecar; later loads read it"""
+        self.write_yaml('jira:\n  base_url: https://a.atlassian.net\n')
+        
+        config = self.app.load_config()
+        sidecar = self.read_sidecar()
+        st = os.stat(self.config_path)
+        self.assertEqual(sidecar['source'], [st.st_mtime_ns, st.st_size])
+        self.assertEqual(sidecar['config'], config)
+        
+        # A sidecar that still matches is trusted over the YAML
+        sidecar['config'] = {'from': 'sidecar'}
+        with open(self.sidecar_path, 'w', encoding='utf-8') as f:
+            json.dump(sidecar, f)
+        self.app.config_cache['key'] = None
+        self.assertEqual(self.app.load_config(), {'from': 'sidecar'})
+    
+    def test_stale_sidecar_ignored_and_rewritten(self):
+        """Test: A sidecar whose mtime/size don't match config.yaml is ignored"""
+        self.write_yaml('jira:\n  base_url: https://old.atlassian.net\n')
+        self.app.load_config()
+        
+        self.write_yaml('jira:\n  base_url: https://new-site.atlassian.net\n')
+        config = self.app.load_config()
+        
+        self.assertEqual(config['jira']['base_url'], 'https://new-site.atlassian.net')
+        sidecar = self.read_sidecar()
+        st = os.stat(self.config_path)
+        self.assertEqual(sidecar['source'], [st.st_mtime_ns, st.st_size])
+        self.assertEqual(sidecar['config'], config)
+    
+    def test_non_json_config_never_cached(self):
+        """Test: Configs JSON can't round-trip (dates, non-string keys) get no sidecar"""
+        for text in ('sync:\n  last_run: 2024-01-02\n',
+                     'ports:\n  5000: app\n'):
+            self.write_yaml(text)
+            
+            config = self.app.load_config()
+            
+            self.assertFalse(os.path.exists(self.sidecar_path), text)
+            self.assertEqual(self.app.load_config(), config)
+    
+    def test_save_config_removes_sidecar(self):
+        """Test: save_config deletes the sidecar along with the cached parse"""
+        self.write_yaml('jira:\n  base_url: https://a.atlassian.net\n')
+        self.app.load_config()
+        self.assertTrue(os.path.exists(self.sidecar_path))
+        
+        self.app.save_config({'jira': {'base_url': 'https://b.atlassian.net'}})
+        
+        self.assertFalse(os.path.exists(self.sidecar_path))
+        self.assertEqual(self.app.load_config()['jira']['base_url'], 'https://b.atlassian.net')
+    
+    @unittest.skipIf(sys.platform == 'win32', 'POSIX permissions')
+    def test_sidecar_private_permissions(self):
+        """Test: The sidecar holds tokens too, so it's created 0600"""
+        self.write_yaml('feedback:\n  github_token: ghp_secret\n')
+        old_umask = os.umask(0)
+        try:
+            self.app.load_config()
+        finally:
+            os.umask(old_umask)
+        
+        self.assertEqual(os.stat(self.sidecar_path).st_mode & 0o777, 0o600)
+
+
 if __name__ == '__main__':
     unittest.main()
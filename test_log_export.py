@@ -150,6 +150,81 @@ def test_5_log_export_includes_recent_errors():
     else:
         print("NOTE: May not include very recent logs (depends on log file flush)")
 
+def check_tail_matches_readlines(content, count):
+    """tail_text_file agrees with readlines() on a file holding content"""
+    import app
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'tail.log')
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write(content)
+        
+        total, tail = app.tail_text_file(path, count)
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+    
+    expected_tail = lines[-count:] if count > 0 else []
+    assert total == len(lines), f"Expected {len(lines)} lines, counted {total}"
+    assert tail == expected_tail, f"Tail mismatch for count={count}"
+    return total, tail
+
+def test_6_tail_small_file():
+    """TEST 6: Tail of a file smaller than the first read window"""
+    print("\n" + "="*70)
+    print("TEST 6: Log Tail - File Smaller Than Window")
+    print("="*70)
+    
+    content = ''.join(f"2026-01-01 INFO line {i}\n" for i in range(20))
+    for count in (0, 1, 5, 20, 500):
+        check_tail_matches_readlines(content, count)
+    
+    print("PASSED: Small file tail matches readlines()")
+
+def test_7_tail_unterminated_last_line():
+    """TEST 7: Tail of a file whose last line has no trailing newline"""
+    print("\n" + "="*70)
+    print("TEST 7: Log Tail - Unterminated Last Line")
+    print("="*70)
+    
+    content = ''.join(f"line {i}\n" for i in range(10)) + "partial line, still being written"
+    for count in (1, 3, 11, 500):
+        total, tail = check_tail_matches_readlines(content, count)
+    
+    assert total == 11, f"Unterminated line should count, got {total}"
+    assert tail[-1] == "partial line, still being written"
+    
+    print("PASSED: Unterminated last line is counted and returned")
+
+def test_8_tail_needs_window_doubling():
+    """TEST 8: Tail of a file needing several window doublings"""
+    print("\n" + "="*70)
+    print("TEST 8: Log Tail - Several Window Doublings")
+    print("="*70)
+    
+    import app
+    
+    # Long lines and a tiny first window: 500 lines span many doublings
+    content = ''.join(f"{i:05d} " + "x" * (i % 97) + "\n" for i in range(2000))
+    with patch.object(app, 'TAIL_WINDOW_SIZE', 64), \
+         patch.object(app, 'TAIL_COUNT_CHUNK_SIZE', 1000):
+        for count in (1, 50, 500, 1999, 2000, 2500):
+            check_tail_matches_readlines(content, count)
+    
+    print("PASSED: Tail matches readlines() across window doublings")
+
+def test_9_tail_empty_file():
+    """TEST 9: Tail of an empty file"""
+    print("\n" + "="*70)
+    print("TEST 9: Log Tail - Empty File")
+    print("="*70)
+    
+    for count in (0, 500):
+        total, tail = check_tail_matches_readlines('', count)
+        assert total == 0 and tail == []
+    
+    print("PASSED: Empty file has no lines")
+
 if __name__ == '__main__':
     print("\n" + "="*70)
     print("TDD TEST SUITE: Log Export Functionality")
@@ -161,7 +236,11 @@ if __name__ == '__main__':
         test_2_log_export_includes_version,
         test_3_log_export_includes_config_diagnostics,
         test_4_log_export_no_sensitive_data,
-        test_5_log_export_includes_recent_errors
+        test_5_log_export_includes_recent_errors,
+        test_6_tail_small_file,
+        test_7_tail_unterminated_last_line,
+        test_8_tail_needs_window_doubling,
+        test_9_tail_empty_file
     ]
     
     passed = 0
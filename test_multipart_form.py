@@ -0,0 +1,204 @@
+"""
+Test Suite: Multipart Form Parser
+
+Tests the streaming multipart/form-data parser used by the CSV import and
+feedback upload endpoints, and that both endpoints reject malformed bodies
+with 400 rather than a server error.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from io import BytesIO
+from unittest.mock import Mock, patch
+
+import multipart_form
+from multipart_form import parse_multipart
+
+BOUNDARY = 'XyZzY0123456789'
+CONTENT_TYPE = f'multipart/form-data; boundary={BOUNDARY}'
+
+
+def build_body(parts, preamble=b'', closing=True):
+    """Encode [(disposition, content bytes)] as a multipart body"""
+    body = preamble
+    for disposition, content in parts:
+        body += f'--{BOUNDARY}\r\nContent-Disposition: {disposition}\r\n\r\n'.encode('latin-1')
+        body += content + b'\r\n'
+    if closing:
+        body += f'--{BOUNDARY}--\r\n'.encode('latin-1')
+    return body
+
+
+def parse(body, content_type=CONTENT_TYPE):
+    return parse_multipart(BytesIO(body), content_type, len(body))
+
+
+def test_1_fields_and_file():
+    """TEST 1: Plain fields and a file part are parsed"""
+    csv_data = b'Key,Summary\r\nPROJ-1,First\r\nPROJ-2,Second\r\n'
+    form = parse(build_body([
+        ('form-data; name="title"', b'Bug report'),
+        ('form-data; name="file"; filename="issues.csv"', csv_data),
+    ]))
+
+    assert form.getvalue('title') == 'Bug report'
+    assert form['title'].filename is None
+    assert form['file'].filename == 'issues.csv'
+    assert form['file'].file.read() == csv_data
+
+
+def test_2_delimiter_split_across_reads():
+    """TEST 2: Boundaries split across small reads are still found"""
+    content = b'line one\r\n--not-a-boundary\r\n' * 50
+    body = build_body([
+        ('form-data; name="file"; filename="big.csv"', content),
+        ('form-data; name="note"', b'after the file'),
+    ])
+
+    for chunk_size in (1, 3, 7, len(BOUNDARY) + 2):
+        with patch.object(multipart_form, 'CHUNK_SIZE', chunk_size):
+            form = parse(body)
+        assert form['file'].file.read() == content, f"chunk size {chunk_size}"
+        assert form.getvalue('note') == 'after the file', f"chunk size {chunk_size}"
+
+
+def test_3_preamble_is_skipped():
+    """TEST 3: Text before the first boundary is ignored"""
+    form = parse(build_body([('form-data; name="title"', b'Hello')],
+                            preamble=b'This is a preamble.\r\nIgnore it.\r\n'))
+
+    assert form.getvalue('title') == 'Hello'
+    assert list(form) == ['title']
+
+
+def test_4_missing_closing_boundary():
+    """TEST 4: A body cut off before its closing boundary raises ValueError"""
+    body = build_body([('form-data; name="file"; filename="a.csv"', b'a,b\r\n1,2')],
+                      closing=False)
+    # Drop the CRLF that would start the next delimiter as well
+    body = body[:-2]
+
+    try:
+        parse(body)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected ValueError for a truncated body")
+
+
+def test_5_part_without_name_is_dropped():
+    """TEST 5: A part with no name parameter is skipped"""
+    form = parse(build_body([
+        ('form-data', b'anonymous'),
+        ('form-data; name="kept"', b'value'),
+    ]))
+
+    assert list(form) == ['kept']
+    assert form.getvalue('kept') == 'value'
+
+
+def test_6_filename_encodings():
+    """TEST 6: Quoted and RFC 2231 encoded filenames are decoded"""
+    form = parse(build_body([
+        ('form-data; name="quoted"; filename="my report; v2.csv"', b'x'),
+        ("form-data; name=\"encoded\"; filename*=UTF-8''r%C3%A9sum%C3%A9.csv", b'y'),
+    ]))
+
+    assert form['quoted'].filename == 'my report; v2.csv'
+    assert form['encoded'].filename == 'résumé.csv'
+
+
+def test_7_getvalue_default():
+    """TEST 7: getvalue returns the default for a missing field"""
+    form = parse(build_body([('form-data; name="title"', b'Hello')]))
+
+    assert form.getvalue('description') is None
+    assert form.getvalue('description', '') == ''
+    assert form.getvalue('include_logs', 'true') == 'true'
+
+
+def test_8_not_multipart():
+    """TEST 8: A non-multipart Content-Type raises ValueError"""
+    try:
+        parse(b'{}', 'application/json')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected ValueError for a JSON Content-Type")
+
+
+def make_upload_handler(body, content_type=CONTENT_TYPE):
+    """Mock handler carrying a request body the way do_POST leaves it"""
+    handler = Mock()
+    handler.rfile = BytesIO(body)
+    handler.headers = {'Content-Type': content_type}
+    handler.content_length = len(body)
+    return handler
+
+
+def assert_rejected_with_400(handler):
+    handler._send_error.assert_called_once()
+    status = handler._send_error.call_args[0][0]
+    assert status == 400, f"Expected 400, got {status}"
+    handler._send_json.assert_not_called()
+
+
+def test_9_csv_upload_malformed_body():
+    """TEST 9: CSV upload answers a malformed body with 400"""
+    import app
+
+    truncated = build_body([('form-data; name="file"; filename="a.csv"', b'a,b')],
+                           closing=False)[:-2]
+    for body, content_type in ((truncated, CONTENT_TYPE),
+                               (b'a,b\r\n1,2\r\n', 'text/csv')):
+        handler = make_upload_handler(body, content_type)
+        app.SyncHandler._handle_csv_upload(handler)
+        assert_rejected_with_400(handler)
+
+
+def test_10_feedback_submit_malformed_body():
+    """TEST 10: Feedback submission answers a malformed body with 400"""
+    import app
+
+    client = Mock()
+    truncated = build_body([('form-data; name="title"', b'Broken')], closing=False)[:-2]
+    with patch.object(app, 'github_feedback_client', client, create=True):
+        for body, content_type in ((truncated, CONTENT_TYPE),
+                                   (b'title=Broken', 'application/x-www-form-urlencoded')):
+            handler = make_upload_handler(body, content_type)
+            app.SyncHandler._handle_feedback_submit(handler)
+            assert_rejected_with_400(handler)
+
+    client.create_issue.assert_not_called()
+
+
+if __name__ == '__main__':
+    tests = [
+        test_1_fields_and_file,
+        test_2_delimiter_split_across_reads,
+        test_3_preamble_is_skipped,
+        test_4_missing_closing_boundary,
+        test_5_part_without_name_is_dropped,
+        test_6_filename_encodings,
+        test_7_getvalue_default,
+        test_8_not_multipart,
+        test_9_csv_upload_malformed_body,
+        test_10_feedback_submit_malformed_body,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            test_func()
+            passed += 1
+            print(f"PASSED: {test_func.__doc__}")
+        except Exception as e:
+            failed += 1
+            print(f"FAILED: {test_func.__doc__}: {e}")
+
+    print(f"\nResults: {passed} passed, {failed} failed")
+    sys.exit(0 if failed == 0 else 1)
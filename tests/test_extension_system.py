@@ -6,6 +6,8 @@ import sys
 import unittest
 import tempfile
 import shutil
+import threading
+from unittest.mock import Mock, patch
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -270,6 +272,123 @@ class TestDataStore(unittest.TestCase):
         self.assertEqual(len(logs), 1)
 
 
+class TestDataStoreTransaction(unittest.TestCase):
+    """Test DataStore.transaction() and the data import that uses it"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'test.db')
+        self.store = DataStore(self.db_path)
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+    
+    def run_data_import(self):
+        """Call the /api/data/import handler against self.store with a stub extension"""
+        import app
+        
+        ext = Mock()
+        ext.status.value = 'ready'
+        ext.extract_data.return_value = {
+            'success': True, 'count': 1, 'data': [{'key': 'TEST-1', 'summary': 'Test'}]
+        }
+        ext.transform_to_features.return_value = [{'key': 'FEAT-1', 'name': 'Feature 1'}]
+        ext.transform_to_dependencies.return_value = {'nodes': [], 'edges': []}
+        manager = Mock()
+        manager.get_extension.return_value = ext
+        
+        with patch.object(app, 'extension_manager', manager), \
+             patch.object(app, 'data_store', self.store):
+            return app.SyncHandler._handle_data_import(
+                Mock(), {'extension': 'jira', 'query': {'jql': 'project = TEST'}})
+    
+    def test_data_import_commits_once(self):
+        """Test a data import's saves share one connection and one commit"""
+        connect = self.store._connect
+        connections = []
+        
+        def counting_connect():
+            conn = Mock(wraps=connect())
+            connections.append(conn)
+            return conn
+        
+        with patch.object(self.store, '_connect', side_effect=counting_connect):
+            result = self.run_data_import()
+        
+        self.assertTrue(result['success'], result)
+        self.assertEqual(len(connections), 1)
+        self.assertEqual(connections[0].commit.call_count, 1)
+        
+        latest = self.store.get_latest_import('jira')
+        self.assertEqual(latest['id'], result['import_id'])
+        self.assertEqual(len(self.store.get_latest_features()), 1)
+        self.assertIsNotNone(self.store.get_latest_dependencies())
+        self.assertEqual(len(self.store.get_audit_log(days=1)), 1)
+    
+    def test_data_import_rolls_back_on_error(self):
+        """Test a failure partway through an import leaves no partial rows"""
+        with patch.object(self.store, 'log_action', side_effect=RuntimeError('disk full')):
+            result = self.run_data_import()
+        
+        self.assertFalse(result['success'])
+        self.assertIsNone(self.store.get_latest_import('jira'))
+        self.assertFalse(self.store.get_latest_features())
+        self.assertIsNone(self.store.get_latest_dependencies())
+    
+    def test_exception_rolls_back_every_save(self):
+        """Test an exception inside the block undoes all of its saves"""
+        with self.assertRaises(RuntimeError):
+            with self.store.transaction():
+                import_id = self.store.save_import('jira', [{'key': 'TEST-1'}])
+                self.store.save_features([{'key': 'FEAT-1'}], import_id)
+                raise RuntimeError('interrupted')
+        
+        self.assertIsNone(self.store.get_latest_import('jira'))
+        self.assertFalse(self.store.get_latest_features())
+    
+    def test_nested_transaction_reuses_connection(self):
+        """Test a nested transaction() joins the outer one instead of committing"""
+        with self.assertRaises(RuntimeError):
+            with self.store.transaction():
+                outer = self.store._local.conn
+                with self.store.transaction():
+                    self.assertIs(self.store._local.conn, outer)
+                    with self.store._get_connection() as conn:
+                        self.assertIs(conn, outer)
+                    self.store.save_import('jira', [{'key': 'TEST-1'}])
+                # Leaving the inner block must not have committed the save
+                raise RuntimeError('outer failed')
+        
+        self.assertIsNone(self.store.get_latest_import('jira'))
+        self.assertIsNone(getattr(self.store._local, 'conn', None))
+    
+    def test_other_thread_not_joined(self):
+        """Test another thread's connection stays outside this thread's transaction"""
+        seen = {}
+        
+        def read_from_other_thread(key):
+            with self.store._get_connection() as conn:
+                seen[key + '_conn'] = conn
+            seen[key] = self.store.get_latest_import('jira')
+        
+        with self.store.transaction():
+            outer = self.store._local.conn
+            self.store.save_import('jira', [{'key': 'TEST-1'}])
+            
+            thread = threading.Thread(target=read_from_other_thread, args=('during',))
+            thread.start()
+            thread.join()
+        
+        thread = threading.Thread(target=read_from_other_thread, args=('after',))
+        thread.start()
+        thread.join()
+        
+        self.assertIsNot(seen['during_conn'], outer)
+        # Uncommitted rows aren't visible to the other thread until the commit
+        self.assertIsNone(seen['during'])
+        self.assertEqual(seen['after']['data'], [{'key': 'TEST-1'}])
+
+
 class TestConfigManager(unittest.TestCase):
     """Test ConfigManager functionality"""
     
@@ -315,6 +434,30 @@ class TestConfigManager(unittest.TestCase):
         self.manager.remove_insight_rule('test_rule')
         rules = self.manager.get_insight_rules()
         self.assertEqual(len(rules), 0)
+    
+    def test_version_bumped_by_changes(self):
+        """Test every change bumps the version callers rebuild on"""
+        rule = {'name': 'test_rule', 'condition': 'status = blocked', 'severity': 'high'}
+        changes = [
+            lambda: self.manager.set('test.key', 'test_value', save=False),
+            lambda: self.manager.add_insight_rule(rule, save=False),
+            lambda: self.manager.remove_insight_rule('test_rule', save=False),
+            lambda: self.manager.import_config(
+                'insights:\n  rules:\n  - name: imported_rule\n', save=False),
+        ]
+        
+        for change in changes:
+            before = self.manager.version
+            self.assertTrue(change())
+            self.assertGreater(self.manager.version, before)
+        
+        self.assertEqual(self.manager.get_insight_rules(), [{'name': 'imported_rule'}])
+    
+    def test_version_unchanged_by_failed_import(self):
+        """Test an import that isn't a mapping leaves config and version alone"""
+        before = self.manager.version
+        self.assertFalse(self.manager.import_config('- just\n- a list\n', save=False))
+        self.assertEqual(self.manager.version, before)
 
 
 if __name__ == '__main__':
@@ -23,6 +23,9 @@ class VersionChecker:
         self.cache = None
         self.cache_time = None
         self.cache_duration = timedelta(hours=1)
+        # limit -> (cache_time, etag, releases) for list_recent_releases
+        self.releases_cache = {}
+        self.releases_cache_duration = timedelta(minutes=5)
         self.logger = logging.getLogger(__name__)
         
         # Get current executable path
@@ -201,6 +204,11 @@ class VersionChecker:
         Returns:
             List of release info dictionaries
         """
+        cached = self.releases_cache.get(limit)
+        if cached and datetime.now() - cached[0] < self.releases_cache_duration:
+            self.logger.debug("Using cached release list")
+            return cached[2]
+        
         try:
             url = f"https://api.github.com/repos/{self.owner}/{self.repo}/releases?per_page={limit}"
             
@@ -212,8 +220,16 @@ class VersionChecker:
             if self.token:
                 headers['Authorization'] = f'token {self.token}'
             
+            # Revalidate an expired list: a 304 doesn't count against the rate limit
+            if cached and cached[1]:
+                headers['If-None-Match'] = cached[1]
+            
             response = requests.get(url, headers=headers, timeout=10)
             
+            if response.status_code == 304 and cached:
+                self.releases_cache[limit] = (datetime.now(), cached[1], cached[2])
+                return cached[2]
+            
             if response.status_code != 200:
                 return {'error': f'GitHub API returned status {response.status_code}'}
             
@@ -243,6 +259,7 @@ class VersionChecker:
                     'is_current': version_str == current_str
                 })
             
+            self.releases_cache[limit] = (datetime.now(), response.headers.get('ETag'), result)
             return result
             
         except Exception as e:
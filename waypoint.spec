@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('config.yaml', '.'), ('modern-ui.html', '.'), ('assets', 'assets')],
-    hiddenimports=['yaml', 'schedule', 'github', 'packaging', 'requests', 'urllib3', 'extensions', 'playwright'],
+    hiddenimports=['yaml', 'yaml._yaml', 'schedule', 'github', 'packaging', 'requests', 'urllib3', 'extensions', 'playwright'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
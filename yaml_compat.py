@@ -0,0 +1,11 @@
+"""
+YAML Loader/Dumper Selection
+The safe loader and dumper every module uses for config.yaml, picked once here
+"""
+try:
+    # LibYAML-backed safe loader/dumper; several times faster on config.yaml
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+__all__ = ['YamlLoader', 'YamlDumper']